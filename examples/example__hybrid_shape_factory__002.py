@@ -44,7 +44,8 @@ part = document.part
 file = r'tests\Sample_Point_CSV_File1_small.csv'
 
 # create the points.
-create_points(part, file, units='mm', geometry_set_name='Points_Construction')
+count = create_points(part, file, units='mm', geometry_set_name='Points_Construction')
+print(f'Added {count} points.')
 
 # if you can't see the points hide your origin planes and refram window.
 
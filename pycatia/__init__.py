@@ -18,8 +18,7 @@
 
 import os
 
-from pycatia.base_interfaces.base_application import catia_application as catia
-from pycatia.base_interfaces.context import CATIADocHandler
+from pycatia.base_interfaces.lazy_loader import lazy_loader
 from .version import version
 
 __author__ = 'Paul Bourne'
@@ -30,3 +29,11 @@ __version__ = version
 __url__ = "https://github.com/evereux/pycatia"
 
 name = __name__
+
+__all__ = ['catia', 'CATIADocHandler', 'version']
+
+# catia, CATIADocHandler and the interface packages are imported on first use.
+__getattr__, __dir__ = lazy_loader(__name__, __path__, {
+    'catia': ('pycatia.base_interfaces.base_application', 'catia_application'),
+    'CATIADocHandler': ('pycatia.base_interfaces.context', 'CATIADocHandler'),
+})
@@ -0,0 +1,273 @@
+#! /usr/bin/python3.9
+"""
+
+    Use pycatia from asyncio code.
+
+    COM objects belong to the apartment of the thread that created them and pycatia calls block until CATIA
+    answers, so pycatia can't be called directly from a coroutine. An :class:`AsyncSession` owns one CATIA session
+    and runs all its calls on a single dedicated thread initialised as a COM single threaded apartment. Coroutines
+    await the calls without blocking the event loop.
+
+    The pycatia objects of the session are returned wrapped in an :class:`AsyncProxy`. Properties are awaited and
+    methods are called and awaited, the results being wrapped in turn.
+
+    :Example - Update and save a part from a coroutine:
+
+        >>> from pycatia.base_interfaces.aio import AsyncSession
+        >>> async def update_part(file_name):
+        >>>     async with AsyncSession() as session:
+        >>>         documents = await session.application.documents
+        >>>         document = await documents.open(file_name)
+        >>>         part = await document.part
+        >>>         await part.update()
+        >>>         await document.save()
+        >>>         await document.close()
+
+    Each awaited property or method is one hop to the COM thread. Use :meth:`AsyncProxy.in_thread` or
+    :meth:`AsyncSession.run` to run many calls in one hop.
+
+    A call that has not started when its task is cancelled is skipped. A call already running in CATIA can't be
+    interrupted, it completes and its result is discarded.
+
+    At most max_pending calls are queued for the COM thread. Further calls wait, without blocking the event loop,
+    until the queue has room.
+
+    The COM thread is initialised by :func:`com_apartment`. Objects that aren't COM objects, such as those of a
+    fake backend, don't need it and pythoncom isn't required when the session is given another apartment, eg
+    AsyncSession(backend, apartment=contextlib.nullcontext).
+
+"""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable
+from typing import ContextManager
+
+from pycatia.base_interfaces.base_application import catia_application
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+
+def _unwrap(value):
+    if isinstance(value, AsyncProxy):
+        return value._target
+    if isinstance(value, (tuple, list)):
+        return type(value)(_unwrap(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _unwrap(v) for k, v in value.items()}
+
+    return value
+
+
+@contextlib.contextmanager
+def com_apartment():
+    """
+    Initialise the calling thread as a COM single threaded apartment for the duration of the context.
+
+    :return: context manager
+    """
+
+    from pythoncom import CoInitialize
+    from pythoncom import CoUninitialize
+
+    CoInitialize()
+    try:
+        yield
+    finally:
+        CoUninitialize()
+
+
+def _run_com_thread(calls: queue.Queue, apartment: Callable[[], ContextManager], ready: Future) -> None:
+    try:
+        context = apartment()
+        context.__enter__()
+    except BaseException as e:
+        # the session waits for the thread to start, so a failure is passed back rather than ending the thread.
+        ready.set_exception(e)
+        return
+    ready.set_result(None)
+
+    try:
+        while True:
+            call = calls.get()
+            if call is None:
+                break
+            future, function, args, kwargs = call
+            # the call was cancelled while queued.
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+    finally:
+        context.__exit__(None, None, None)
+
+
+class AsyncProxy:
+    """
+    Wraps a pycatia object of an :class:`AsyncSession`. Attributes are read on the COM thread of the session.
+
+    * proxy.name is awaited to get the property.
+    * proxy.method(\\*args) is awaited to call the method.
+
+    AsyncProxy arguments are unwrapped before the call and pycatia objects returned are wrapped.
+    """
+
+    __slots__ = ('_session', '_target')
+
+    def __init__(self, session: 'AsyncSession', target):
+        """
+        :param AsyncSession session:
+        :param target: the pycatia object.
+        """
+
+        self._session = session
+        self._target = target
+
+    def __getattr__(self, name):
+        attribute = inspect.getattr_static(type(self._target), name, None)
+        if attribute is None or isinstance(attribute, property):
+            return self._session.run(getattr, self._target, name)
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs):
+            return await self._session.run(lambda *args_, **kwargs_: getattr(self._target, name)(*args_, **kwargs_),
+                                           *args, **kwargs)
+
+        return method
+
+    async def set_property(self, name: str, value) -> None:
+        """
+        Set a property of the pycatia object.
+
+        :param str name: eg 'name'
+        :param value:
+        :return: None
+        """
+
+        await self._session.run(setattr, self._target, name, value)
+
+    async def in_thread(self, function: Callable, *args, **kwargs):
+        """
+        Run function(pycatia object, \\*args, \\*\\*kwargs) on the COM thread. All the calls made by function
+        take one hop.
+
+        :param function:
+        :return: the return value of function.
+        """
+
+        return await self._session.run(function, self._target, *args, **kwargs)
+
+    def __repr__(self):
+        return f'AsyncProxy({self._target!r})'
+
+
+class AsyncSession:
+    """
+    A CATIA session whose calls run on a dedicated COM thread.
+
+    :param backend: (optional) the backend creating the session. See :mod:`~pycatia.base_interfaces.com_backend`.
+        Defaults to connecting to a running CATIA session.
+    :param int max_pending: (optional) the number of calls that can be queued for the COM thread.
+    :param apartment: (optional) a callable returning the context manager that initialises the COM thread.
+        Defaults to :func:`com_apartment`.
+    """
+
+    def __init__(self, backend=None, max_pending: int = 64, apartment: Callable[[], ContextManager] = com_apartment):
+        self.backend = backend
+        self.max_pending = max_pending
+        self.apartment = apartment
+        self.application = None
+        self._calls = queue.Queue()
+        self._thread = None
+        self._slots = None
+
+    async def start(self) -> AsyncProxy:
+        """
+        Start the COM thread and create the application on it.
+
+        :return: the application.
+        :rtype: AsyncProxy
+        """
+
+        if self._thread is not None:
+            raise CATIAApplicationException('The session has already been started.')
+
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._calls = queue.Queue()
+        ready = Future()
+        self._thread = threading.Thread(target=_run_com_thread, args=(self._calls, self.apartment, ready),
+                                        name='pycatia-com', daemon=True)
+        self._thread.start()
+        try:
+            await asyncio.wrap_future(ready)
+            self.application = await self.run(catia_application, self.backend)
+        except BaseException:
+            await self.close()
+            raise
+
+        return self.application
+
+    async def run(self, function: Callable, *args, **kwargs):
+        """
+        Run function(\\*args, \\*\\*kwargs) on the COM thread. Use this to run many pycatia calls in one hop.
+        AsyncProxy arguments are unwrapped.
+
+        :param function:
+        :return: the return value of function. pycatia objects are wrapped in an :class:`AsyncProxy`.
+        """
+
+        if self._thread is None:
+            raise CATIAApplicationException('The session has not been started.')
+
+        async with self._slots:
+            future = Future()
+            self._calls.put((future, function, _unwrap(args), _unwrap(kwargs)))
+            return self.wrap(await asyncio.wrap_future(future))
+
+    def wrap(self, value):
+        """
+        Wrap pycatia objects, also within a tuple or list, in an :class:`AsyncProxy`.
+
+        :param value:
+        :return: value
+        """
+
+        if isinstance(value, (tuple, list)):
+            return type(value)(self.wrap(v) for v in value)
+        # checked without touching a dispatch object, which belongs to the COM thread.
+        if 'com_object' in getattr(value, '__dict__', ()):
+            return AsyncProxy(self, value)
+
+        return value
+
+    async def close(self) -> None:
+        """
+        Stop the COM thread once the queued calls have run.
+
+        :return: None
+        """
+
+        if self._thread is None:
+            return
+
+        self._calls.put(None)
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+        self._thread = None
+        self.application = None
+
+    async def __aenter__(self):
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __repr__(self):
+        return f'AsyncSession(backend={self.backend!r}, max_pending={self.max_pending})'
@@ -1,9 +1,19 @@
 #! /usr/bin/python3.9
 
-from win32com.client import Dispatch
-
+from pycatia.base_interfaces.com_backend import get_default_backend
 from pycatia.in_interfaces.application import Application
 
 
-def catia_application() -> Application:
-    return Application(Dispatch('CATIA.Application'))
+def catia_application(backend=None) -> Application:
+    """
+    Create the Application object.
+
+    :param backend: (optional) the backend creating the CATIA.Application dispatch object. See
+        :mod:`~pycatia.base_interfaces.com_backend`. Defaults to connecting to a running CATIA session.
+    :return: Application
+    """
+
+    if backend is None:
+        backend = get_default_backend()
+
+    return Application(backend.dispatch('CATIA.Application'))
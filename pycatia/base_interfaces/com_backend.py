@@ -0,0 +1,371 @@
+#! /usr/bin/python3.9
+"""
+
+    Pluggable backends used by :func:`~pycatia.base_interfaces.base_application.catia_application` to create the
+    CATIA.Application dispatch object.
+
+    * :class:`DispatchBackend` connects to a running CATIA session (the default).
+    * :class:`RecordingBackend` connects to a running CATIA session and records all the COM traffic to a file.
+    * :class:`ReplayBackend` replays a recorded file against an in-process fake. CATIA is not required.
+
+    :Example - Record a session:
+
+        >>> from pycatia import catia
+        >>> from pycatia.base_interfaces.com_backend import RecordingBackend
+        >>> with RecordingBackend('session.json') as backend:
+        >>>     caa = catia(backend)
+        >>>     names = caa.active_document.product.products.get_item_names()
+
+    :Example - Replay the session with 2 ms latency per round trip:
+
+        >>> from pycatia import catia
+        >>> from pycatia.base_interfaces.com_backend import ReplayBackend
+        >>> caa = catia(ReplayBackend('session.json', latency=0.002))
+        >>> names = caa.active_document.product.products.get_item_names()
+
+    The replay must make the same sequence of COM calls as the recording. A
+    :class:`~pycatia.exception_handling.exceptions.COMReplayException` is raised when it diverges.
+
+"""
+
+import base64
+import datetime
+import json
+import time
+from types import MethodType
+
+from pycatia.base_interfaces.com_profiler import COMObjectProxy
+from pycatia.exception_handling.exceptions import COMReplayException
+from pycatia.exception_handling.exceptions import com_error
+
+_default_backend = None
+
+
+def encode_value(value, reference):
+    """
+    Encode a COM argument or return value so it can be written to JSON.
+
+    :param value:
+    :param reference: callable returning the handle of a dispatch object.
+    :return: JSON serializable value.
+    """
+
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (tuple, list)):
+        encoded = [encode_value(v, reference) for v in value]
+        # COM returns tuples. Lists are only passed as arguments.
+        return encoded if isinstance(value, tuple) else {'$list': encoded}
+    if isinstance(value, COMObjectProxy):
+        value = value._com_object
+    if hasattr(value, '_oleobj_'):
+        return {'$ref': reference(value)}
+    if isinstance(value, datetime.datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, (bytes, memoryview)):
+        return {'$bytes': base64.b64encode(bytes(value)).decode('ascii')}
+
+    return {'$repr': repr(value)}
+
+
+def get_default_backend():
+    """
+    The backend used by :func:`~pycatia.base_interfaces.base_application.catia_application` when no backend is
+    supplied.
+
+    :return: backend
+    """
+
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = DispatchBackend()
+
+    return _default_backend
+
+
+def set_default_backend(backend) -> None:
+    """
+    Set the backend used by :func:`~pycatia.base_interfaces.base_application.catia_application` when no backend
+    is supplied. This allows code that calls `catia()` itself, such as
+    :class:`~pycatia.base_interfaces.context.CATIADocHandler`, to run against a recording or replay.
+
+    :param backend: the backend or None to reset to :class:`DispatchBackend`.
+    :return: None
+    """
+
+    global _default_backend
+    _default_backend = backend
+
+
+class DispatchBackend:
+    """
+    Creates dispatch objects using win32com.
+
+    :param bool new_session: (optional) start a new CATIA session rather than connecting to the running one.
+        Used to give each worker process its own session.
+    """
+
+    def __init__(self, new_session: bool = False):
+        self.new_session = new_session
+
+    def dispatch(self, prog_id: str):
+        """
+        :param str prog_id: eg 'CATIA.Application'
+        :return: dispatch object
+        """
+
+        if self.new_session:
+            from win32com.client import DispatchEx
+            return DispatchEx(prog_id)
+
+        from win32com.client import Dispatch
+        return Dispatch(prog_id)
+
+    def __repr__(self):
+        return f'DispatchBackend(new_session={self.new_session})'
+
+
+class RecordingBackend:
+    """
+    Creates dispatch objects using backend and records every property get, property set and method call made
+    through them. The recording is written to file_name by :meth:`save` or on exit when used as a context manager.
+
+    :param str or Path file_name:
+    :param backend: (optional) the backend to record. Defaults to :class:`DispatchBackend`.
+    """
+
+    def __init__(self, file_name, backend=None):
+        self.file_name = file_name
+        self.backend = backend or DispatchBackend()
+        self.events = []
+        self._handles = {}
+        # references to the recorded objects are kept so their ids can't be reused.
+        self._objects = []
+
+    def dispatch(self, prog_id: str):
+        """
+        :param str prog_id: eg 'CATIA.Application'
+        :return: COMObjectProxy
+        """
+
+        com_object = self.backend.dispatch(prog_id)
+        self.events.append({'op': 'dispatch', 'name': prog_id, 'result': self._encode(com_object)})
+
+        return COMObjectProxy(com_object, self)
+
+    def get(self, com_object, name):
+        event = {'op': 'get', 'obj': self._reference(com_object), 'name': name}
+        try:
+            value = getattr(com_object, name)
+        except com_error as e:
+            event['error'] = self._encode(e.args)
+            self.events.append(event)
+            raise
+        # the call of a method is recorded, not fetching it.
+        if not isinstance(value, MethodType):
+            event['result'] = self._encode(value)
+            self.events.append(event)
+
+        return value
+
+    def set(self, com_object, name, value):
+        event = {'op': 'set', 'obj': self._reference(com_object), 'name': name, 'args': [self._encode(value)]}
+        self.events.append(event)
+        try:
+            setattr(com_object, name, value)
+        except com_error as e:
+            event['error'] = self._encode(e.args)
+            raise
+
+    def call(self, com_object, name, method, args):
+        event = {'op': 'call', 'obj': self._reference(com_object), 'name': name, 'args': self._encode(list(args))}
+        self.events.append(event)
+        try:
+            value = method(*args)
+        except com_error as e:
+            event['error'] = self._encode(e.args)
+            raise
+        event['result'] = self._encode(value)
+
+        return value
+
+    def save(self) -> None:
+        """
+        Write the recording to file_name.
+
+        :return: None
+        """
+
+        with open(self.file_name, 'w') as file:
+            json.dump({'version': 1, 'events': self.events}, file)
+
+    def _encode(self, value):
+        return encode_value(value, self._reference)
+
+    def _reference(self, com_object):
+        handle = self._handles.get(id(com_object))
+        if handle is None:
+            handle = self._handles[id(com_object)] = len(self._objects)
+            self._objects.append(com_object)
+
+        return handle
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.save()
+
+    def __repr__(self):
+        return f'RecordingBackend(file_name="{self.file_name}")'
+
+
+class ReplayDispatch:
+    """
+    Stands in for a recorded dispatch object during a replay.
+    """
+
+    __slots__ = ('_handle', '_backend')
+
+    # marks this as a dispatch object so it is proxied by the COMProfiler.
+    _oleobj_ = None
+
+    def __init__(self, handle, backend):
+        object.__setattr__(self, '_handle', handle)
+        object.__setattr__(self, '_backend', backend)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        return self._backend.get(self, name)
+
+    def __setattr__(self, name, value):
+        self._backend.set(self, name, value)
+
+    def __call__(self, *args):
+        return self._backend.call(self, '__call__', args)
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayDispatch) and self._handle == other._handle
+
+    def __hash__(self):
+        return hash(self._handle)
+
+    def __repr__(self):
+        return f'ReplayDispatch(handle={self._handle})'
+
+
+class ReplayBackend:
+    """
+    Replays a file written by :class:`RecordingBackend`. Recorded return values are returned, recorded
+    com_errors are raised and dispatch objects are replaced by :class:`ReplayDispatch` objects.
+
+    :param str or Path file_name:
+    :param float or callable latency: (optional) seconds to wait on each round trip to simulate an
+        out-of-process COM call. A callable is passed the recorded event and must return the seconds to wait.
+    :param bool strict: (optional) check the object, property name and arguments of each round trip match the
+        recording. Otherwise only the order of the round trips is used.
+    """
+
+    def __init__(self, file_name, latency=0.0, strict=True):
+        self.file_name = file_name
+        self.latency = latency
+        self.strict = strict
+        with open(file_name) as file:
+            self.events = json.load(file)['events']
+        self.position = 0
+        self._methods = {(event['obj'], event['name']) for event in self.events if event['op'] == 'call'}
+
+    def rewind(self) -> None:
+        """
+        Restart the replay from the first recorded event.
+
+        :return: None
+        """
+
+        self.position = 0
+
+    @property
+    def finished(self) -> bool:
+        """
+        :return: True if all the recorded events have been replayed.
+        :rtype: bool
+        """
+
+        return self.position >= len(self.events)
+
+    def dispatch(self, prog_id: str):
+        """
+        :param str prog_id: eg 'CATIA.Application'
+        :return: ReplayDispatch
+        """
+
+        return self._replay(self._next('dispatch', None, prog_id, None))
+
+    def get(self, dispatch, name):
+        # fetching a method isn't recorded, only its call.
+        if (dispatch._handle, name) in self._methods:
+            return MethodType(lambda dispatch_, *args: self.call(dispatch_, name, args), dispatch)
+
+        return self._replay(self._next('get', dispatch._handle, name, None))
+
+    def set(self, dispatch, name, value):
+        self._replay(self._next('set', dispatch._handle, name, [self._encode(value)]))
+
+    def call(self, dispatch, name, args):
+        return self._replay(self._next('call', dispatch._handle, name, self._encode(list(args))))
+
+    def _peek(self):
+        if self.finished:
+            return None
+
+        return self.events[self.position]
+
+    def _next(self, op, handle, name, args):
+        event = self._peek()
+        if event is None:
+            raise COMReplayException(f'Replay finished. Unexpected {op} "{name}".')
+        if self.strict:
+            recorded = (event['op'], event.get('obj'), event['name'], event.get('args'))
+            if recorded != (op, handle, name, args):
+                raise COMReplayException(f'Replay diverged at event {self.position}. Expected {recorded} '
+                                         f'but got {(op, handle, name, args)}.')
+        self.position += 1
+
+        return event
+
+    def _replay(self, event):
+        latency = self.latency(event) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        if 'error' in event:
+            raise com_error(*self._decode(event['error']))
+
+        return self._decode(event.get('result'))
+
+    def _encode(self, value):
+        return encode_value(value, lambda dispatch: dispatch._handle)
+
+    def _decode(self, value):
+        if isinstance(value, list):
+            return tuple(self._decode(v) for v in value)
+        if isinstance(value, dict):
+            if '$ref' in value:
+                return ReplayDispatch(value['$ref'], self)
+            if '$list' in value:
+                return [self._decode(v) for v in value['$list']]
+            if '$datetime' in value:
+                return datetime.datetime.fromisoformat(value['$datetime'])
+            if '$bytes' in value:
+                return base64.b64decode(value['$bytes'])
+            if '$repr' in value:
+                return value['$repr']
+
+        return value
+
+    def __repr__(self):
+        return f'ReplayBackend(file_name="{self.file_name}", position={self.position})'
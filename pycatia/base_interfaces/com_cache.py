@@ -0,0 +1,146 @@
+#! /usr/bin/python3.9
+"""
+
+    Keys identifying COM objects and the cache of search results.
+
+    :func:`com_object_key` is used by the caches keyed on CATIA objects, see
+    :mod:`~pycatia.product_structure_interfaces.product_identity` and :mod:`~pycatia.in_interfaces.search_query`.
+
+    :data:`search_cache` is cleared by the modules changing documents, so it is kept here, independent of the
+    interface packages.
+
+"""
+
+from pycatia.base_interfaces.com_profiler import unwrap_com_value
+
+
+class COMObjectKey:
+    """
+    The identity of a COM object, see :func:`com_object_key`.
+
+    The key holds the IUnknown interface of the object so the object, and the address identifying it, stay alive
+    as long as the key is used.
+    """
+
+    __slots__ = ('unknown',)
+
+    def __init__(self, unknown):
+        """
+        :param unknown: the PyIUnknown of the object.
+        """
+
+        self.unknown = unknown
+
+    def __eq__(self, other):
+        # PyIUnknown objects compare and hash by the address of the interface they wrap.
+        return isinstance(other, COMObjectKey) and self.unknown == other.unknown
+
+    def __hash__(self):
+        return hash(self.unknown)
+
+    def __repr__(self):
+        return f'COMObjectKey({self.unknown!r})'
+
+
+def com_object_key(com_object):
+    """
+    A hashable key that is equal for all the dispatch objects of the same CATIA object.
+
+    COM guarantees that querying any interface of an object for IUnknown returns the same pointer, so the key
+    compares the IUnknown interfaces. The query is answered by the local COM proxy without a round trip to CATIA.
+
+    :param com_object:
+    :return: key
+    """
+
+    com_object = unwrap_com_value(com_object)
+    oleobj = getattr(com_object, '_oleobj_', None)
+    if oleobj is None:
+        return com_object
+
+    from pythoncom import IID_IUnknown
+
+    return COMObjectKey(oleobj.QueryInterface(IID_IUnknown))
+
+
+class SearchCache:
+    """
+    The cache of search results. Use the module instance :data:`search_cache`. See
+    :func:`~pycatia.in_interfaces.search_query.search`.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._depth = 0
+
+    def enable(self) -> None:
+        """
+        :return: None
+        """
+
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Disable and clear the cache.
+
+        :return: None
+        """
+
+        self.enabled = False
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        :return: None
+        """
+
+        self._results = {}
+
+    def get(self, key: tuple) -> dict:
+        """
+        :param tuple key:
+        :return: the cached results or None.
+        :rtype: dict
+        """
+
+        results = self._results.get(key)
+        if results is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return results
+
+    def set(self, key: tuple, results: dict) -> None:
+        """
+        :param tuple key:
+        :param dict results:
+        :return: None
+        """
+
+        self._results[key] = results
+
+    def __len__(self):
+        return len(self._results)
+
+    def __enter__(self):
+        if self._depth == 0:
+            self.enable()
+        self._depth += 1
+
+        return self
+
+    def __exit__(self, *args):
+        self._depth -= 1
+        if self._depth == 0:
+            self.disable()
+
+    def __repr__(self):
+        return f'SearchCache(enabled={self.enabled}, results={len(self._results)})'
+
+
+search_cache = SearchCache()
@@ -0,0 +1,426 @@
+#! /usr/bin/python3.9
+"""
+
+    Instrumentation of the COM round trips made through the `com_object` of pycatia objects.
+
+    Each round trip (property get, property set or method call) is timed and attributed to the pycatia method
+    that made it, for example `Product.file_name` or `Collection.get_item_by_name`.
+
+    :Example - Profile a tree walk:
+
+        >>> from pycatia import catia
+        >>> from pycatia.base_interfaces.com_profiler import COMProfiler
+        >>> caa = catia()
+        >>> with COMProfiler(caa) as profiler:
+        >>>     product = caa.active_document.product
+        >>>     names = product.products.get_item_names()
+        >>> print(profiler.report())
+        >>> profiler.dump('profile.json')
+
+"""
+
+import json
+import math
+import os
+import sys
+import time
+from types import MethodType
+
+_plain_types = (str, int, float, bool, bytes, complex)
+_package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_this_file = os.path.abspath(__file__)
+_comprehensions = ('<listcomp>', '<dictcomp>', '<setcomp>', '<genexpr>')
+
+
+def wrap_com_value(value, handler):
+    """
+    Wrap any COM dispatch objects found in value with a :class:`COMObjectProxy` using handler.
+
+    :param value: value returned by a COM property or method.
+    :param handler: the handler of the new proxies.
+    :return: value with dispatch objects proxied.
+    """
+
+    if value is None or isinstance(value, _plain_types) or isinstance(value, COMObjectProxy):
+        return value
+    if isinstance(value, tuple):
+        return tuple(wrap_com_value(v, handler) for v in value)
+    if hasattr(value, '_oleobj_'):
+        return COMObjectProxy(value, handler)
+
+    return value
+
+
+def unwrap_com_value(value):
+    """
+    Return value with any :class:`COMObjectProxy` replaced by the dispatch object it wraps so it can be passed
+    back to COM.
+
+    :param value:
+    :return: value
+    """
+
+    if isinstance(value, COMObjectProxy):
+        return value._com_object
+    if isinstance(value, (list, tuple)):
+        return type(value)(unwrap_com_value(v) for v in value)
+
+    return value
+
+
+class COMObjectProxy:
+    """
+    Transparent wrapper around a COM dispatch object.
+
+    Property gets, property sets and method calls are performed by the handler so that they can be measured.
+    Dispatch objects returned by the wrapped object are wrapped with the same handler so that every object
+    derived from a proxied object is proxied too.
+
+    The handler must provide the methods `get(com_object, name)`, `set(com_object, name, value)` and
+    `call(com_object, name, method, args)`.
+    """
+
+    __slots__ = ('_com_object', '_handler')
+
+    def __init__(self, com_object, handler):
+        object.__setattr__(self, '_com_object', com_object)
+        object.__setattr__(self, '_handler', handler)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        value = self._handler.get(self._com_object, name)
+        if isinstance(value, MethodType):
+            return _COMMethodProxy(self._com_object, name, value, self._handler)
+
+        return wrap_com_value(value, self._handler)
+
+    def __setattr__(self, name, value):
+        self._handler.set(self._com_object, name, unwrap_com_value(value))
+
+    def __call__(self, *args):
+        value = self._handler.call(self._com_object, '__call__', self._com_object, unwrap_com_value(args))
+        return wrap_com_value(value, self._handler)
+
+    def __iter__(self):
+        for item in self._com_object:
+            yield wrap_com_value(item, self._handler)
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        return self._com_object == unwrap_com_value(other)
+
+    def __hash__(self):
+        return hash(self._com_object)
+
+    def __repr__(self):
+        return f'COMObjectProxy({self._com_object!r})'
+
+
+class _COMMethodProxy:
+    """
+    A bound COM method whose calls are performed by the handler of the proxy it was retrieved from.
+    """
+
+    __slots__ = ('_com_object', '_name', '_method', '_handler')
+
+    def __init__(self, com_object, name, method, handler):
+        self._com_object = com_object
+        self._name = name
+        self._method = method
+        self._handler = handler
+
+    def __call__(self, *args):
+        value = self._handler.call(self._com_object, self._name, self._method, unwrap_com_value(args))
+        return wrap_com_value(value, self._handler)
+
+    def __repr__(self):
+        return f'_COMMethodProxy(name="{self._name}")'
+
+
+def percentile(values: list, pct: float) -> float:
+    """
+    Nearest-rank percentile of the sorted list values.
+
+    :param list values: sorted values.
+    :param float pct: percentile 0 - 100.
+    :return: float
+    """
+
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+
+    return values[rank - 1]
+
+
+class _MethodStats:
+    __slots__ = ('calls', 'com_calls', 'latencies', 'members', 'last_frame')
+
+    def __init__(self):
+        self.calls = 0
+        self.com_calls = 0
+        self.latencies = []
+        self.members = {}
+        self.last_frame = None
+
+
+class COMProfiler:
+    """
+    A context manager that counts and times the COM round trips made by pycatia objects.
+
+    The pycatia objects passed to the profiler have their `com_object` (and any attribute aliasing it) wrapped
+    by a :class:`COMObjectProxy` on entry. Any pycatia object derived from them within the context is also
+    profiled. The original dispatch objects are restored on exit. Objects created within the context keep their
+    proxy but it no longer records once the profiler has exited.
+
+    Round trips are attributed to the innermost pycatia function on the call stack. Round trips made directly
+    on a `com_object` from user code are attributed to `<user>`.
+
+    :param pycatia_objects: pycatia objects to profile, typically the Application returned by
+        :func:`~pycatia.base_interfaces.base_application.catia_application`.
+    """
+
+    def __init__(self, *pycatia_objects):
+        self.pycatia_objects = pycatia_objects
+        self.active = False
+        self.elapsed = 0.0
+        self._stats = {}
+        self._qualnames = {}
+        self._restore = []
+        self._start = None
+
+    def __enter__(self):
+        self.attach(*self.pycatia_objects)
+        self.active = True
+        self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed += time.perf_counter() - self._start
+        self.active = False
+        for obj, name, value in reversed(self._restore):
+            setattr(obj, name, value)
+        self._restore = []
+        for stats in self._stats.values():
+            stats.last_frame = None
+
+    def attach(self, *pycatia_objects):
+        """
+        Wrap the dispatch object of each pycatia object so that its round trips are profiled. Must be called
+        within the context.
+
+        :param pycatia_objects:
+        :return: None
+        """
+
+        for obj in pycatia_objects:
+            original = obj.com_object
+            proxy = COMObjectProxy(unwrap_com_value(original), self)
+            for name, value in list(vars(obj).items()):
+                if value is original:
+                    self._restore.append((obj, name, value))
+                    setattr(obj, name, proxy)
+
+    def get(self, com_object, name):
+        """
+        Get the property name of com_object, recording the round trip.
+
+        :param com_object:
+        :param str name:
+        :return: value
+        """
+
+        if not self.active:
+            return getattr(com_object, name)
+
+        start = time.perf_counter()
+        try:
+            value = getattr(com_object, name)
+        except Exception:
+            self._record(name, time.perf_counter() - start)
+            raise
+        # fetching a method from the dispatch object isn't a round trip. The call is recorded instead.
+        if not isinstance(value, MethodType):
+            self._record(name, time.perf_counter() - start)
+
+        return value
+
+    def set(self, com_object, name, value):
+        """
+        Set the property name of com_object, recording the round trip.
+
+        :param com_object:
+        :param str name:
+        :param value:
+        :return: None
+        """
+
+        if not self.active:
+            return setattr(com_object, name, value)
+
+        start = time.perf_counter()
+        try:
+            setattr(com_object, name, value)
+        finally:
+            self._record(f'{name}=', time.perf_counter() - start)
+
+    def call(self, com_object, name, method, args):
+        """
+        Call the method name of com_object, recording the round trip.
+
+        :param com_object:
+        :param str name:
+        :param method: the bound method.
+        :param tuple args:
+        :return: value
+        """
+
+        if not self.active:
+            return method(*args)
+
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._record(f'{name}()', time.perf_counter() - start)
+
+    def _caller(self):
+        """
+        Find the innermost frame on the stack that belongs to pycatia and isn't this module. Comprehensions are
+        attributed to the function containing them.
+
+        :return: tuple(str, frame)
+        """
+
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename.startswith(_package_root) and code.co_filename != _this_file and \
+                    code.co_name not in _comprehensions:
+                return self._qualname(frame), frame
+            frame = frame.f_back
+
+        return '<user>', None
+
+    def _qualname(self, frame):
+        code = frame.f_code
+        qualname = self._qualnames.get(code)
+        if qualname is None:
+            qualname = getattr(code, 'co_qualname', None)
+            if qualname is None:
+                # python < 3.11 has no co_qualname so the class of the instance is used instead.
+                qualname = code.co_name
+                if code.co_varnames and code.co_varnames[0] == 'self':
+                    qualname = f'{type(frame.f_locals["self"]).__name__}.{code.co_name}'
+            self._qualnames[code] = qualname
+
+        return qualname
+
+    def _record(self, member, elapsed):
+        key, frame = self._caller()
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _MethodStats()
+        # a reference to the last frame is held so a new invocation can't reuse its id.
+        if frame is None or stats.last_frame is not frame:
+            stats.calls += 1
+            stats.last_frame = frame
+        stats.com_calls += 1
+        stats.latencies.append(elapsed)
+        stats.members[member] = stats.members.get(member, 0) + 1
+
+    def results(self) -> dict:
+        """
+        The profile results for each pycatia method, sorted by cumulative COM time.
+
+        Times are in seconds.
+
+        :return: dict
+        """
+
+        results = {}
+        for key, stats in self._stats.items():
+            latencies = sorted(stats.latencies)
+            cumulative = sum(latencies)
+            results[key] = {
+                'calls': stats.calls,
+                'com_calls': stats.com_calls,
+                'com_calls_per_call': stats.com_calls / stats.calls,
+                'cumulative': cumulative,
+                'p50': percentile(latencies, 50),
+                'p99': percentile(latencies, 99),
+                'members': dict(sorted(stats.members.items(), key=lambda item: -item[1])),
+            }
+
+        return dict(sorted(results.items(), key=lambda item: -item[1]['cumulative']))
+
+    @property
+    def com_calls(self) -> int:
+        """
+        Total number of COM round trips recorded.
+
+        :return: int
+        """
+
+        return sum(stats.com_calls for stats in self._stats.values())
+
+    def report(self, limit: int = None) -> str:
+        """
+        A text table of the results.
+
+        :param int limit: (optional) only report the first `limit` methods.
+        :return: str
+        """
+
+        header = f'{"method":<50} {"calls":>8} {"com":>8} {"com/call":>9} {"cum (s)":>10} ' \
+                 f'{"p50 (ms)":>9} {"p99 (ms)":>9}'
+        lines = [header, '-' * len(header)]
+        for key, result in list(self.results().items())[:limit]:
+            lines.append(
+                f'{key:<50} {result["calls"]:>8} {result["com_calls"]:>8} {result["com_calls_per_call"]:>9.1f} '
+                f'{result["cumulative"]:>10.4f} {result["p50"] * 1000:>9.3f} {result["p99"] * 1000:>9.3f}'
+            )
+        lines.append('-' * len(header))
+        lines.append(f'{self.com_calls} COM round trips in {self.elapsed:.3f} s')
+
+        return '\n'.join(lines)
+
+    def to_dict(self) -> dict:
+        """
+        :return: dict
+        """
+
+        return {
+            'elapsed': self.elapsed,
+            'com_calls': self.com_calls,
+            'methods': self.results(),
+        }
+
+    def dump(self, file_name) -> None:
+        """
+        Write the results to file_name as JSON for comparison between runs.
+
+        :param str or Path file_name:
+        :return: None
+        """
+
+        with open(file_name, 'w') as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    def reset(self) -> None:
+        """
+        Clear the results recorded so far.
+
+        :return: None
+        """
+
+        self._stats = {}
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return f'COMProfiler(com_calls={self.com_calls})'
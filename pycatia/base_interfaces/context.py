@@ -1,11 +1,208 @@
 #! /usr/bin/python3.9
 
 import os
+import time
 import warnings
+from contextlib import contextmanager
+from typing import Iterable
+from typing import Iterator
+from typing import TYPE_CHECKING
 
 from pycatia.base_interfaces.base_application import catia_application as catia
 from pycatia.exception_handling.exceptions import CATIAApplicationException
 
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.application import Application
+    from pycatia.in_interfaces.document import Document
+
+# the application settings applied by a BatchSession.
+batch_profile = {
+    'refresh_display': False,
+    'display_file_alerts': False,
+    'interactive': False,
+    'undo_redo_lock': True,
+}
+
+
+class DocumentTiming:
+    """
+    The time taken to open, process and close a document in a :class:`BatchSession`.
+    """
+
+    __slots__ = ('file_name', 'open', 'process', 'close', 'error')
+
+    def __init__(self, file_name: str):
+        """
+        :param str file_name:
+        """
+
+        self.file_name = file_name
+        self.open = 0.0
+        self.process = 0.0
+        self.close = 0.0
+        self.error = None
+
+    @property
+    def total(self) -> float:
+        """
+        :return: the total time in seconds.
+        :rtype: float
+        """
+
+        return self.open + self.process + self.close
+
+    def __repr__(self):
+        return (f'DocumentTiming(file_name="{self.file_name}", open={self.open:.3f}, process={self.process:.3f}, '
+                f'close={self.close:.3f}, error={self.error!r})')
+
+
+class BatchSession:
+    """
+    A context manager applying a performance profile to the CATIA application. The display refresh, file alerts,
+    interactive mode and undo are switched off and new undo/redo transactions are disabled. The previous settings
+    are restored on exit, also when an exception is raised.
+
+    Documents can be processed in sequence with :meth:`open` or :meth:`documents`, which close each document
+    after use and record the time taken in :attr:`timings`.
+
+    :Example - Process many documents:
+
+        >>> from pycatia.base_interfaces.context import BatchSession
+        >>> with BatchSession() as session:
+        >>>     for document in session.documents(file_names):
+        >>>         document.export_data(document.full_name, 'stp')
+        >>> for timing in session.timings:
+        >>>     print(timing.file_name, timing.open, timing.process, timing.close, timing.error)
+
+    :param Application application: (optional) defaults to the running CATIA session.
+    :param dict profile: (optional) {application property name: value} applied on entry. Defaults to
+        :data:`batch_profile`.
+    :param bool disable_undo_transactions: (optional) call Application.disable_new_undo_redo_transaction() on
+        entry and Application.enable_new_undo_redo_transaction() on exit.
+    """
+
+    def __init__(self, application: 'Application' = None, profile: dict = None,
+                 disable_undo_transactions: bool = True):
+        self.catia = application if application is not None else catia()
+        self.profile = dict(batch_profile if profile is None else profile)
+        self.disable_undo_transactions = disable_undo_transactions
+        self.timings = []
+        self._previous = {}
+        self._undo_transactions_disabled = False
+
+    def apply(self) -> None:
+        """
+        Apply the profile, remembering the current settings.
+
+        :return: None
+        """
+
+        try:
+            for name, value in self.profile.items():
+                self._previous[name] = getattr(self.catia, name)
+                setattr(self.catia, name, value)
+            if self.disable_undo_transactions:
+                self.catia.disable_new_undo_redo_transaction()
+                self._undo_transactions_disabled = True
+        except Exception:
+            self.restore()
+            raise
+
+    def restore(self) -> None:
+        """
+        Restore the settings changed by :meth:`apply`. All the settings are restored before an error is raised.
+
+        :return: None
+        """
+
+        errors = []
+        if self._undo_transactions_disabled:
+            self._undo_transactions_disabled = False
+            try:
+                self.catia.enable_new_undo_redo_transaction()
+            except Exception as e:
+                errors.append(f'enable_new_undo_redo_transaction: {e}')
+        for name, value in reversed(list(self._previous.items())):
+            try:
+                setattr(self.catia, name, value)
+            except Exception as e:
+                errors.append(f'{name}: {e}')
+        self._previous = {}
+
+        if errors:
+            raise CATIAApplicationException(f'Could not restore the application settings. {"; ".join(errors)}')
+
+    @contextmanager
+    def open(self, file_name) -> Iterator['Document']:
+        """
+        Open a document, yield it and close it, recording the time taken.
+
+        :param str or Path file_name:
+        :return: Iterator[Document]
+        """
+
+        timing = DocumentTiming(str(file_name))
+        self.timings.append(timing)
+
+        start = time.perf_counter()
+        try:
+            document = self.catia.documents.open(file_name)
+        except Exception as e:
+            timing.error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            timing.open = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            yield document
+        except Exception as e:
+            timing.error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            timing.process = time.perf_counter() - start
+            start = time.perf_counter()
+            try:
+                document.close()
+            finally:
+                timing.close = time.perf_counter() - start
+
+    def documents(self, file_names: Iterable, stop_on_error: bool = False) -> Iterator['Document']:
+        """
+        Open each document in turn, yielding it and closing it before the next one is opened. The time between
+        yielding a document and the next iteration is recorded as the time processing it.
+
+        :param file_names:
+        :param bool stop_on_error: (optional) raise if a document can't be opened or closed. Otherwise the error
+            is recorded in its timing and the document is skipped.
+        :return: Iterator[Document]
+        """
+
+        for file_name in file_names:
+            try:
+                with self.open(file_name) as document:
+                    yield document
+            except Exception:
+                if stop_on_error:
+                    raise
+
+    def __enter__(self):
+        self.apply()
+
+        return self
+
+    def __exit__(self, exc_type, *args):
+        try:
+            self.restore()
+        except CATIAApplicationException as e:
+            # don't hide the exception that ended the session.
+            if exc_type is None:
+                raise
+            warnings.warn(str(e))
+
+    def __repr__(self):
+        return f'BatchSession(profile={self.profile}, documents={len(self.timings)})'
+
 
 class CATIADocHandler:
     """
@@ -45,13 +242,16 @@ class CATIADocHandler:
 
     :param str or Path file_name: (optional) path filename to file
     :param str new_document: (optional) 'Part', 'Product' or 'Drawing'.
+    :param bool batch: (optional) apply the :class:`BatchSession` performance profile while the document is
+        handled.
     """
 
-    def __init__(self, file_name=None, new_document=None):
+    def __init__(self, file_name=None, new_document=None, batch=False):
         self.catia = catia()
         self.documents = self.catia.documents
         self.file_name = file_name
         self.new_document = new_document
+        self.batch_session = BatchSession(self.catia) if batch else None
 
         if self.file_name and not os.path.isfile(self.file_name):
             raise CATIAApplicationException(f'Could not find file: {file_name}')
@@ -59,19 +259,30 @@ class CATIADocHandler:
     def __enter__(self):
         self.documents = self.catia.documents
         self.document = None
+        if self.batch_session is not None:
+            self.batch_session.apply()
 
-        if self.file_name:
-            self.documents.open(self.file_name)
-            self.document = self.catia.active_document
-        elif self.new_document:
-            self.documents.add(self.new_document)
-            self.document = self.catia.active_document
+        try:
+            if self.file_name:
+                self.documents.open(self.file_name)
+                self.document = self.catia.active_document
+            elif self.new_document:
+                self.documents.add(self.new_document)
+                self.document = self.catia.active_document
+        except Exception:
+            if self.batch_session is not None:
+                self.batch_session.restore()
+            raise
 
         return self
 
     def __exit__(self, *args):
 
-        if self.document:
-            self.document.close()
-        else:
-            warnings.warn('The document handler could not detect a document to close.')
+        try:
+            if self.document:
+                self.document.close()
+            else:
+                warnings.warn('The document handler could not detect a document to close.')
+        finally:
+            if self.batch_session is not None:
+                self.batch_session.restore()
@@ -0,0 +1,62 @@
+#! /usr/bin/python3.9
+"""
+
+    Lazy loading of package attributes (PEP 562).
+
+    Most pycatia modules are large and import many others. A package using :func:`lazy_loader` only imports a
+    submodule, or the module defining an attribute, when the attribute is first used.
+
+    :Example - Make the submodules of a package lazy attributes:
+
+        >>> # pycatia/in_interfaces/__init__.py
+        >>> from pycatia.base_interfaces.lazy_loader import lazy_loader
+        >>> __getattr__, __dir__ = lazy_loader(__name__, __path__)
+
+"""
+
+import importlib
+import sys
+
+
+def lazy_loader(package_name: str, package_path: list, attributes: dict = None) -> tuple:
+    """
+    Create the module level `__getattr__` and `__dir__` functions of a package.
+
+    Accessing an attribute not yet defined on the package imports the submodule of that name. Names in
+    attributes are imported from the module given.
+
+    :param str package_name: `__name__` of the package.
+    :param list package_path: `__path__` of the package.
+    :param dict attributes: (optional) {name: (module_name, attribute_name)}
+    :return: tuple(__getattr__, __dir__)
+    """
+
+    attributes = attributes or {}
+
+    def __getattr__(name):
+        if name in attributes:
+            module_name, attribute_name = attributes[name]
+            value = getattr(importlib.import_module(module_name), attribute_name)
+            setattr(sys.modules[package_name], name, value)
+            return value
+
+        if not name.startswith('__'):
+            full_name = f'{package_name}.{name}'
+            try:
+                # the submodule is set as an attribute of the package when imported.
+                return importlib.import_module(full_name)
+            except ModuleNotFoundError as e:
+                if e.name != full_name:
+                    raise
+
+        raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+    def __dir__():
+        import pkgutil
+
+        names = set(vars(sys.modules[package_name]))
+        names.update(attributes)
+        names.update(module.name for module in pkgutil.iter_modules(package_path))
+        return sorted(names)
+
+    return __getattr__, __dir__
@@ -0,0 +1,436 @@
+#! /usr/bin/python3.9
+"""
+
+    A pool of CATIA sessions for batch processing.
+
+    pycatia normally talks to one CATIA session. A :class:`SessionPool` starts several, each owned by its own
+    worker process (and so its own COM apartment), and runs jobs across them. A job is a function taking the
+    :class:`~pycatia.in_interfaces.application.Application` of the session it runs in as its first argument.
+
+    Long running sessions tend to grow. A session can be recycled, its worker process ended and a new session
+    started, after a number of jobs or when its memory has grown by more than a limit since it started.
+
+    The exception raised by a job is returned in its :class:`JobResult` and the session continues with the next
+    job. If a worker process dies the job it was running fails and a new session is started.
+
+    :Example - Convert documents to STEP in 4 sessions, each recycled after 200 documents:
+
+        >>> import os
+        >>> from pycatia.base_interfaces.session_pool import SessionPool
+        >>>
+        >>> def to_step(application, file_name):
+        >>>     document = application.documents.open(file_name)
+        >>>     step_file = os.path.splitext(file_name)[0]
+        >>>     document.export_data(step_file, 'stp')
+        >>>     document.close()
+        >>>     return step_file + '.stp'
+        >>>
+        >>> if __name__ == '__main__':
+        >>>     with SessionPool(workers=4, jobs_per_session=200) as pool:
+        >>>         for result in pool.map(to_step, file_names):
+        >>>             if result.error is not None:
+        >>>                 print(file_names[result.job_id], result.error)
+
+    Jobs, their arguments and their return values are sent between processes so they must be picklable. Jobs
+    must be defined at module level and shouldn't return COM objects.
+
+    The sessions are created by the backend of the pool, see :mod:`~pycatia.base_interfaces.com_backend`. The
+    default starts a new CATIA session for each worker. Any picklable object with a dispatch(prog_id) method can
+    be used, so a pool can be run against a fake application where CATIA isn't available.
+
+"""
+
+import collections
+import os
+import pickle
+import time
+import traceback
+from multiprocessing import Pipe
+from multiprocessing import Process
+from multiprocessing.connection import wait
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import TYPE_CHECKING
+
+from pycatia.base_interfaces.base_application import catia_application
+from pycatia.base_interfaces.com_backend import DispatchBackend
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.application import Application
+
+
+def session_process_id(application: 'Application') -> int:
+    """
+    The process id of a CATIA session. The process id is read from the parent of a short lived child process
+    started by the session.
+
+    :param Application application:
+    :return: int
+    """
+
+    vba_function_name = 'session_process_id'
+    vba_code = '''
+    Public Function session_process_id()
+        Set child = CreateObject("WScript.Shell").Exec("cmd.exe /k")
+        Set wmi = GetObject("winmgmts:\\\\.\\root\\cimv2")
+        For Each process In wmi.ExecQuery("Select ParentProcessId From Win32_Process Where ProcessId = " & child.ProcessID)
+            session_process_id = CLng(process.ParentProcessId)
+        Next
+        child.Terminate
+    End Function
+    '''
+
+    return int(application.system_service.evaluate_function(vba_code, vba_function_name, []))
+
+
+def session_memory(application: 'Application', process_id: int = None) -> int:
+    """
+    The working set of a CATIA session.
+
+    :param Application application:
+    :param int process_id: (optional) the process id of the session. See :func:`session_process_id`.
+    :return: the working set in bytes.
+    :rtype: int
+    """
+
+    if process_id is None:
+        process_id = session_process_id(application)
+
+    vba_function_name = 'session_memory'
+    vba_code = '''
+    Public Function session_memory(process_id)
+        session_memory = 0
+        Set wmi = GetObject("winmgmts:\\\\.\\root\\cimv2")
+        For Each process In wmi.ExecQuery("Select WorkingSetSize From Win32_Process Where ProcessId = " & process_id)
+            session_memory = CDbl(process.WorkingSetSize)
+        Next
+    End Function
+    '''
+
+    return int(application.system_service.evaluate_function(vba_code, vba_function_name, [process_id]))
+
+
+class JobResult:
+    """
+    The outcome of a job run by a :class:`SessionPool`.
+    """
+
+    __slots__ = ('job_id', 'value', 'exception', 'error', 'traceback', 'elapsed', 'pid', 'session')
+
+    def __init__(self, job_id: int, value=None, exception: Exception = None, error: str = None,
+                 traceback: str = None, elapsed: float = 0.0, pid: int = None, session: int = None):
+        """
+        :param int job_id: the id returned by :meth:`SessionPool.submit`.
+        :param value: the return value of the job.
+        :param Exception exception: the exception raised by the job or None.
+        :param str error: the exception as '<type>: <message>' or None.
+        :param str traceback: the formatted traceback of the exception or None.
+        :param float elapsed: the time taken by the job in seconds.
+        :param int pid: the id of the worker process.
+        :param int session: the number of the session that ran the job. It changes when a session is recycled.
+        """
+
+        self.job_id = job_id
+        self.value = value
+        self.exception = exception
+        self.error = error
+        self.traceback = traceback
+        self.elapsed = elapsed
+        self.pid = pid
+        self.session = session
+
+    def result(self):
+        """
+        :return: the return value of the job. The exception raised by the job is raised again.
+        """
+
+        if self.exception is not None:
+            raise self.exception
+
+        return self.value
+
+    def __repr__(self):
+        return f'JobResult(job_id={self.job_id}, error={self.error!r})'
+
+
+def _run_job(job_id: int, function: Callable, args: tuple, kwargs: dict, application, session: int) -> JobResult:
+    start = time.perf_counter()
+    try:
+        result = JobResult(job_id, value=function(application, *args, **kwargs))
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+        try:
+            pickle.dumps(e)
+        except Exception:
+            e = CATIAApplicationException(error)
+        result = JobResult(job_id, exception=e, error=error, traceback=traceback.format_exc())
+    result.elapsed = time.perf_counter() - start
+    result.pid = os.getpid()
+    result.session = session
+
+    return result
+
+
+def _run_session(connection, session: int, backend, initializer, initargs, finalizer, jobs_per_session,
+                 max_memory_growth, memory, quit_session) -> None:
+    # the worker process of a session. Jobs are received and their results sent back until the session is
+    # recycled or the pool closes the connection.
+    try:
+        application = catia_application(backend)
+        if initializer is not None:
+            initializer(application, *initargs)
+        if max_memory_growth is not None:
+            if memory is None:
+                process_id = session_process_id(application)
+                memory = lambda application_: session_memory(application_, process_id)
+            baseline = memory(application)
+    except Exception as e:
+        connection.send(('failed', f'{type(e).__name__}: {e}'))
+        return
+    connection.send(('ready', os.getpid()))
+
+    jobs = 0
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        result = _run_job(*message, application, session)
+        jobs += 1
+        recycle = jobs_per_session is not None and jobs >= jobs_per_session
+        if not recycle and max_memory_growth is not None:
+            try:
+                recycle = memory(application) - baseline > max_memory_growth
+            except Exception:
+                # a session that can't be measured is probably in a bad state.
+                recycle = True
+        try:
+            connection.send(('result', result, recycle))
+        except Exception as e:
+            error = f'Could not return the result of job {result.job_id}. {type(e).__name__}: {e}'
+            connection.send(('result', JobResult(result.job_id, exception=CATIAApplicationException(error),
+                                                 error=error, elapsed=result.elapsed, pid=result.pid,
+                                                 session=session), recycle))
+        if recycle:
+            break
+
+    if finalizer is not None:
+        try:
+            finalizer(application)
+        except Exception:
+            pass
+    if quit_session:
+        try:
+            application.quit()
+        except Exception:
+            pass
+
+
+class _Session:
+    __slots__ = ('number', 'process', 'connection', 'pid', 'ready', 'job_id')
+
+    def __init__(self, number: int, process: Process, connection):
+        self.number = number
+        self.process = process
+        self.connection = connection
+        self.pid = None
+        self.ready = False
+        self.job_id = None
+
+
+class SessionPool:
+    """
+    Run jobs across several CATIA sessions, each in its own worker process. Sessions are started when there are
+    jobs for them.
+
+    :param int workers: (optional) the number of sessions.
+    :param backend: (optional) the backend creating the session of each worker. Defaults to
+        DispatchBackend(new_session=True).
+    :param int jobs_per_session: (optional) recycle a session after this number of jobs.
+    :param int max_memory_growth: (optional) recycle a session when its memory has grown by more than this
+        number of bytes since it started.
+    :param memory: (optional) function(application) returning the memory used by a session in bytes. Defaults
+        to the working set of the CATIA process, see :func:`session_memory`.
+    :param initializer: (optional) function(application, \\*initargs) called when each session starts, for
+        example to set options.
+    :param tuple initargs: (optional)
+    :param finalizer: (optional) function(application) called when each session ends, for example to close the
+        documents opened by the jobs.
+    :param bool quit_sessions: (optional) quit the CATIA application of a session when it is recycled or the
+        pool is closed. Defaults to True if the backend starts new sessions.
+    """
+
+    def __init__(self, workers: int = 2, backend=None, jobs_per_session: int = None, max_memory_growth: int = None,
+                 memory: Callable[['Application'], int] = None, initializer: Callable = None, initargs: tuple = (),
+                 finalizer: Callable[['Application'], None] = None, quit_sessions: bool = None):
+        if workers < 1:
+            raise CATIAApplicationException('A session pool needs at least 1 worker.')
+        if backend is None:
+            backend = DispatchBackend(new_session=True)
+        if quit_sessions is None:
+            quit_sessions = getattr(backend, 'new_session', False)
+
+        self.workers = workers
+        self.backend = backend
+        self.jobs_per_session = jobs_per_session
+        self.max_memory_growth = max_memory_growth
+        self.memory = memory
+        self.initializer = initializer
+        self.initargs = initargs
+        self.finalizer = finalizer
+        self.quit_sessions = quit_sessions
+        self.sessions_started = 0
+        self._queue = collections.deque()
+        self._sessions = {}
+        self._next_job_id = 0
+
+    def submit(self, function: Callable, *args, **kwargs) -> int:
+        """
+        Queue a job. The job is called as function(application, \\*args, \\*\\*kwargs) in one of the sessions.
+
+        :param function: a module level function.
+        :return: the job id.
+        :rtype: int
+        """
+
+        job_id = self._next_job_id
+        self._next_job_id += 1
+        self._queue.append((job_id, function, args, kwargs))
+
+        return job_id
+
+    def results(self) -> Iterator[JobResult]:
+        """
+        Run the queued jobs and yield their results as they finish.
+
+        :return: Iterator[JobResult]
+        """
+
+        while self._queue or self._running():
+            yield from self._step()
+
+    def map(self, function: Callable, *iterables: Iterable) -> Iterator[JobResult]:
+        """
+        Run function(application, \\*arguments) for each set of arguments taken from iterables and yield the
+        results as they finish, not in the order of the arguments. Use :attr:`JobResult.job_id` to match them
+        up, the job ids of a map() on a new pool are 0, 1, 2 ...
+
+        The arguments are read as sessions become free so iterables can be long or lazy.
+
+        :param function: a module level function.
+        :param iterables:
+        :return: Iterator[JobResult]
+        """
+
+        arguments = zip(*iterables)
+        exhausted = False
+        while True:
+            while not exhausted and len(self._queue) < self.workers:
+                args = next(arguments, None)
+                if args is None:
+                    exhausted = True
+                else:
+                    self.submit(function, *args)
+            if not self._queue and not self._running():
+                return
+            yield from self._step()
+
+    def close(self, timeout: float = 60) -> None:
+        """
+        End all the sessions. Jobs still queued are discarded.
+
+        :param float timeout: (optional) seconds to wait for each worker process to end before it is terminated.
+        :return: None
+        """
+
+        self._queue.clear()
+        for session in list(self._sessions.values()):
+            self._stop(session, timeout)
+
+    def _running(self) -> bool:
+        return any(session.job_id is not None for session in self._sessions.values())
+
+    def _start(self) -> None:
+        self.sessions_started += 1
+        connection, worker_connection = Pipe()
+        process = Process(target=_run_session, daemon=True,
+                          args=(worker_connection, self.sessions_started, self.backend, self.initializer,
+                                self.initargs, self.finalizer, self.jobs_per_session, self.max_memory_growth,
+                                self.memory, self.quit_sessions))
+        process.start()
+        worker_connection.close()
+        self._sessions[connection] = _Session(self.sessions_started, process, connection)
+
+    def _stop(self, session: _Session, timeout: float = 60) -> None:
+        del self._sessions[session.connection]
+        try:
+            session.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        session.process.join(timeout)
+        if session.process.is_alive():
+            session.process.terminate()
+            session.process.join()
+        session.connection.close()
+
+    def _dispatch(self) -> Iterator[JobResult]:
+        for session in list(self._sessions.values()):
+            while self._queue and session.ready and session.job_id is None:
+                job = self._queue.popleft()
+                try:
+                    session.connection.send(job)
+                except Exception as e:
+                    # the job couldn't be pickled.
+                    error = f'Could not send job {job[0]}. {type(e).__name__}: {e}'
+                    yield JobResult(job[0], exception=CATIAApplicationException(error), error=error)
+                else:
+                    session.job_id = job[0]
+        starting = sum(not session.ready for session in self._sessions.values())
+        while len(self._sessions) < self.workers and len(self._queue) > starting:
+            self._start()
+            starting += 1
+
+    def _step(self) -> Iterator[JobResult]:
+        yield from self._dispatch()
+        if not self._sessions:
+            return
+
+        for connection in wait(list(self._sessions)):
+            session = self._sessions[connection]
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                job_id = session.job_id
+                self._stop(session)
+                if job_id is not None:
+                    error = f'The worker process of session {session.number} exited while running job {job_id}.'
+                    yield JobResult(job_id, exception=CATIAApplicationException(error), error=error,
+                                    pid=session.pid, session=session.number)
+                continue
+
+            if message[0] == 'ready':
+                session.ready = True
+                session.pid = message[1]
+            elif message[0] == 'failed':
+                self.close()
+                raise CATIAApplicationException(f'Could not start CATIA session {session.number}. {message[1]}')
+            else:
+                _, result, recycle = message
+                session.job_id = None
+                if recycle:
+                    self._stop(session)
+                yield result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f'SessionPool(workers={self.workers}, sessions={len(self._sessions)}, queued={len(self._queue)})'
@@ -0,0 +1,242 @@
+#! /usr/bin/python3.9
+"""
+
+    A registry of the VBScript functions pycatia evaluates with SystemService.
+
+    Many CATIA methods can't be called directly from python as they fill a VB array passed to them. pycatia calls
+    these methods by evaluating a small VBScript function with SystemService.Evaluate(). The registry renders each
+    script once, deduplicates identical scripts and records the time spent in each function.
+
+    Optionally the registered functions can be written once to a helper module on disk. Functions are then called
+    with SystemService.ExecuteScript() so only the function name and parameters are sent per call rather than the
+    script text.
+
+    :Example - Use a helper module and report the VBA bridge latency:
+
+        >>> from pycatia.base_interfaces.vba_registry import vba_registry
+        >>> vba_registry.use_helper_module(r'C:\\temp\\pycatia')
+        >>> # ... measure things ...
+        >>> print(vba_registry.report())
+
+"""
+
+import os
+import re
+import textwrap
+import time
+from pathlib import Path
+
+from pycatia.enumeration.enumeration_types import cat_script_language
+from pycatia.enumeration.enumeration_types import cat_script_library_type
+
+_procedure = re.compile(r'^\s*(?:Public\s+|Private\s+)?(?:Function|Sub)\s+(\w+)', re.IGNORECASE | re.MULTILINE)
+
+
+class VBAScript:
+    """
+    A rendered VBScript function.
+    """
+
+    __slots__ = ('name', 'code', 'calls', 'elapsed', 'max_elapsed')
+
+    def __init__(self, name: str, code: str):
+        self.name = name
+        self.code = code
+        self.calls = 0
+        self.elapsed = 0.0
+        self.max_elapsed = 0.0
+
+    def __repr__(self):
+        return f'VBAScript(name="{self.name}")'
+
+
+class VBARegistry:
+    """
+    The registry of VBScript functions. Use the module instance `vba_registry`.
+    """
+
+    helper_module_name = 'pycatia_helpers.catvbs'
+
+    def __init__(self):
+        self.scripts = {}
+        self.helper_directory = None
+        self._by_source = {}
+        self._by_code = {}
+        self._helper_scripts = set()
+        # the lower case names of the procedures of all registered scripts, VBScript names are case insensitive.
+        self._procedures = set()
+
+    def _unique_name(self, name: str) -> str:
+        unique_name = name
+        suffix = 1
+        while unique_name.lower() in self._procedures or unique_name in self.scripts:
+            suffix += 1
+            unique_name = f'{name}_{suffix}'
+
+        return unique_name
+
+    def register(self, vba_function_name: str, vba_code: str) -> VBAScript:
+        """
+        Register the function vba_function_name defined in vba_code. Registering the same source again returns
+        the existing script without rendering it.
+
+        If a different function is already registered as vba_function_name the function is renamed so that all
+        registered functions can share one helper module. Other procedures of vba_code whose names are taken are
+        renamed likewise. Values that change between calls must be passed as parameters rather than written into
+        vba_code.
+
+        :param str vba_function_name:
+        :param str vba_code:
+        :return: VBAScript
+        """
+
+        script = self._by_source.get(vba_code)
+        if script is not None:
+            return script
+
+        rendered = textwrap.dedent(vba_code).strip('\n') + '\n'
+        script = self._by_code.get(rendered)
+        if script is None:
+            code = rendered
+            name = vba_function_name
+            procedures = []
+            for procedure in dict.fromkeys(_procedure.findall(rendered)):
+                unique_name = self._unique_name(procedure)
+                if procedure.lower() == vba_function_name.lower():
+                    name = unique_name
+                if unique_name != procedure:
+                    code = re.sub(rf'\b{procedure}\b', unique_name, code, flags=re.IGNORECASE)
+                procedures.append(unique_name.lower())
+            if name == vba_function_name and vba_function_name.lower() not in procedures:
+                name = self._unique_name(vba_function_name)
+                if name != vba_function_name:
+                    code = re.sub(rf'\b{vba_function_name}\b', name, code, flags=re.IGNORECASE)
+            self._procedures.update(procedures)
+            script = VBAScript(name, code)
+            self.scripts[name] = script
+            self._by_code[rendered] = script
+        self._by_source[vba_code] = script
+
+        return script
+
+    def evaluate(self, system_service, vba_code: str, vba_function_name: str, parameters: list):
+        """
+        Evaluate the function vba_function_name defined in vba_code using system_service.
+
+        :param SystemService system_service:
+        :param str vba_code:
+        :param str vba_function_name:
+        :param list parameters:
+        :return: the value returned by the function.
+        """
+
+        script = self.register(vba_function_name, vba_code)
+
+        start = time.perf_counter()
+        try:
+            if self.helper_directory is not None:
+                if script.name not in self._helper_scripts:
+                    self.write_helper_module(self.helper_directory)
+                return system_service.execute_script(
+                    str(self.helper_directory),
+                    cat_script_library_type.index('catScriptLibraryTypeDirectory'),
+                    self.helper_module_name,
+                    script.name,
+                    parameters
+                )
+
+            return system_service.evaluate(
+                script.code,
+                cat_script_language.index('CATVBScriptLanguage'),
+                script.name,
+                parameters
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            script.calls += 1
+            script.elapsed += elapsed
+            script.max_elapsed = max(script.max_elapsed, elapsed)
+
+    def write_helper_module(self, directory) -> Path:
+        """
+        Write all the registered functions to one VBScript module in directory.
+
+        :param str or Path directory:
+        :return: Path
+        """
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        helper_module = Path(directory, self.helper_module_name)
+        with open(helper_module, 'w') as file:
+            file.write('\n'.join(script.code for script in self.scripts.values()))
+        self._helper_scripts = set(self.scripts)
+
+        return helper_module
+
+    def use_helper_module(self, directory) -> None:
+        """
+        Call the registered functions from a helper module written to directory. The module is rewritten when a
+        function not yet in the module is first evaluated.
+
+        :param str or Path directory: a directory CATIA can read. Use None to evaluate the script text on each
+            call again.
+        :return: None
+        """
+
+        if directory is None:
+            self.helper_directory = None
+            self._helper_scripts = set()
+            return
+
+        self.helper_directory = Path(os.path.abspath(directory))
+        self.write_helper_module(self.helper_directory)
+
+    def statistics(self) -> dict:
+        """
+        The number of calls and the time spent in each function that has been evaluated. Times are in seconds.
+
+        :return: dict
+        """
+
+        return {
+            script.name: {
+                'calls': script.calls,
+                'elapsed': script.elapsed,
+                'mean': script.elapsed / script.calls,
+                'max': script.max_elapsed,
+            }
+            for script in sorted(self.scripts.values(), key=lambda s: -s.elapsed)
+            if script.calls
+        }
+
+    def reset_statistics(self) -> None:
+        """
+        :return: None
+        """
+
+        for script in self.scripts.values():
+            script.calls = 0
+            script.elapsed = 0.0
+            script.max_elapsed = 0.0
+
+    def report(self) -> str:
+        """
+        A text table of :meth:`statistics`.
+
+        :return: str
+        """
+
+        header = f'{"function":<50} {"calls":>8} {"total (s)":>10} {"mean (ms)":>10} {"max (ms)":>10}'
+        lines = [header, '-' * len(header)]
+        for name, stats in self.statistics().items():
+            lines.append(f'{name:<50} {stats["calls"]:>8} {stats["elapsed"]:>10.4f} {stats["mean"] * 1000:>10.3f} '
+                         f'{stats["max"] * 1000:>10.3f}')
+
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f'VBARegistry(scripts={len(self.scripts)})'
+
+
+vba_registry = VBARegistry()
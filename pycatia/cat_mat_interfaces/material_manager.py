@@ -206,17 +206,17 @@ class MaterialManager(AnyObject):
         :rtype: None
         """
         vba_function_name = "get_material_on_body"
-        vba_code = f"""        
-        Public Function {vba_function_name}(material_manager, body)
+        vba_code = """        
+        Public Function get_material_on_body(material_manager, body)
             Dim material
             material_manager.GetMaterialOnBody body, material
-            Set {vba_function_name} = material
+            Set get_material_on_body = material
         End Function
         """
         system_service = self.application.system_service
         return Material(
-            system_service.evaluate(
-                vba_code, 0, vba_function_name, [self.com_object, i_body.com_object]
+            system_service.evaluate_function(
+                vba_code, vba_function_name, [self.com_object, i_body.com_object]
             )
         )
 
@@ -238,18 +238,17 @@ class MaterialManager(AnyObject):
         :rtype: None
         """
         vba_function_name = "get_material_on_hybrid_body"
-        vba_code = f"""        
-        Public Function {vba_function_name}(material_manager, hybrid_body)
+        vba_code = """        
+        Public Function get_material_on_hybrid_body(material_manager, hybrid_body)
             Dim material
             material_manager.GetMaterialOnHybridBody hybrid_body, material
-            Set {vba_function_name} = material
+            Set get_material_on_hybrid_body = material
         End Function
         """
         system_service = self.application.system_service
         return Material(
-            system_service.evaluate(
+            system_service.evaluate_function(
                 vba_code,
-                0,
                 vba_function_name,
                 [self.com_object, i_hybrid_body.com_object],
             )
@@ -273,17 +272,17 @@ class MaterialManager(AnyObject):
         :rtype: None
         """
         vba_function_name = "get_material_on_part"
-        vba_code = f"""        
-        Public Function {vba_function_name}(material_manager, part)
+        vba_code = """        
+        Public Function get_material_on_part(material_manager, part)
             Dim material
             material_manager.GetMaterialOnPart part, material
-            Set {vba_function_name} = material
+            Set get_material_on_part = material
         End Function
         """
         system_service = self.application.system_service
         return Material(
-            system_service.evaluate(
-                vba_code, 0, vba_function_name, [self.com_object, i_part.com_object]
+            system_service.evaluate_function(
+                vba_code, vba_function_name, [self.com_object, i_part.com_object]
             )
         )
 
@@ -305,17 +304,17 @@ class MaterialManager(AnyObject):
         :rtype: None
         """
         vba_function_name = "get_material_on_product"
-        vba_code = f"""        
-        Public Function {vba_function_name}(material_manager, product)
+        vba_code = """        
+        Public Function get_material_on_product(material_manager, product)
             Dim material
             material_manager.GetMaterialOnProduct product, material
-            Set {vba_function_name} = material
+            Set get_material_on_product = material
         End Function
         """
         system_service = self.application.system_service
         return Material(
-            system_service.evaluate(
-                vba_code, 0, vba_function_name, [self.com_object, i_product.com_object]
+            system_service.evaluate_function(
+                vba_code, vba_function_name, [self.com_object, i_product.com_object]
             )
         )
 
@@ -339,18 +338,17 @@ class MaterialManager(AnyObject):
         :rtype: None
         """
         vba_function_name = "get_material_on_user_material"
-        vba_code = f"""        
-        Public Function {vba_function_name}(material_manager, user_material)
+        vba_code = """        
+        Public Function get_material_on_user_material(material_manager, user_material)
             Dim material
             material_manager.GetMaterialOnUserMaterial user_material, material
-            Set {vba_function_name} = material
+            Set get_material_on_user_material = material
         End Function
         """
         system_service = self.application.system_service
         return Material(
-            system_service.evaluate(
+            system_service.evaluate_function(
                 vba_code,
-                0,
                 vba_function_name,
                 [self.com_object, i_user_material.com_object],
             )
@@ -9,8 +9,11 @@
         
 """
 
+from typing import Sequence
+
 from pycatia.drafting_interfaces.drawing_leaders import DrawingLeaders
 from pycatia.drafting_interfaces.drawing_text import DrawingText
+from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.system_interfaces.any_object import AnyObject
 
 
@@ -1161,5 +1164,197 @@ class DrawingTable(AnyObject):
         """
         return self.drawing_table.UnMergeCells(i_row, i_col)
 
+    def get_values(self, first_row: int = 1, first_col: int = 1, number_of_rows: int = None,
+                   number_of_columns: int = None) -> list:
+        """
+        Read the strings of a block of cells with one call to SystemService.evaluate() rather than one call per
+        cell with :meth:`get_cell_string`.
+
+        :param int first_row: (optional)
+        :param int first_col: (optional)
+        :param int number_of_rows: (optional) defaults to the rows up to the last one.
+        :param int number_of_columns: (optional) defaults to the columns up to the last one.
+        :return: a list of strings for each row.
+        :rtype: list(list(str))
+        """
+
+        vba_function_name = 'drawing_table_get_values'
+        vba_code = """
+        Public Function drawing_table_get_values(table, first_row, first_col, number_of_rows, number_of_columns)
+            Dim i, j, row, result()
+            If number_of_rows < 0 Then number_of_rows = table.NumberOfRows - first_row + 1
+            If number_of_columns < 0 Then number_of_columns = table.NumberOfColumns - first_col + 1
+            If number_of_rows <= 0 Or number_of_columns <= 0 Then
+                drawing_table_get_values = Array()
+                Exit Function
+            End If
+            ReDim result(number_of_rows - 1)
+            For i = 0 To number_of_rows - 1
+                ReDim row(number_of_columns - 1)
+                For j = 0 To number_of_columns - 1
+                    row(j) = table.GetCellString(first_row + i, first_col + j)
+                Next
+                result(i) = row
+            Next
+            drawing_table_get_values = result
+        End Function
+        """
+
+        system_service = self.application.system_service
+        rows = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [
+                self.drawing_table,
+                first_row,
+                first_col,
+                number_of_rows if number_of_rows is not None else -1,
+                number_of_columns if number_of_columns is not None else -1
+            ]
+        )
+
+        return [list(row) for row in (rows or ())]
+
+    def set_values(self, rows: Sequence[Sequence[str]], first_row: int = 1, first_col: int = 1,
+                   add_cells: bool = True, **formats) -> None:
+        """
+        Set the strings of a block of cells with one call to SystemService.evaluate() rather than one call per
+        cell with :meth:`set_cell_string`.
+
+        :attr:`compute_mode` is switched off while the cells are set and then restored so the table is computed
+        once. Missing rows and columns are added at the end of the table.
+
+        :Example - Fill a BOM table, centre the cells and size the columns:
+
+            >>> table = view.tables.add(20, 200, 1, 3, 10, 30)
+            >>> table.set_values(
+            >>>     [['ITEM', 'PART NUMBER', 'QTY']] + [[str(i + 1), row['part_number'], str(row['quantity'])]
+            >>>                                     for i, row in enumerate(bom.flattened())],
+            >>>     alignment=cat_table_position.index('CatTableMiddleCenter'),
+            >>>     column_sizes={1: 15, 2: 60, 3: 15},
+            >>> )
+
+        :param list(list(str)) rows: the cell strings of each row. None leaves a cell unchanged.
+        :param int first_row: (optional) the row of the first cell.
+        :param int first_col: (optional) the column of the first cell.
+        :param bool add_cells: (optional) add rows and columns if the table is too small. Otherwise an
+            exception is raised.
+        :param formats: (optional) alignment, border_type, column_sizes and row_sizes. See
+            :meth:`format_cells`.
+        :return: None
+        """
+
+        number_of_columns = max((len(row) for row in rows), default=0)
+        values = tuple(
+            None if value is None else str(value)
+            for row in rows
+            for value in tuple(row) + (None,) * (number_of_columns - len(row))
+        )
+        self._set_block(first_row, first_col, len(rows), number_of_columns, values, add_cells, **formats)
+
+    def format_cells(self, first_row: int = 1, first_col: int = 1, number_of_rows: int = None,
+                     number_of_columns: int = None, alignment: int = None, border_type: int = None,
+                     column_sizes: dict = None, row_sizes: dict = None) -> None:
+        """
+        Set the alignment and border type of a block of cells and the size of columns and rows with one call to
+        SystemService.evaluate(). :attr:`compute_mode` is switched off while the cells are formatted.
+
+        :param int first_row: (optional)
+        :param int first_col: (optional)
+        :param int number_of_rows: (optional) defaults to the rows up to the last one.
+        :param int number_of_columns: (optional) defaults to the columns up to the last one.
+        :param int alignment: (optional) the CatTablePosition of every cell in the block. See
+            enumeration_types.cat_table_position.
+        :param int border_type: (optional) the CatTableBorderType of every cell in the block.
+        :param dict column_sizes: (optional) {column: size}, applied after the cells.
+        :param dict row_sizes: (optional) {row: size}, applied after the cells.
+        :return: None
+        """
+
+        self._set_block(first_row, first_col, number_of_rows if number_of_rows is not None else -1,
+                        number_of_columns if number_of_columns is not None else -1, None, False,
+                        alignment=alignment, border_type=border_type, column_sizes=column_sizes,
+                        row_sizes=row_sizes)
+
+    def _set_block(self, first_row: int, first_col: int, number_of_rows: int, number_of_columns: int,
+                   values: tuple, add_cells: bool, alignment: int = None, border_type: int = None,
+                   column_sizes: dict = None, row_sizes: dict = None) -> None:
+        vba_function_name = 'drawing_table_set_block'
+        vba_code = """
+        Sub drawing_table_fill(table, first_row, first_col, number_of_rows, number_of_columns, values, add_cells, _
+                               alignment, border_type, columns, column_sizes, rows, row_sizes)
+            Dim i, j, value
+            If number_of_rows < 0 Then number_of_rows = table.NumberOfRows - first_row + 1
+            If number_of_columns < 0 Then number_of_columns = table.NumberOfColumns - first_col + 1
+            If add_cells Then
+                Do While table.NumberOfRows < first_row + number_of_rows - 1
+                    table.AddRow 0
+                Loop
+                Do While table.NumberOfColumns < first_col + number_of_columns - 1
+                    table.AddColumn 0
+                Loop
+            End If
+            For i = 0 To number_of_rows - 1
+                For j = 0 To number_of_columns - 1
+                    If IsArray(values) Then
+                        value = values(i * number_of_columns + j)
+                        If Not IsNull(value) And Not IsEmpty(value) Then
+                            table.SetCellString first_row + i, first_col + j, value
+                        End If
+                    End If
+                    If alignment >= 0 Then table.SetCellAlignment first_row + i, first_col + j, alignment
+                    If border_type >= 0 Then table.SetCellBorderType first_row + i, first_col + j, border_type
+                Next
+            Next
+            For i = 0 To UBound(columns)
+                table.SetColumnSize columns(i), column_sizes(i)
+            Next
+            For i = 0 To UBound(rows)
+                table.SetRowSize rows(i), row_sizes(i)
+            Next
+        End Sub
+
+        Public Function drawing_table_set_block(table, first_row, first_col, number_of_rows, number_of_columns, _
+                                                values, add_cells, alignment, border_type, columns, _
+                                                column_sizes, rows, row_sizes)
+            Dim mode, message
+            mode = table.ComputeMode
+            table.ComputeMode = 0
+            On Error Resume Next
+            drawing_table_fill table, first_row, first_col, number_of_rows, number_of_columns, values, _
+                               add_cells, alignment, border_type, columns, column_sizes, rows, row_sizes
+            message = ""
+            If Err.Number <> 0 Then message = Err.Description & " (" & Err.Number & ")"
+            On Error Goto 0
+            table.ComputeMode = mode
+            drawing_table_set_block = message
+        End Function
+        """
+
+        column_sizes = column_sizes or {}
+        row_sizes = row_sizes or {}
+        system_service = self.application.system_service
+        message = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [
+                self.drawing_table,
+                first_row,
+                first_col,
+                number_of_rows,
+                number_of_columns,
+                values,
+                add_cells,
+                alignment if alignment is not None else -1,
+                border_type if border_type is not None else -1,
+                tuple(column_sizes.keys()),
+                tuple(float(size) for size in column_sizes.values()),
+                tuple(row_sizes.keys()),
+                tuple(float(size) for size in row_sizes.values())
+            ]
+        )
+        if message:
+            raise CATIAApplicationException(f'Could not set the cells of drawing table "{self.name}": {message}')
+
     def __repr__(self):
         return f'DrawingTable(name="{self.name}")'
@@ -1090,8 +1090,8 @@ class DrawingView(AnyObject):
         """
 
         system_service = self.application.system_service
-        value = system_service.evaluate(
-            vba_code, 0, vba_function_name, [self.com_object]
+        value = system_service.evaluate_function(
+            vba_code, vba_function_name, [self.com_object]
         )
 
         # we don't return value directly as CATIA returns for example
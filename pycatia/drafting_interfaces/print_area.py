@@ -275,7 +275,7 @@ class PrintArea(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def set_area(self, i_x: float, i_y: float, i_width: float, i_height: float) -> None:
         """
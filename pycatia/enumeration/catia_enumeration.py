@@ -0,0 +1,107 @@
+#! /usr/bin/python3.9
+"""
+
+    The type of the enumerations in :mod:`~pycatia.enumeration.enumeration_types`.
+
+    A CATIA enumeration is a tuple of its member names in value order, so enumeration[value] is the name of a
+    value and enumeration.index(name) is the value of a name. :class:`CATIAEnumeration` keeps that tuple API but
+    looks names up in a dict, built on first use, rather than scanning the tuple.
+
+    Each enumeration is also available as an :class:`~enum.IntEnum`, created on first use. See
+    :mod:`~pycatia.enumeration.enums`.
+
+    :Example - The value of a name, the name of a value and the IntEnum:
+
+        >>> from pycatia.enumeration.enumeration_types import cat_work_mode_type
+        >>> cat_work_mode_type.index('DESIGN_MODE')
+        2
+        >>> cat_work_mode_type[2]
+        'DESIGN_MODE'
+        >>> cat_work_mode_type.enum.DESIGN_MODE
+        <CatWorkModeType.DESIGN_MODE: 2>
+
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from enum import IntEnum
+
+
+def enum_name(name: str) -> str:
+    """
+    The class name of the IntEnum of an enumeration.
+
+    :param str name: eg 'cat_work_mode_type'
+    :return: eg 'CatWorkModeType'
+    :rtype: str
+    """
+
+    return ''.join(word[:1].upper() + word[1:] for word in name.split('_'))
+
+
+class CATIAEnumeration(tuple):
+    """
+    The member names of a CATIA enumeration in value order.
+    """
+
+    # set on first use.
+    _values = None
+    _enum = None
+
+    def __new__(cls, name: str, names: tuple):
+        """
+        :param str name: eg 'cat_work_mode_type'
+        :param tuple names: the member names in value order.
+        """
+
+        enumeration = super().__new__(cls, names)
+        enumeration.name = name
+
+        return enumeration
+
+    def __getnewargs__(self):
+        return self.name, tuple(self)
+
+    def _lookup(self) -> dict:
+        if self._values is None:
+            self._values = {name: value for value, name in enumerate(self)}
+
+        return self._values
+
+    def index(self, name, *args) -> int:
+        """
+        :param str name:
+        :return: the value of name.
+        :rtype: int
+        """
+
+        if args:
+            return super().index(name, *args)
+
+        try:
+            return self._lookup()[name]
+        except (KeyError, TypeError):
+            raise ValueError(f'{name!r} is not in {self.name}.') from None
+
+    def __contains__(self, name):
+        try:
+            return name in self._lookup()
+        except TypeError:
+            return super().__contains__(name)
+
+    @property
+    def enum(self) -> 'IntEnum':
+        """
+        The enumeration as an IntEnum. Its members are ints so they can be passed to pycatia methods in place of
+        values.
+
+        :return: IntEnum
+        """
+
+        if self._enum is None:
+            from enum import IntEnum
+            self._enum = IntEnum(enum_name(self.name), [(name, value) for value, name in enumerate(self)],
+                                 module='pycatia.enumeration.enums')
+
+        return self._enum
@@ -1,420 +1,422 @@
 #! /usr/bin/python3.9
 
-abq_conc_force_load_type = (
+from pycatia.enumeration.catia_enumeration import CATIAEnumeration
+
+abq_conc_force_load_type = CATIAEnumeration('abq_conc_force_load_type', (
     "POINTLOAD",
     "DISTRIBUTEDLOAD",
     "LOADDENSITY",
-)
+))
 
-abq_dat_output_var_type = (
+abq_dat_output_var_type = CATIAEnumeration('abq_dat_output_var_type', (
     "ABQDATOUTPUTTYPE_NODE",
     "ABQDATOUTPUTTYPE_ELEMENT",
     "ABQDATOUTPUTTYPE_CONTACT",
     "ABQDATOUTPUTTYPE_ENERGY",
-)
+))
 
-abq_entity_type = (
+abq_entity_type = CATIAEnumeration('abq_entity_type', (
     "ABQ_NONE",
     "ABQ_NODE",
     "ABQ_ELEMENT",
-)
+))
 
-abq_local_csys_type = (
+abq_local_csys_type = CATIAEnumeration('abq_local_csys_type', (
     "ABQ_CARTESIAN",
     "ABQ_CYLINDRICAL",
     "ABQ_SPHERICAL",
     "ABQ_DEFAULTAXIS",
-)
+))
 
-abq_ms_frequency_type = (
+abq_ms_frequency_type = CATIAEnumeration('abq_ms_frequency_type', (
     "ABQ_INTERVAL",
     "ABQ_INCREMENT",
-)
+))
 
-abq_ms_target_method = (
+abq_ms_target_method = CATIAEnumeration('abq_ms_target_method', (
     "ABQ_BELOW_MIN",
     "ABQ_UNIFORM",
     "ABQ_SET_EQUAL",
-)
+))
 
-abq_output_at_sec_pts = (
+abq_output_at_sec_pts = CATIAEnumeration('abq_output_at_sec_pts', (
     "ABQDEFAULTSECPTS",
     "ABQALLSECPTS",
-)
+))
 
-abq_output_request_type = (
+abq_output_request_type = CATIAEnumeration('abq_output_request_type', (
     "ABQFIELD",
     "ABQHISTORY",
     "ABQDATA",
-)
+))
 
-abq_output_variable_type = (
+abq_output_variable_type = CATIAEnumeration('abq_output_variable_type', (
     "ABQPRESELECTEDEFVAR",
     "ABQALLVAR",
-)
+))
 
-abq_requested_modes_option = (
+abq_requested_modes_option = CATIAEnumeration('abq_requested_modes_option', (
     "ABQ_ALL",
     "ABQ_VALUE",
-)
+))
 
-abq_restart_option = (
+abq_restart_option = CATIAEnumeration('abq_restart_option', (
     "ABQ_RESTART_NONE",
     "ABQ_RESTART_EVERYINC",
     "ABQ_RESTART_SPECINC",
     "ABQ_RESTART_NUMINT",
     "ABQ_RESTART_LASTINC",
-)
+))
 
-abq_restart_read_option = (
+abq_restart_read_option = CATIAEnumeration('abq_restart_read_option', (
     "ABQ_RESTART_END_OF_STEP",
     "ABQ_RESTART_INTERVAL",
-)
+))
 
-abq_restart_read_step_sel_option = (
+abq_restart_read_step_sel_option = CATIAEnumeration('abq_restart_read_step_sel_option', (
     "ABQ_STEP_OBJECT",
     "ABQ_STEP_NUMBER",
-)
+))
 
-accuracy_type = (
+accuracy_type = CATIAEnumeration('accuracy_type', (
     "ACCURACY_TYPE_DISTANCE",
     "ACCURACY_TYPE_SPEED",
-)
+))
 
-adjust_method_type = (
+adjust_method_type = CATIAEnumeration('adjust_method_type', (
     "NOADJUST",
     "OVERCLOSED",
     "TOLERANCE",
-)
+))
 
-auto_time_increment_method = (
+auto_time_increment_method = CATIAEnumeration('auto_time_increment_method', (
     "ABQ_ATI_GLOBAL",
     "ABQ_ATI_ELEMENT_BY_ELEMENT",
-)
+))
 
-cat3_d_color_inheritance_mode = (
+cat3_d_color_inheritance_mode = CATIAEnumeration('cat3_d_color_inheritance_mode', (
     "cat3DColorInheritanceModeOff",
     "cat3DColorInheritanceModeOn",
-)
+))
 
-cat3_d_xml_geom_representation_type = (
+cat3_d_xml_geom_representation_type = CATIAEnumeration('cat3_d_xml_geom_representation_type', (
     "cat3DXmlExact",
     "cat3DXmlTessellation",
     "cat3DXmlCompressedTessellation",
     "cat3DXmlDynamicTessellation",
     "cat3DXmlStaticTessellation",
     "cat3DXmlXmlTessellation",
-)
+))
 
-cat3_d_xml_ppr_save_config = (
+cat3_d_xml_ppr_save_config = CATIAEnumeration('cat3_d_xml_ppr_save_config', (
     "cat3DXmlProductAndResourceList",
     "cat3DXmlProductList",
     "cat3DXmlResourceList",
-)
+))
 
-cat_algorithm_type = (
+cat_algorithm_type = CATIAEnumeration('cat_algorithm_type', (
     "catSimulatedAnnealing",
     "catGradient",
     "catCAAalgorithm",
     "catLocalForConstraints",
-)
+))
 
-cat_analysis_set_search_type = (
+cat_analysis_set_search_type = CATIAEnumeration('cat_analysis_set_search_type', (
     "catAnalysisSetSearchIn",
     "catAnalysisSetSearchOut",
     "catAnalysisSetSearchNeutral",
     "catAnalysisSetSearchAll",
-)
+))
 
-cat_analysis_set_type = (
+cat_analysis_set_type = CATIAEnumeration('cat_analysis_set_type', (
     "catAnalysisSetIn",
     "catAnalysisSetOut",
     "catAnalysisSetNeutral",
-)
+))
 
-cat_annotated_view_behavior = (
+cat_annotated_view_behavior = CATIAEnumeration('cat_annotated_view_behavior', (
     "CatAnnotatedViewBehaviorLink",
     "CatAnnotatedViewBehaviorUnlink",
-)
+))
 
-cat_annotation_set_type = (
+cat_annotation_set_type = CATIAEnumeration('cat_annotation_set_type', (
     "catAnnotationSetStandard",
     "catAnnotationSetLight",
     "catAnnotationSetResult",
-)
+))
 
-cat_arrange_style = (
+cat_arrange_style = CATIAEnumeration('cat_arrange_style', (
     "catArrangeCascade",
     "catArrangeTiledHorizontal",
     "catArrangeTiledVertical",
-)
+))
 
-cat_arrangement_area_visu_mode = (
+cat_arrangement_area_visu_mode = CATIAEnumeration('cat_arrangement_area_visu_mode', (
     "CatArrangementAreaVisuModeFlat",
     "CatArrangementAreaVisuModeSolid",
-)
+))
 
-cat_arrangement_item_res_visu_mode = (
+cat_arrangement_item_res_visu_mode = CATIAEnumeration('cat_arrangement_item_res_visu_mode', (
     "CatArrangementItemReservationVisuModeAxis",
     "CatArrangementItemReservationVisuModeFlat",
     "CatArrangementItemReservationVisuModeSolid",
-)
+))
 
-cat_arrangement_route_section = (
+cat_arrangement_route_section = CATIAEnumeration('cat_arrangement_route_section', (
     "CatArrangementRouteSectionNone",
     "CatArrangementRouteSectionRectangular",
     "CatArrangementRouteSectionRound",
     "CatArrangementRouteSectionFlatOval",
     "CatArrangementRouteSectionRadiusCorner",
     "CatArrangementRouteSectionDoubleRidge",
-)
+))
 
-cat_arrangement_route_visu_mode = (
+cat_arrangement_route_visu_mode = CATIAEnumeration('cat_arrangement_route_visu_mode', (
     "CatArrangementRouteVisuModeCurve",
     "CatArrangementRouteVisuModeFlat",
     "CatArrangementRouteVisuModeSolid",
-)
+))
 
-cat_asm_auto_switch_to_design_mode = (
+cat_asm_auto_switch_to_design_mode = CATIAEnumeration('cat_asm_auto_switch_to_design_mode', (
     "catAutoSwitchAvailable",
     "catAutoSwitchUnavailable",
-)
+))
 
-cat_asm_constraint_creation_mode = (
+cat_asm_constraint_creation_mode = CATIAEnumeration('cat_asm_constraint_creation_mode', (
     "catUseAnyGeometry",
     "catUsePublishedGeometryChildLevel",
     "catUsePublishedGeometryAnyLevel",
-)
+))
 
-cat_asm_extend_move_to_fix_t = (
+cat_asm_extend_move_to_fix_t = CATIAEnumeration('cat_asm_extend_move_to_fix_t', (
     "catNeverExtendMoveToFixT",
     "catAskIfExtendMoveToFixT",
     "catAlwaysExtendMoveToFixT",
-)
+))
 
-cat_asm_paste_component_mode = (
+cat_asm_paste_component_mode = CATIAEnumeration('cat_asm_paste_component_mode', (
     "catPasteWithoutCsts",
     "catPasteWithCstOnCopy",
     "catPasteWithCstOnCut",
     "catPasteWithCstOnCopyAndCut",
-)
+))
 
-cat_asm_quick_constraint_mode = (
+cat_asm_quick_constraint_mode = CATIAEnumeration('cat_asm_quick_constraint_mode', (
     "catSpecifiedOrder",
     "catVerifiedConstraintFirst",
-)
+))
 
-cat_asm_redundancy_mode = (
+cat_asm_redundancy_mode = CATIAEnumeration('cat_asm_redundancy_mode', (
     "catUnChecked",
     "catChecked",
-)
+))
 
-cat_asm_update_mode = (
+cat_asm_update_mode = CATIAEnumeration('cat_asm_update_mode', (
     "catManualUpdate",
     "catAutomaticUpdate",
-)
+))
 
-cat_asm_update_status_compute_mode = (
+cat_asm_update_status_compute_mode = CATIAEnumeration('cat_asm_update_status_compute_mode', (
     "catManualCompute",
     "catAutomaticCompute",
-)
+))
 
-cat_axis_orientation_type = (
+cat_axis_orientation_type = CATIAEnumeration('cat_axis_orientation_type', (
     "catSamCoordinateSystem_Cartesian",
     "catSamCoordinateSystem_Cylindrical",
     "catSamCoordinateSystem_Spherical",
     "catSamCoordinateSystem_Undefined",
-)
+))
 
-cat_axis_system_axis_type = (
+cat_axis_system_axis_type = CATIAEnumeration('cat_axis_system_axis_type', (
     "catAxisSystemAxisSameDirection",
     "catAxisSystemAxisByCoordinates",
     "catAxisSystemAxisOppositeDirection",
-)
+))
 
-cat_axis_system_main_type = (
+cat_axis_system_main_type = CATIAEnumeration('cat_axis_system_main_type', (
     "catAxisSystemStandard",
     "catAxisSystemAxisRotation",
     "catAxisSystemEulerAngles",
     "catAxisSystemExplicit",
-)
+))
 
-cat_axis_system_origin_type = (
+cat_axis_system_origin_type = CATIAEnumeration('cat_axis_system_origin_type', (
     "catAxisSystemOriginByPoint",
     "catAxisSystemOriginByCoordinates",
-)
+))
 
-cat_back_face_culling_mode = (
+cat_back_face_culling_mode = CATIAEnumeration('cat_back_face_culling_mode', (
     "CATBackFaceCullingOnSolidFaces",
     "CATBackFaceCullingOnAllFaces",
     "CATBackFaceCullingOnStandAloneFaces",
     "CATBackFaceCullingOnNoFaces",
-)
+))
 
-cat_banner_position = (
+cat_banner_position = CATIAEnumeration('cat_banner_position', (
     "catBannerPositionNone",
     "catBannerPositionBottom",
     "catBannerPositionTop",
     "catBannerPositionLeft",
     "catBannerPositionRight",
-)
+))
 
-cat_blanking_mode = (
+cat_blanking_mode = CATIAEnumeration('cat_blanking_mode', (
     "catBlankingInactive",
     "catBlankingActive",
     "catBlankingOnGeom",
-)
+))
 
-cat_camera_type = (
+cat_camera_type = CATIAEnumeration('cat_camera_type', (
     "catCamera2D",
     "catCamera3D",
-)
+))
 
-cat_capture_format = (
+cat_capture_format = CATIAEnumeration('cat_capture_format', (
     "catCaptureFormatCGM",
     "catCaptureFormatEMF",
     "catCaptureFormatTIFF",
     "catCaptureFormatTIFFGreyScale",
     "catCaptureFormatBMP",
     "catCaptureFormatJPEG",
-)
+))
 
-cat_chamfer_mode = (
+cat_chamfer_mode = CATIAEnumeration('cat_chamfer_mode', (
     "catTwoLengthChamfer",
     "catLengthAngleChamfer",
-)
+))
 
-cat_chamfer_orientation = (
+cat_chamfer_orientation = CATIAEnumeration('cat_chamfer_orientation', (
     "catNoReverseChamfer",
     "catReverseChamfer",
-)
+))
 
-cat_chamfer_propagation = (
+cat_chamfer_propagation = CATIAEnumeration('cat_chamfer_propagation', (
     "catTangencyChamfer",
     "catMinimalChamfer",
-)
+))
 
-cat_circular_pattern_parameters = (
+cat_circular_pattern_parameters = CATIAEnumeration('cat_circular_pattern_parameters', (
     "catInstancesandAngularSpacing",
     "catCompleteCrown",
     "catUnequalAngularSpacing",
-)
+))
 
-cat_clash_computation_type = (
+cat_clash_computation_type = CATIAEnumeration('cat_clash_computation_type', (
     "catClashComputationTypeBetweenAll",
     "catClashComputationTypeInsideOne",
     "catClashComputationTypeAgainstAll",
     "catClashComputationTypeBetweenTwo",
-)
+))
 
-cat_clash_export_type = (
+cat_clash_export_type = CATIAEnumeration('cat_clash_export_type', (
     "CatClashExportTypeXMLResultOnly",
-)
+))
 
-cat_clash_import_type = (
+cat_clash_import_type = CATIAEnumeration('cat_clash_import_type', (
     "CatClashImportTypeClashOnly",
     "CatClashImportTypeStructureAndClash",
-)
+))
 
-cat_clash_interference_type = (
+cat_clash_interference_type = CATIAEnumeration('cat_clash_interference_type', (
     "catClashInterferenceTypeContact",
     "catClashInterferenceTypeClearance",
     "catClashInterferenceAuthorizedPenetration",
     "catClashInterferenceCaseRule",
-)
+))
 
-cat_clipping_frame_reframe_on_mode = (
+cat_clipping_frame_reframe_on_mode = CATIAEnumeration('cat_clipping_frame_reframe_on_mode', (
     "catOnViewContent",
     "catOnViewBackground",
-)
+))
 
-cat_clipping_mode = (
+cat_clipping_mode = CATIAEnumeration('cat_clipping_mode', (
     "catClippingModeClear",
     "catClippingModeNear",
     "catClippingModeFar",
     "catClippingModeNearAndFar",
-)
+))
 
-cat_conflict_comparison = (
+cat_conflict_comparison = CATIAEnumeration('cat_conflict_comparison', (
     "catConflictComparisonNew",
     "catConflictComparisonOld",
     "catConflictComparisonNo",
-)
+))
 
-cat_conflict_status = (
+cat_conflict_status = CATIAEnumeration('cat_conflict_status', (
     "catConflictStatusNotInspected",
     "catConflictStatusRelevant",
     "catConflictStatusIrrelevant",
     "catConflictStatusSolved",
-)
+))
 
-cat_conflict_type = (
+cat_conflict_type = CATIAEnumeration('cat_conflict_type', (
     "catConflictTypeClash",
     "catConflictTypeContact",
     "catConflictTypeClearance",
-)
+))
 
-cat_constraint_angle_sector = (
+cat_constraint_angle_sector = CATIAEnumeration('cat_constraint_angle_sector', (
     "catCstAngleSector0",
     "catCstAngleSector1",
     "catCstAngleSector2",
     "catCstAngleSector3",
-)
+))
 
-cat_constraint_dist_config = (
+cat_constraint_dist_config = CATIAEnumeration('cat_constraint_dist_config', (
     "catCstDCUnspec",
     "catCstDCParallel",
     "catCstDCParallelSameOrient",
     "catCstDCParallelOppOrient",
-)
+))
 
-cat_constraint_dist_direction = (
+cat_constraint_dist_direction = CATIAEnumeration('cat_constraint_dist_direction', (
     "catCstDistDirectionNone",
     "catCstDistDirection1",
     "catCstDistDirection2",
     "catCstDistDirection3",
-)
+))
 
-cat_constraint_mode = (
+cat_constraint_mode = CATIAEnumeration('cat_constraint_mode', (
     "catCstModeDrivingDimension",
     "catCstModeDrivenDimension",
-)
+))
 
-cat_constraint_orientation = (
+cat_constraint_orientation = CATIAEnumeration('cat_constraint_orientation', (
     "catCstOrientSame",
     "catCstOrientOpposite",
     "catCstOrientUndefined",
-)
+))
 
-cat_constraint_ref_axis = (
+cat_constraint_ref_axis = CATIAEnumeration('cat_constraint_ref_axis', (
     "catCstRefAxisX",
     "catCstRefAxisY",
     "catCstRefAxisZ",
-)
+))
 
-cat_constraint_ref_type = (
+cat_constraint_ref_type = CATIAEnumeration('cat_constraint_ref_type', (
     "catCstRefTypeRelative",
     "catCstRefTypeFixInSpace",
-)
+))
 
-cat_constraint_side = (
+cat_constraint_side = CATIAEnumeration('cat_constraint_side', (
     "catCstSidePositive",
     "catCstSideNegative",
     "catCstSideSameAsValue",
     "catCstSideOppositeToValue",
     "catCstSideUndefined",
-)
+))
 
-cat_constraint_status = (
+cat_constraint_status = CATIAEnumeration('cat_constraint_status', (
     "catCstStatusOK",
     "catCstStatusKOStronglyNotSatisfied",
     "catCstStatusKOWrongOrientOrSide",
     "catCstStatusKOWrongValue",
     "catCstStatusKOWrongGeomEltType",
     "catCstStatusKOBroken",
-)
+))
 
-cat_constraint_type = (
+cat_constraint_type = CATIAEnumeration('cat_constraint_type', (
     "catCstTypeReference",
     "catCstTypeDistance",
     "catCstTypeOn",
@@ -446,25 +448,25 @@ cat_constraint_type = (
     "catCstTypeStDistance",
     "catCstTypeSdContinuity",
     "catCstTypeSdShape",
-)
+))
 
-cat_cs_hole_mode = (
+cat_cs_hole_mode = CATIAEnumeration('cat_cs_hole_mode', (
     "catCSModeDepthAngle",
     "catCSModeDepthDiameter",
     "catCSModeAngleDiameter",
-)
+))
 
-cat_dedicated_filter_type = (
+cat_dedicated_filter_type = CATIAEnumeration('cat_dedicated_filter_type', (
     "catDisplayInBackground",
     "catMaskInBackground",
-)
+))
 
-cat_description_length_type = (
+cat_description_length_type = CATIAEnumeration('cat_description_length_type', (
     "ShortText",
     "LongText",
-)
+))
 
-cat_dft_weld_finish_symbol = (
+cat_dft_weld_finish_symbol = CATIAEnumeration('cat_dft_weld_finish_symbol', (
     "catFinishWeldingNone",
     "catDftLetterCWelding",
     "catDftLetterFWelding",
@@ -473,14 +475,14 @@ cat_dft_weld_finish_symbol = (
     "catDftLetterMWelding",
     "catDftLetterRWelding",
     "catDftLetterUWelding",
-)
+))
 
-cat_dft_welding_tail = (
+cat_dft_welding_tail = CATIAEnumeration('cat_dft_welding_tail', (
     "catDftWeldingTailNO",
     "catDftWeldingTailYES",
-)
+))
 
-cat_dim_analyse = (
+cat_dim_analyse = CATIAEnumeration('cat_dim_analyse', (
     "catDimOnGenItems",
     "catUnUpdatableDim",
     "catFakeDim",
@@ -493,22 +495,22 @@ cat_dim_analyse = (
     "catIsolatedDim",
     "catDimOnHideGeom",
     "cat3DFeatureDim",
-)
+))
 
-cat_dim_dual_display = (
+cat_dim_dual_display = CATIAEnumeration('cat_dim_dual_display', (
     "catDualNone",
     "catDualBellow",
     "catDualFractional",
     "catDualSideBySide",
-)
+))
 
-cat_dim_fake = (
+cat_dim_fake = CATIAEnumeration('cat_dim_fake', (
     "catDimFakeNone",
     "catDimFakeNumValue",
     "catDimFakeText",
-)
+))
 
-cat_dim_frame = (
+cat_dim_frame = CATIAEnumeration('cat_dim_frame', (
     "catFraNone",
     "catFraCircle",
     "catFraScoredCircle",
@@ -518,29 +520,29 @@ cat_dim_frame = (
     "catFraOblong",
     "catFraRightFlag",
     "catFraRightTriangle",
-)
+))
 
-cat_dim_framed_element = (
+cat_dim_framed_element = CATIAEnumeration('cat_dim_framed_element', (
     "catFraValue",
     "catFraValueTol",
     "catFraValueTolText",
-)
+))
 
-cat_dim_framed_group = (
+cat_dim_framed_group = CATIAEnumeration('cat_dim_framed_group', (
     "catFraMain",
     "catFraDual",
     "catFraMainAndDual",
     "catFraBoth",
-)
+))
 
-cat_dim_line_graph_rep = (
+cat_dim_line_graph_rep = CATIAEnumeration('cat_dim_line_graph_rep', (
     "catDimLine1Part",
     "catDimLine2Parts",
     "catDimLineLeader1Part",
     "catDimLineLeader2Part",
-)
+))
 
-cat_dim_line_rep = (
+cat_dim_line_rep = CATIAEnumeration('cat_dim_line_rep', (
     "catDimUndef",
     "catDimHoriz",
     "catDimVert",
@@ -549,9 +551,9 @@ cat_dim_line_rep = (
     "catDimTrueDim",
     "catDimParallel",
     "catDimOffset",
-)
+))
 
-cat_dim_mode = (
+cat_dim_mode = CATIAEnumeration('cat_dim_mode', (
     "catDimClassical",
     "catDimCumulate",
     "catDimHalfDim",
@@ -559,30 +561,30 @@ cat_dim_mode = (
     "catDimStacked",
     "catDimCumulatesystem",
     "catDimHalfDimSystem",
-)
+))
 
-cat_dim_orientation = (
+cat_dim_orientation = CATIAEnumeration('cat_dim_orientation', (
     "catHorizontal",
     "catVertical",
     "catParallel",
     "catPerpandicular",
     "catAngle",
-)
+))
 
-cat_dim_reference = (
+cat_dim_reference = CATIAEnumeration('cat_dim_reference', (
     "catScreen",
     "catView",
     "catDimLine",
-)
+))
 
-cat_dim_score = (
+cat_dim_score = CATIAEnumeration('cat_dim_score', (
     "catDimScoreNone",
     "catDimUnderScored",
     "catDimScored",
     "catCATDrwDimOverScored",
-)
+))
 
-cat_dim_symbols = (
+cat_dim_symbols = CATIAEnumeration('cat_dim_symbols', (
     "catDimSymbNone",
     "catDimSymbOpenArrow",
     "catDimSymbClosedArrow",
@@ -597,9 +599,9 @@ cat_dim_symbols = (
     "catDimSymbFilledTriangle",
     "catDimSymbCross",
     "catDimSymbXCross",
-)
+))
 
-cat_dim_type = (
+cat_dim_type = CATIAEnumeration('cat_dim_type', (
     "catDimDistance",
     "catDimDistanceOffset",
     "catDimLength",
@@ -621,55 +623,55 @@ cat_dim_type = (
     "catDimDiameterTorus",
     "catDimRadiusTorus",
     "catDimDistanceMin",
-)
+))
 
-cat_distance_computation_type = (
+cat_distance_computation_type = CATIAEnumeration('cat_distance_computation_type', (
     "catDistanceComputationTypeInsideOne",
     "catDistanceComputationTypeAgainstAll",
     "catDistanceComputationTypeBetweenTwo",
-)
+))
 
-cat_distance_measure_type = (
+cat_distance_measure_type = CATIAEnumeration('cat_distance_measure_type', (
     "catDistanceMeasureTypeMinimum",
     "catDistanceMeasureTypeAlongX",
     "catDistanceMeasureTypeAlongY",
     "catDistanceMeasureTypeAlongZ",
     "catDistanceMeasureTypeBand",
-)
+))
 
-cat_dmu_group_preview_hidden_objects_display_mode = (
+cat_dmu_group_preview_hidden_objects_display_mode = CATIAEnumeration('cat_dmu_group_preview_hidden_objects_display_mode', (
     "CatDMUGroupPreviewShowHidden",
     "CatDMUGroupPreviewShowHiddenCustom",
-)
+))
 
-cat_doc_contextual_priority = (
+cat_doc_contextual_priority = CATIAEnumeration('cat_doc_contextual_priority', (
     "CATDocContextualTechDoc",
     "CATDocContextualUserComp",
-)
+))
 
-cat_draft_mode = (
+cat_draft_mode = CATIAEnumeration('cat_draft_mode', (
     "catStandardDraftMode",
     "catReflectKeepFaceDraftMode",
     "catReflectKeepEdgeDraftMode",
-)
+))
 
-cat_draft_multiselection_mode = (
+cat_draft_multiselection_mode = CATIAEnumeration('cat_draft_multiselection_mode', (
     "catNoneDraftMultiselectionMode",
     "catDraftMultiselectionByNeutralMode",
-)
+))
 
-cat_draft_neutral_propagation_mode = (
+cat_draft_neutral_propagation_mode = CATIAEnumeration('cat_draft_neutral_propagation_mode', (
     "catNoneDraftNeutralPropagationMode",
     "catSmoothDraftNeutralPropagationMode",
-)
+))
 
-cat_drawing_standard = (
+cat_drawing_standard = CATIAEnumeration('cat_drawing_standard', (
     "catANSI",
     "catISO",
     "catJIS",
-)
+))
 
-cat_drawing_view_type = (
+cat_drawing_view_type = CATIAEnumeration('cat_drawing_view_type', (
     "catViewBackground",
     "catViewFront",
     "catViewLeft",
@@ -686,51 +688,51 @@ cat_drawing_view_type = (
     "catViewMain",
     "catViewPure_Sketch",
     "catViewUnfolded",
-)
+))
 
-cat_drw_new_sheet_from = (
+cat_drw_new_sheet_from = CATIAEnumeration('cat_drw_new_sheet_from', (
     "catDrwFirstSheet",
     "catDrwStyle",
-)
+))
 
-cat_dxf_export_blocks_enum = (
+cat_dxf_export_blocks_enum = CATIAEnumeration('cat_dxf_export_blocks_enum', (
     "catDxfExportBlocksEnumNone",
     "catDxfExportBlocksEnum1Level",
     "catDxfExportBlocksEnumFull",
-)
+))
 
-cat_dxf_export_mode_enum = (
+cat_dxf_export_mode_enum = CATIAEnumeration('cat_dxf_export_mode_enum', (
     "catDxfExportModeEnumSemantic",
     "catDxfExportModeEnumGraphic",
-)
+))
 
-cat_dxf_export_sheets_enum = (
+cat_dxf_export_sheets_enum = CATIAEnumeration('cat_dxf_export_sheets_enum', (
     "catDxfExportSheetsEnumAll",
     "catDxfExportSheetsEnumOnlyCurrent",
-)
+))
 
-cat_dxf_export_version_enum = (
+cat_dxf_export_version_enum = CATIAEnumeration('cat_dxf_export_version_enum', (
     "catDxfExportVersionEnumR12",
     "catDxfExportVersionEnumR13",
     "catDxfExportVersionEnumR14",
     "catDxfExportVersionEnum2000",
     "catDxfExportVersionEnum2004",
     "catDxfExportVersionEnum2007",
-)
+))
 
-cat_dxf_import_create_end_points_enum = (
+cat_dxf_import_create_end_points_enum = CATIAEnumeration('cat_dxf_import_create_end_points_enum', (
     "catDxfImportCreateEndPointsEnumNever",
     "catDxfImportCreateEndPointsEnumFewEntities",
     "catDxfImportCreateEndPointsEnumAlways",
-)
+))
 
-cat_dxf_import_dimensions_enum = (
+cat_dxf_import_dimensions_enum = CATIAEnumeration('cat_dxf_import_dimensions_enum', (
     "catDxfImportDimensionsEnumDimensions",
     "catDxfImportDimensionsEnumDetails",
     "catDxfImportDimensionsEnumGeometry",
-)
+))
 
-cat_dxf_import_unit_enum = (
+cat_dxf_import_unit_enum = CATIAEnumeration('cat_dxf_import_unit_enum', (
     "catDxfImportUnitEnumMillimeter",
     "catDxfImportUnitEnumCentimeter",
     "catDxfImportUnitEnumMeter",
@@ -738,9 +740,9 @@ cat_dxf_import_unit_enum = (
     "catDxfImportUnitEnumFoot",
     "catDxfImportUnitEnumScaleFactor",
     "catDxfImportUnitEnumAutomatic",
-)
+))
 
-cat_electronic_type = (
+cat_electronic_type = CATIAEnumeration('cat_electronic_type', (
     "BOARD",
     "PANEL",
     "COMPONENT",
@@ -748,93 +750,93 @@ cat_electronic_type = (
     "PCBHOLE",
     "PCBPATTERN",
     "NOPCBBEHAVIOUR",
-)
+))
 
-cat_file_selection_mode = (
+cat_file_selection_mode = CATIAEnumeration('cat_file_selection_mode', (
     "CatFileSelectionModeOpen",
     "CatFileSelectionModeSave",
-)
+))
 
-cat_file_type = (
+cat_file_type = CATIAEnumeration('cat_file_type', (
     "catFileTypeText",
     "catFileTypeMotif",
     "catFileTypeHTML",
-)
+))
 
-cat_fillet_bitangency_type = (
+cat_fillet_bitangency_type = CATIAEnumeration('cat_fillet_bitangency_type', (
     "catSphereBitangencyType",
     "catCircleBitangencyType",
-)
+))
 
-cat_fillet_boundary_relimitation = (
+cat_fillet_boundary_relimitation = CATIAEnumeration('cat_fillet_boundary_relimitation', (
     "catAutomaticFilletBoundaryRelimitation",
     "catUVFilletBoundaryRelimitation",
     "catConnectFilletBoundaryRelimitation",
     "catMinimumFilletBoundaryRelimitation",
     "catMaximumFilletBoundaryRelimitation",
-)
+))
 
-cat_fillet_edge_propagation = (
+cat_fillet_edge_propagation = CATIAEnumeration('cat_fillet_edge_propagation', (
     "catMinimalFilletEdgePropagation",
     "catTangencyFilletEdgePropagation",
-)
+))
 
-cat_fillet_representation = (
+cat_fillet_representation = CATIAEnumeration('cat_fillet_representation', (
     "catFilletRepNone",
     "catFilletRepBoundary",
     "catFilletRepSymbolic",
     "catFilletRepOriginalEdge",
     "catFilletRepProjectedOriginalEdge",
-)
+))
 
-cat_fillet_trim_support = (
+cat_fillet_trim_support = CATIAEnumeration('cat_fillet_trim_support', (
     "catTrimFilletSupport",
     "catNoTrimFilletSupport",
-)
+))
 
-cat_fillet_variation = (
+cat_fillet_variation = CATIAEnumeration('cat_fillet_variation', (
     "catLinearFilletVariation",
     "catCubicFilletVariation",
-)
+))
 
-cat_fitting_shuttle_vector = (
+cat_fitting_shuttle_vector = CATIAEnumeration('cat_fitting_shuttle_vector', (
     "CATFittingShuttleVectorX",
     "CATFittingShuttleVectorY",
     "CATFittingShuttleVectorZ",
-)
+))
 
-cat_full_scene_anti_aliasing_mode = (
+cat_full_scene_anti_aliasing_mode = CATIAEnumeration('cat_full_scene_anti_aliasing_mode', (
     "CATFSAAMode_Deactivated",
     "CATFSAAMode_2xSuperSampling",
     "CATFSAAMode_4xSuperSampling",
     "CATFSAAMode_8xSuperSampling",
     "CATFSAAMode_16xSuperSampling",
-)
+))
 
-cat_funct_orientation_direction = (
+cat_funct_orientation_direction = CATIAEnumeration('cat_funct_orientation_direction', (
     "CATFunctNotOriented",
     "CATFunctOrientedUnidirectional",
     "CATFunctOrientedBidirectional",
-)
+))
 
-cat_gen_conferencing = (
+cat_gen_conferencing = CATIAEnumeration('cat_gen_conferencing', (
     "NetMeeting",
     "Backbone",
-)
+))
 
-cat_gen_data_save = (
+cat_gen_data_save = CATIAEnumeration('cat_gen_data_save', (
     "NoAutoBackup",
     "AutoBackupEvery",
     "IncrBackup",
-)
+))
 
-cat_gen_ui_style = (
+cat_gen_ui_style = CATIAEnumeration('cat_gen_ui_style', (
     "UIStyleP1",
     "UIStyleP2",
     "UIStyleP3",
-)
+))
 
-cat_geometric_type = (
+cat_geometric_type = CATIAEnumeration('cat_geometric_type', (
     "catGeoTypeUnknown",
     "catGeoTypeAxis2D",
     "catGeoTypePoint2D",
@@ -848,144 +850,144 @@ cat_geometric_type = (
     "catGeoTypePoint",
     "catGeoTypeLine",
     "catGeoTypePlane",
-)
+))
 
-cat_grid_position_mode = (
+cat_grid_position_mode = CATIAEnumeration('cat_grid_position_mode', (
     "catGridPositionMode_Absolute",
     "catGridPositionMode_Relative",
-)
+))
 
-cat_hidden_line_mode = (
+cat_hidden_line_mode = CATIAEnumeration('cat_hidden_line_mode', (
     "catHlrModeOff",
     "catHlrModeOn",
-)
+))
 
-cat_hole_anchor_mode = (
+cat_hole_anchor_mode = CATIAEnumeration('cat_hole_anchor_mode', (
     "catExtremPointHoleAnchor",
     "catMiddlePointHoleAnchor",
-)
+))
 
-cat_hole_bottom_type = (
+cat_hole_bottom_type = CATIAEnumeration('cat_hole_bottom_type', (
     "catFlatHoleBottom",
     "catVHoleBottom",
     "catTrimmedHoleBottom",
-)
+))
 
-cat_hole_thread_side = (
+cat_hole_thread_side = CATIAEnumeration('cat_hole_thread_side', (
     "catRightThreadSide",
     "catLeftThreadSide",
-)
+))
 
-cat_hole_thread_standard = (
+cat_hole_thread_standard = CATIAEnumeration('cat_hole_thread_standard', (
     "catHoleMetricThinPitch",
     "catHoleMetricThickPitch",
-)
+))
 
-cat_hole_threading_mode = (
+cat_hole_threading_mode = CATIAEnumeration('cat_hole_threading_mode', (
     "catThreadedHoleThreading",
     "catSmoothHoleThreading",
-)
+))
 
-cat_hole_type = (
+cat_hole_type = CATIAEnumeration('cat_hole_type', (
     "catSimpleHole",
     "catTaperedHole",
     "catCounterboredHole",
     "catCountersunkHole",
     "catCounterdrilledHole",
-)
+))
 
-cat_ig2_export_mode_enum = (
+cat_ig2_export_mode_enum = CATIAEnumeration('cat_ig2_export_mode_enum', (
     "catIg2ExportModeEnumSemantic",
     "catIg2ExportModeEnumStructured",
     "catIg2ExportModeEnumGraphic",
-)
+))
 
-cat_ig2_export_sheets_enum = (
+cat_ig2_export_sheets_enum = CATIAEnumeration('cat_ig2_export_sheets_enum', (
     "catIg2ExportSheetsEnumAll",
     "catIg2ExportSheetsEnumOnlyCurrent",
-)
+))
 
-cat_ig2_import_create_end_points_enum = (
+cat_ig2_import_create_end_points_enum = CATIAEnumeration('cat_ig2_import_create_end_points_enum', (
     "catIg2ImportCreateEndPointsEnumNever",
     "catIg2ImportCreateEndPointsEnumFewEntities",
     "catIg2ImportCreateEndPointsEnumAlways",
-)
+))
 
-cat_ig2_import_destination_view_enum = (
+cat_ig2_import_destination_view_enum = CATIAEnumeration('cat_ig2_import_destination_view_enum', (
     "catIg2ImportDestinationViewEnumWorkingViews",
     "catIg2ImportDestinationViewEnumBackground",
-)
+))
 
-cat_ig2_import_dimensions_enum = (
+cat_ig2_import_dimensions_enum = CATIAEnumeration('cat_ig2_import_dimensions_enum', (
     "catIg2ImportDimensionsEnumDimensions",
     "catIg2ImportDimensionsEnumDetails",
     "catIg2ImportDimensionsEnumGeometry",
-)
+))
 
-cat_ig2_import_unit_enum = (
+cat_ig2_import_unit_enum = CATIAEnumeration('cat_ig2_import_unit_enum', (
     "catIg2ImportUnitEnumMillimeter",
     "catIg2ImportUnitEnumCentimeter",
     "catIg2ImportUnitEnumMeter",
     "catIg2ImportUnitEnumInch",
     "catIg2ImportUnitEnumFoot",
     "catIg2ImportUnitEnumAutomatic",
-)
+))
 
-cat_image_rotation = (
+cat_image_rotation = CATIAEnumeration('cat_image_rotation', (
     "catImageNoRotation",
     "catImageRotation90",
     "catImageRotation180",
     "catImageRotation270",
     "catImageBestRotation",
-)
+))
 
-cat_image_view_mode = (
+cat_image_view_mode = CATIAEnumeration('cat_image_view_mode', (
     "catImageModeOff",
     "catImageModeHRD",
-)
+))
 
-cat_insure_view_names_uniqueness_scope = (
+cat_insure_view_names_uniqueness_scope = CATIAEnumeration('cat_insure_view_names_uniqueness_scope', (
     "catInSheet",
     "catInLayout",
-)
+))
 
-cat_justification = (
+cat_justification = CATIAEnumeration('cat_justification', (
     "catLeft",  # The text is left justified.
     "catCenter",  # The text is centered.
     "catRight",  # The text is right justified.
-)
+))
 
-cat_lighting_mode = (
+cat_lighting_mode = CATIAEnumeration('cat_lighting_mode', (
     "catInfiniteLightSource",
     "catNeonLightSource",
-)
+))
 
-cat_limit_mode = (
+cat_limit_mode = CATIAEnumeration('cat_limit_mode', (
     "catOffsetLimit",
     "catUpToNextLimit",
     "catUpToLastLimit",
     "catUpToPlaneLimit",
     "catUpToSurfaceLimit",
     "catUpThruNextLimit",
-)
+))
 
-cat_manip_auto_insert_mode = (
+cat_manip_auto_insert_mode = CATIAEnumeration('cat_manip_auto_insert_mode', (
     "CATOnMouseRelease",
     "CATWhileMouseMoving",
-)
+))
 
-cat_manip_clash_mode = (
+cat_manip_clash_mode = CATIAEnumeration('cat_manip_clash_mode', (
     "CATManipClashModeNo",
     "CATManipClashModeOn",
     "CATManipClashModeStop",
-)
+))
 
-cat_manufacturing_precedence_type = (
+cat_manufacturing_precedence_type = CATIAEnumeration('cat_manufacturing_precedence_type', (
     "catPrecedenceTypeJustBefore",
     "catPrecedenceTypeBefore",
-)
+))
 
-cat_marker2_d_type = (
+cat_marker2_d_type = CATIAEnumeration('cat_marker2_d_type', (
     "catMarker2DTypeLine",
     "catMarker2DTypeArrow",
     "catMarker2DTypeRectangle",
@@ -993,20 +995,20 @@ cat_marker2_d_type = (
     "catMarker2DTypeFreeHand",
     "catMarker2DTypeText",
     "catMarker2DTypePicture",
-)
+))
 
-cat_marker3_d_type = (
+cat_marker3_d_type = CATIAEnumeration('cat_marker3_d_type', (
     "catMarker3DTypeText",
-)
+))
 
-cat_marker_text_orientation = (
+cat_marker_text_orientation = CATIAEnumeration('cat_marker_text_orientation', (
     "CatMarkerTextOrientationRight",
     "CatMarkerTextOrientationUp",
     "CatMarkerTextOrientationLeft",
     "CatMarkerTextOrientationDown",
-)
+))
 
-cat_measurable_name = (
+cat_measurable_name = CATIAEnumeration('cat_measurable_name', (
     "CatMeasurableUnknown",
     "CatMeasurable",
     "CatMeasurableVolume",
@@ -1020,48 +1022,48 @@ cat_measurable_name = (
     "CatMeasurableLine",
     "CatMeasurablePoint",
     "CatMeasurableAxisSystem",
-)
+))
 
-cat_merge_mode = (
+cat_merge_mode = CATIAEnumeration('cat_merge_mode', (
     "catMergeOff",
     "catMergeOn",
-)
+))
 
-cat_multi_selection_mode = (
+cat_multi_selection_mode = CATIAEnumeration('cat_multi_selection_mode', (
     "CATMonoSel",
     "CATMultiSelTriggWhenSelPerf",
     "CATMultiSelTriggWhenUserValidatesSelection",
-)
+))
 
-cat_navigation_style = (
+cat_navigation_style = CATIAEnumeration('cat_navigation_style', (
     "catNavigationExamine",
     "catNavigationWalk",
     "catNavigationFly",
-)
+))
 
-cat_optimization_type = (
+cat_optimization_type = CATIAEnumeration('cat_optimization_type', (
     "catMinimum",
     "catMaximum",
     "catTargetValue",
     "catOnlyBoundedVariation",
     "catNone",
     "catCstOnly",
-)
+))
 
-cat_out_put_format_type = (
+cat_out_put_format_type = CATIAEnumeration('cat_out_put_format_type', (
     "KWEHtml",
     "KWEText",
     "KWEPrint",
     "KWEEmail",
-)
+))
 
-cat_paper_orientation = (
+cat_paper_orientation = CATIAEnumeration('cat_paper_orientation', (
     "catPaperPortrait",
     "catPaperLandscape",
     "catPaperBestFit",
-)
+))
 
-cat_paper_size = (
+cat_paper_size = CATIAEnumeration('cat_paper_size', (
     "catPaperLetter",
     "catPaperLegal",
     "catPaperA0",
@@ -1076,107 +1078,107 @@ cat_paper_size = (
     "catPaperE",
     "catPaperF",
     "catPaperUser",
-)
+))
 
-cat_part_elements_naming_mode = (
+cat_part_elements_naming_mode = CATIAEnumeration('cat_part_elements_naming_mode', (
     "catNoNamingCheck",
     "catNamingCheckUnderSameNode",
     "catNamingCheckWithinUIActiveObject",
-)
+))
 
-cat_part_surface_elements_location = (
+cat_part_surface_elements_location = CATIAEnumeration('cat_part_surface_elements_location', (
     "catPartBodyLocation",
     "catXGSLocation",
-)
+))
 
-cat_part_update_mode = (
+cat_part_update_mode = CATIAEnumeration('cat_part_update_mode', (
     "catManualUpdate",
     "catAutomaticUpdate",
-)
+))
 
-cat_picture_format = (
+cat_picture_format = CATIAEnumeration('cat_picture_format', (
     "catPictureNONE",
     "catPicturePNG",
     "catPictureJPEG",
     "catPictureCCITTG3",
-)
+))
 
-cat_points_projection_mode = (
+cat_points_projection_mode = CATIAEnumeration('cat_points_projection_mode', (
     "catPointsProjectionModeOff",
     "catPointsProjectionModeOn",
-)
+))
 
-cat_print_color = (
+cat_print_color = CATIAEnumeration('cat_print_color', (
     "catColorTrueColor",
     "catColorGreyScale",
     "catColorMonochrome",
-)
+))
 
-cat_print_line_cap = (
+cat_print_line_cap = CATIAEnumeration('cat_print_line_cap', (
     "catPrintFlat",
     "catPrintSquare",
     "catPrintRound",
-)
+))
 
-cat_print_line_specification = (
+cat_print_line_specification = CATIAEnumeration('cat_print_line_specification', (
     "catPrintAbsolute",
     "catPrintScaled",
     "catPrintNoThickness",
-)
+))
 
-cat_print_quality = (
+cat_print_quality = CATIAEnumeration('cat_print_quality', (
     "catPrintQualityDraft",
     "catPrintQualityLow",
     "catPrintQualityMedium",
     "catPrintQualityHigh",
     "catPrintQualityCustom",
-)
+))
 
-cat_print_rendering_mode = (
+cat_print_rendering_mode = CATIAEnumeration('cat_print_rendering_mode', (
     "catPrintRenderingModeDefault",
     "catPrintRenderingModeWireframe",
     "catPrintRenderingModeHiddenLineRemoval",
     "catPrintRenderingModeShadingWithTriangles",
     "catPrintRenderingModeDynamicHiddenLineRemoval",
     "catPrintRenderingModeOnScreen",
-)
+))
 
-cat_printer_dir_state = (
+cat_printer_dir_state = CATIAEnumeration('cat_printer_dir_state', (
     "CatPrinterDirFree",
     "CatPrinterDirProtect",
-)
+))
 
-cat_prism_extrusion_direction = (
+cat_prism_extrusion_direction = CATIAEnumeration('cat_prism_extrusion_direction', (
     "catNormalToSketchDirection",
     "catNotNormalToSketchDirection",
-)
+))
 
-cat_prism_orientation = (
+cat_prism_orientation = CATIAEnumeration('cat_prism_orientation', (
     "catRegularOrientation",
     "catInverseOrientation",
-)
+))
 
-cat_product_source = (
+cat_product_source = CATIAEnumeration('cat_product_source', (
     "catProductSourceUnknown",
     "catProductMade",
     "catProductBought",
-)
+))
 
-cat_proj_view_type = (
+cat_proj_view_type = CATIAEnumeration('cat_proj_view_type', (
     "catRightView",
     "catLeftView",
     "catTopView",
     "catBottomView",
     "catRearView",
-)
+))
 
-cat_projection_mode = (
+cat_projection_mode = CATIAEnumeration('cat_projection_mode', (
     "catProjectionConic",
     "catProjectionCylindric",
     "catProjectionUndefined",
-)
+))
 
-cat_psp_idl_application_id = (
+cat_psp_idl_application_id = CATIAEnumeration('cat_psp_idl_application_id', (
     "catPspIDLCATPiping",
     "catPspIDLCATHVAC",
     "catPspIDLCATEquipment",
@@ -1192,17 +1194,17 @@ cat_psp_idl_application_id = (
     "catPspIDLCATTubingDiagram",
     "catPspIDLCATWaveguideDiagram",
     "catPspIDLCATElectricalDiagram",
-)
+))
 
-cat_psp_idl_attr_data_type = (
+cat_psp_idl_attr_data_type = CATIAEnumeration('cat_psp_idl_attr_data_type', (
     "catPspIDLInteger",
     "catPspIDLDouble",
     "catPspIDLString",
     "catPspIDLMultiString",
     "catPspIDLBoolean",
-)
+))
 
-cat_psp_idl_domain_id = (
+cat_psp_idl_domain_id = CATIAEnumeration('cat_psp_idl_domain_id', (
     "catPspIDLNone",
     "catPspIDLCATPIP",
     "catPspIDLCATINS",
@@ -1216,32 +1218,32 @@ cat_psp_idl_domain_id = (
     "catPspIDLCATHGR",
     "catPspIDLCATCAM",
     "catPspIDLCATELE",
-)
+))
 
-cat_psp_idl_flow_capability = (
+cat_psp_idl_flow_capability = CATIAEnumeration('cat_psp_idl_flow_capability', (
     "catPspIDLFlowCapability_Undefined",
     "catPspIDLFlowCapability_InDirection",
     "catPspIDLFlowCapability_OutDirection",
     "catPspIDLFlowCapability_InOutDirection",
-)
+))
 
-cat_psp_idl_flow_reality = (
+cat_psp_idl_flow_reality = CATIAEnumeration('cat_psp_idl_flow_reality', (
     "catPspIDLFlowReality_Undefined",
     "catPspIDLFlowReality_InDirection",
     "catPspIDLFlowReality_OutDirection",
     "catPspIDLFlowReality_InOutDirection",
-)
+))
 
-cat_psp_idl_function_status = (
+cat_psp_idl_function_status = CATIAEnumeration('cat_psp_idl_function_status', (
     "catPspIDLFuncUndefined",
     "catPspIDLInFuncNet",
     "catPspIDLFuncNetPhysType",
     "catPspIDLFuncNetPhysNoPos",
     "catPspIDLFuncNoNetPhys",
     "catPspIDLFuncNetPhys",
-)
+))
 
-cat_psp_idl_part_connector_type = (
+cat_psp_idl_part_connector_type = CATIAEnumeration('cat_psp_idl_part_connector_type', (
     "catPspIDLPartCtrTypeNotRecognized",
     "catPspIDLPartCtrTypeFace",
     "catPspIDLPartCtrTypeSupport",
@@ -1257,14 +1259,14 @@ cat_psp_idl_part_connector_type = (
     "catPspIDLPartCtrTypeCircular",
     "catPspIDLPartCtrTypeRectangular",
     "catPspIDLPartCtrTypeUpOnly",
-)
+))
 
-cat_rectangular_pattern_parameters = (
+cat_rectangular_pattern_parameters = CATIAEnumeration('cat_rectangular_pattern_parameters', (
     "catInstancesandSpacing",
     "catUnequalSpacing",
-)
+))
 
-cat_rendering_mode = (
+cat_rendering_mode = CATIAEnumeration('cat_rendering_mode', (
     "catRenderShading",
     "catRenderShadingWithEdges",
     "catRenderWireFrame",
@@ -1288,231 +1290,231 @@ cat_rendering_mode = (
     "catRenderQuickHiddenLinesRemovalWithHalfSmoothEdgeWithoutVertices",
     "catRenderShadingWithEdgesWithHalfSmoothEdgeWithoutVertices",
     "catRenderShadingWithEdgesWithHalfSmoothEdge",
-)
+))
 
-cat_rep_type = (
+cat_rep_type = CATIAEnumeration('cat_rep_type', (
     "catRep3D",
     "catRep2D",
     "catRepText",
-)
+))
 
-cat_representation_mode = (
+cat_representation_mode = CATIAEnumeration('cat_representation_mode', (
     "catExactMode",
     "catPolyhedricMode",
     "catVisualMode",
-)
+))
 
-cat_sac_settings_enum = (
+cat_sac_settings_enum = CATIAEnumeration('cat_sac_settings_enum', (
     "CatSacSettingsEnumNoInsert",
     "CatSacSettingsEnumAutomatic",
     "CatSacSettingsEnumUserPrompt",
-)
+))
 
-cat_sampled_analysis_mode = (
+cat_sampled_analysis_mode = CATIAEnumeration('cat_sampled_analysis_mode', (
     "CatSampledAnalysisOff",
     "CatSampledAnalysisOn",
     "CatSampledAnalysisStop",
     "CatSampledAnalysisVerbose",
-)
+))
 
-cat_sampled_split_type = (
+cat_sampled_split_type = CATIAEnumeration('cat_sampled_split_type', (
     "CatSampledSplitOnSeg",
     "CatSampledSplitOnShot",
-)
+))
 
-cat_scene_type = (
+cat_scene_type = CATIAEnumeration('cat_scene_type', (
     "CatSceneTypeDelta",
     "CatSceneTypeFull",
-)
+))
 
-cat_sch_idl_application_id = (
+cat_sch_idl_application_id = CATIAEnumeration('cat_sch_idl_application_id', (
     "catSchIDLCATPID",
     "catSchIDLCATHVACDiagram",
     "catSchIDLCATWaveguideDiagram",
     "catSchIDLCATTubingDiagram",
     "catSchIDLCATElectricalDiagram",
-)
+))
 
-cat_sch_idl_arrow_frequency = (
+cat_sch_idl_arrow_frequency = CATIAEnumeration('cat_sch_idl_arrow_frequency', (
     "catSchIDLArrowAllSegs",
     "catSchIDLArrowAllButLastSeg",
     "catSchIDLArrowInteriorSegs",
     "catSchIDLArrowMiddleSeg",
-)
+))
 
-cat_sch_idl_arrow_position = (
+cat_sch_idl_arrow_position = CATIAEnumeration('cat_sch_idl_arrow_position', (
     "catSchIDLMidSegArrow",
     "catSchIDLEndSegArrow",
-)
+))
 
-cat_sch_idl_arrow_style = (
+cat_sch_idl_arrow_style = CATIAEnumeration('cat_sch_idl_arrow_style', (
     "catSchIDLFillArrow",
     "catSchIDLNotFillArrow",
     "catSchIDLStandardArrow",
-)
+))
 
-cat_sch_idl_cntr_flow_capability = (
+cat_sch_idl_cntr_flow_capability = CATIAEnumeration('cat_sch_idl_cntr_flow_capability', (
     "catSchIDLCntrFlowCapability_Undefined",
     "catSchIDLCntrFlowCapability_InDirection",
     "catSchIDLCntrFlowCapability_OutDirection",
     "catSchIDLCntrFlowCapability_InOutDirection",
-)
+))
 
-cat_sch_idl_cntr_flow_reality = (
+cat_sch_idl_cntr_flow_reality = CATIAEnumeration('cat_sch_idl_cntr_flow_reality', (
     "catSchIDLCntrFlowReality_Undefined",
     "catSchIDLCntrFlowReality_InDirection",
     "catSchIDLCntrFlowReality_OutDirection",
     "catSchIDLCntrFlowReality_InOutDirection",
-)
+))
 
-cat_sch_idl_cntr_symbol_type = (
+cat_sch_idl_cntr_symbol_type = CATIAEnumeration('cat_sch_idl_cntr_symbol_type', (
     "catSchIDLCntrSymbol_Undefined",
     "catSchIDLCntrSymbol_Point",
     "catSchIDLCntrSymbol_PtVector",
     "catSchIDLCntrSymbol_OnOffSheet",
     "catSchIDLCntrSymbol_LineBoundary",
-)
+))
 
-cat_sch_idl_display_mode = (
+cat_sch_idl_display_mode = CATIAEnumeration('cat_sch_idl_display_mode', (
     "catSchIDLDisplayMode_Default",
     "catSchIDLDisplayMode_Alternate",
-)
+))
 
-cat_sch_idl_extension_type = (
+cat_sch_idl_extension_type = CATIAEnumeration('cat_sch_idl_extension_type', (
     "catSchIDLComponent_Extension",
     "catSchIDLRoute_Extension",
     "catSchIDLCompConnector_Extension",
     "catSchIDLRouteConnector_Extension",
     "catSchIDLZone_Extension",
-)
+))
 
-cat_sch_idl_gap_priority = (
+cat_sch_idl_gap_priority = CATIAEnumeration('cat_sch_idl_gap_priority', (
     "catSchIDLGapThisRoute",
     "catSchIDLGapInputRoute",
     "catSchIDLGapNoPriority",
     "catSchIDLGapHorizontalSeg",
     "catSchIDLGapVerticalSeg",
-)
+))
 
-cat_sch_idl_gap_style = (
+cat_sch_idl_gap_style = CATIAEnumeration('cat_sch_idl_gap_style', (
     "catSchIDLBlankGap",
     "catSchIDLJumpGap",
     "catSchIDLWavyGap",
-)
+))
 
-cat_sch_idl_internal_flow_status = (
+cat_sch_idl_internal_flow_status = CATIAEnumeration('cat_sch_idl_internal_flow_status', (
     "catSchIDLInternFlowStatus_Undefined",
     "catSchIDLInternFlowStatus_Open",
     "catSchIDLInternFlowStatus_Close",
-)
+))
 
-cat_sch_idl_internal_flow_type = (
+cat_sch_idl_internal_flow_type = CATIAEnumeration('cat_sch_idl_internal_flow_type', (
     "catSchIDLInternFlowType_Undefined",
     "catSchIDLInternFlowType_Corner",
     "catSchIDLInternFlowType_Linear",
-)
+))
 
-cat_sch_idl_multi_image_status = (
+cat_sch_idl_multi_image_status = CATIAEnumeration('cat_sch_idl_multi_image_status', (
     "catSchIDLImage_IsUpToDate",
     "catSchIDLImage_MasterNotFound",
     "catSchIDLImage_MasterDocNotFound",
     "catSchIDLImage_InvalidReference",
     "catSchIDLImage_AttrsNotUpToDate",
-)
+))
 
-cat_sch_idl_route_alternate_graphic_style = (
+cat_sch_idl_route_alternate_graphic_style = CATIAEnumeration('cat_sch_idl_route_alternate_graphic_style', (
     "catSchIDLRouteAlternateGraphicStyle_ellipse",
-)
+))
 
-cat_sch_idl_route_compress_mode = (
+cat_sch_idl_route_compress_mode = CATIAEnumeration('cat_sch_idl_route_compress_mode', (
     "catSchIDLCompressOff",
     "catSchIDLCompressOn",
-)
+))
 
-cat_sch_idl_route_mode = (
+cat_sch_idl_route_mode = CATIAEnumeration('cat_sch_idl_route_mode', (
     "catSchIDLRouteMode_Undefined",
     "catSchIDLRouteMode_HorizontalVertical",
     "catSchIDLRouteMode_HorizontalVertical45",
     "catSchIDLRouteMode_PointToPoint",
     "catSchIDLRouteMode_AroundObject",
-)
+))
 
-cat_sch_idl_route_symbol_update_mode = (
+cat_sch_idl_route_symbol_update_mode = CATIAEnumeration('cat_sch_idl_route_symbol_update_mode', (
     "catSchIDLSymbolUpdateOff",
     "catSchIDLSymbolUpdateOn",
-)
+))
 
-cat_sch_idl_route_unset_gaps_mode = (
+cat_sch_idl_route_unset_gaps_mode = CATIAEnumeration('cat_sch_idl_route_unset_gaps_mode', (
     "catSchIDLUnsetGapsOff",
     "catSchIDLUnsetGapsOn",
-)
+))
 
-cat_sch_idlgrr_route_reshape_mode = (
+cat_sch_idlgrr_route_reshape_mode = CATIAEnumeration('cat_sch_idlgrr_route_reshape_mode', (
     "catSchIDLFixedShapeOff",
     "catSchIDLFixedShapeOn",
-)
+))
 
-cat_script_language = (
+cat_script_language = CATIAEnumeration('cat_script_language', (
     "CATVBScriptLanguage",
     "CATVBALanguage",
     "CATBasicScriptLanguage",
     "CATJavaLanguage",
     "CATJScriptLanguage",
-)
+))
 
-cat_script_library_type = (
+cat_script_library_type = CATIAEnumeration('cat_script_library_type', (
     "catScriptLibraryTypeDocument",
     "catScriptLibraryTypeDirectory",
     "catScriptLibraryTypeVBAProject",
-)
+))
 
-cat_search_context_scope = (
+cat_search_context_scope = CATIAEnumeration('cat_search_context_scope', (
     "Everywhere",
     "InWorkbench",
     "FromWorkbench",
     "FromSelection",
     "VisibleOnScreen",
-)
+))
 
-cat_sec_window_open_mode = (
+cat_sec_window_open_mode = CATIAEnumeration('cat_sec_window_open_mode', (
     "catSecWindow_DefaultSize",
     "catSecWindow_TileVertically",
-)
+))
 
-cat_section_behavior = (
+cat_section_behavior = CATIAEnumeration('cat_section_behavior', (
     "catSectionBehaviorManual",
     "catSectionBehaviorAutomatic",
     "catSectionBehaviorFreeze",
-)
+))
 
-cat_section_clipping_mode = (
+cat_section_clipping_mode = CATIAEnumeration('cat_section_clipping_mode', (
     "catSection_Software",
     "catSection_OpenGL",
-)
+))
 
-cat_section_grid_style = (
+cat_section_grid_style = CATIAEnumeration('cat_section_grid_style', (
     "catSectionGridStyle_Lines",
     "catSectionGridStyle_Crosses",
-)
+))
 
-cat_section_plane_normal = (
+cat_section_plane_normal = CATIAEnumeration('cat_section_plane_normal', (
     "catSectionNormal_X",
     "catSectionNormal_Y",
     "catSectionNormal_Z",
-)
+))
 
-cat_section_plane_origin = (
+cat_section_plane_origin = CATIAEnumeration('cat_section_plane_origin', (
     "catSectionOrigin_0",
     "catSectionOrigin_Selection",
-)
+))
 
-cat_section_type = (
+cat_section_type = CATIAEnumeration('cat_section_type', (
     "catSectionTypePlane",
     "catSectionTypeSlice",
     "catSectionTypeBox",
-)
+))
 
-cat_selection_filter = (
+cat_selection_filter = CATIAEnumeration('cat_selection_filter', (
     "ZeroDim",
     "MonoDim",
     "MonoDimInfinite",
@@ -1524,98 +1526,98 @@ cat_selection_filter = (
     "PlanarBiDimInfinite",
     "CylindricalBiDim",
     "TriDim",
-)
+))
 
-cat_sewing_intersection_mode = (
+cat_sewing_intersection_mode = CATIAEnumeration('cat_sewing_intersection_mode', (
     "catSewingNoIntersect",
     "catSewingIntersect",
-)
+))
 
-cat_sheet_gen_views_pos_mode = (
+cat_sheet_gen_views_pos_mode = CATIAEnumeration('cat_sheet_gen_views_pos_mode', (
     "catFixedCG",
     "catFixedAxis",
-)
+))
 
-cat_sheet_projection_method = (
+cat_sheet_projection_method = CATIAEnumeration('cat_sheet_projection_method', (
     "catFirstAngle",
     "catThirdAngle",
-)
+))
 
-cat_show_result_type = (
+cat_show_result_type = CATIAEnumeration('cat_show_result_type', (
     "ByRule",
     "ByObject",
     "ByState",
-)
+))
 
-cat_shuttle_move_mode = (
+cat_shuttle_move_mode = CATIAEnumeration('cat_shuttle_move_mode', (
     "CatShuttle",
     "CatAxis",
-)
+))
 
-cat_shuttle_vector = (
+cat_shuttle_vector = CATIAEnumeration('cat_shuttle_vector', (
     "CatShuttleVectorX",
     "CatShuttleVectorY",
     "CatShuttleVectorZ",
-)
+))
 
-cat_solve_type = (
+cat_solve_type = CATIAEnumeration('cat_solve_type', (
     "ManualSolveType",
     "AutomaticOptimizedSolveType",
     "AutomaticCompleteSolveType",
-)
+))
 
-cat_specs_and_geom_window_layout = (
+cat_specs_and_geom_window_layout = CATIAEnumeration('cat_specs_and_geom_window_layout', (
     "catWindowSpecsOnly",
     "catWindowGeomOnly",
     "catWindowSpecsAndGeom",
-)
+))
 
-cat_specs_layout = (
+cat_specs_layout = CATIAEnumeration('cat_specs_layout', (
     "catSpecsViewerHorizontalIndented",
     "catSpecsViewerHorizontalUp",
     "catSpecsViewerHorizontalCentered",
     "catSpecsViewerVerticalCentered",
     "catSpecsViewerHorizontalRelational",
     "catSpecsViewerVerticalRelational",
-)
+))
 
-cat_split_side = (
+cat_split_side = CATIAEnumeration('cat_split_side', (
     "catPositiveSide",
     "catNegativeSide",
-)
+))
 
-cat_str_creation_mode = (
+cat_str_creation_mode = CATIAEnumeration('cat_str_creation_mode', (
     "catStrPartMode",
     "catStrSheetMetalMode",
-)
+))
 
-cat_str_cutback_type = (
+cat_str_cutback_type = CATIAEnumeration('cat_str_cutback_type', (
     "catStrNoneType",
     "catStrNormalType",
     "catStrWeldedType",
     "catStrMiteredType",
     "catStrNotchingType",
-)
+))
 
-cat_str_link_mode = (
+cat_str_link_mode = CATIAEnumeration('cat_str_link_mode', (
     "catStrWithLinkMode",
     "catStrNoLinkMode",
     "catStrRefRefWithLinkMode",
     "catStrRefRefNoLinkMode",
-)
+))
 
-cat_str_material_orientation = (
+cat_str_material_orientation = CATIAEnumeration('cat_str_material_orientation', (
     "catStrStandardOrientation",
     "catStrReverseOrientation",
-)
+))
 
-cat_str_member_extremity = (
+cat_str_member_extremity = CATIAEnumeration('cat_str_member_extremity', (
     "catStartExtremity",
     "catEndExtremity",
     "catBothExtremity",
-)
+))
 
-cat_str_placement_point = (
+cat_str_placement_point = CATIAEnumeration('cat_str_placement_point', (
     "catStrDefault",
     "catStrBottomLeft",
     "catStrBottomCenter",
@@ -1632,15 +1634,15 @@ cat_str_placement_point = (
     "catStrGravityRight",
     "catStrGravityTop",
     "catStrUserPoint",
-)
+))
 
-cat_str_plane_mode = (
+cat_str_plane_mode = CATIAEnumeration('cat_str_plane_mode', (
     "catStrNoneMode",
     "catStrOnPlane",
     "catStrParallelToPlane",
-)
+))
 
-cat_str_section_properties = (
+cat_str_section_properties = CATIAEnumeration('cat_str_section_properties', (
     "CatStrArea",
     "CatStrInertiaXX",
     "CatStrInertiaYY",
@@ -1648,9 +1650,9 @@ cat_str_section_properties = (
     "CatStrModuleInertiaY",
     "CatStrGirationModuleX",
     "CatStrGirationModuleY",
-)
+))
 
-cat_symbol_type = (
+cat_symbol_type = CATIAEnumeration('cat_symbol_type', (
     "catNotUsed",
     "catCross",
     "catPlus",
@@ -1683,9 +1685,9 @@ cat_symbol_type = (
     "catManipulatorTriangle",
     "catDoubleOpenArrow",
     "catWave",
-)
+))
 
-cat_table_border_type = (
+cat_table_border_type = CATIAEnumeration('cat_table_border_type', (
     "CatTableNone",
     "CatTableLeft",
     "CatTableTop",
@@ -1698,20 +1700,20 @@ cat_table_border_type = (
     "CatTableOutLine",
     "CatTableInside",
     "CatTableCross",
-)
+))
 
-cat_table_compute_mode = (
+cat_table_compute_mode = CATIAEnumeration('cat_table_compute_mode', (
     "CatTableComputeOFF",
     "CatTableComputeON",
-)
+))
 
-cat_table_invert_mode = (
+cat_table_invert_mode = CATIAEnumeration('cat_table_invert_mode', (
     "CatInvertColumn",
     "CatInvertRow",
     "CatInvertAll",
-)
+))
 
-cat_table_position = (
+cat_table_position = CATIAEnumeration('cat_table_position', (
     "CatTableTopLeft",
     "CatTableMiddleLeft",
     "CatTableBottomLeft",
@@ -1721,9 +1723,9 @@ cat_table_position = (
     "CatTableTopRight",
     "CatTableMiddleRight",
     "CatTableBottomRight",
-)
+))
 
-cat_text_anchor_position = (
+cat_text_anchor_position = CATIAEnumeration('cat_text_anchor_position', (
     "catUnsusedValue1",
     "catTopLeft",
     "catMiddleLeft",
@@ -1744,17 +1746,17 @@ cat_text_anchor_position = (
     "catCapRight",
     "catHalfRight",
     "catBaseRight",
-)
+))
 
-cat_text_flip_mode = (
+cat_text_flip_mode = CATIAEnumeration('cat_text_flip_mode', (
     "catTextNoFlip",
     "catTextHorizontalFlip",
     "catTextVerticalFlip",
     "catTextHorizontalAndVerticalFlip",
     "catTextAutoFlip",
-)
+))
 
-cat_text_frame_type = (
+cat_text_frame_type = CATIAEnumeration('cat_text_frame_type', (
     "catNone",
     "catRectangle",
     "catSquare",
@@ -1768,9 +1770,9 @@ cat_text_frame_type = (
     "catOblong",
     "catEllipse",
     "catCustom",
-)
+))
 
-cat_text_property = (
+cat_text_property = CATIAEnumeration('cat_text_property', (
     "catBold",  # The text is formatted as bold.
     "catItalic",  # The text is formatted as italic.
     "catUnderline",  # The text is underlined.
@@ -1790,9 +1792,9 @@ cat_text_property = (
     "catCharSpacing",  # Space between each character.
                        # The value is a percentage of the font size (maybe a negative value).
     "catKerning",
-)
+))
 
-cat_thread_linked_to = (
+cat_thread_linked_to = CATIAEnumeration('cat_thread_linked_to', (
     "catNotDefined",
     "catNoLink",
     "cat2DPoint",
@@ -1800,65 +1802,65 @@ cat_thread_linked_to = (
     "cat3DGeom",
     "cat3DHole",
     "cat3DThread",
-)
+))
 
-cat_thread_polarity = (
+cat_thread_polarity = CATIAEnumeration('cat_thread_polarity', (
     "catThread",
     "catTap",
-)
+))
 
-cat_thread_side = (
+cat_thread_side = CATIAEnumeration('cat_thread_side', (
     "catRightSide",
     "catLeftSide",
-)
+))
 
-cat_thread_standard = (
+cat_thread_standard = CATIAEnumeration('cat_thread_standard', (
     "catMetricThinPitch",
     "catMetricThickPitch",
-)
+))
 
-cat_thread_type = (
+cat_thread_type = CATIAEnumeration('cat_thread_type', (
     "catThreaded",
     "catTaped",
-)
+))
 
-cat_tree_orientation_enum = (
+cat_tree_orientation_enum = CATIAEnumeration('cat_tree_orientation_enum', (
     "catTreeOrientationVertical",
     "catTreeOrientationHorizontal",
-)
+))
 
-cat_tree_size_type_enum = (
+cat_tree_size_type_enum = CATIAEnumeration('cat_tree_size_type_enum', (
     "catTreeSizeTypeFixedSize",
     "catTreeSizeTypeTextDependentSize",
-)
+))
 
-cat_tree_type_enum = (
+cat_tree_type_enum = CATIAEnumeration('cat_tree_type_enum', (
     "catTreeTypeClassical",
     "catTreeTypeStructural",
     "catTreeTypeHistorical",
     "catTreeTypeRelational",
-)
+))
 
-cat_view2_d_mode_visu = (
+cat_view2_d_mode_visu = CATIAEnumeration('cat_view2_d_mode_visu', (
     "catView2DModeNotActivated",
     "catView2DModeNoShow",
-)
+))
 
-cat_view_background_mode = (
+cat_view_background_mode = CATIAEnumeration('cat_view_background_mode', (
     "catStandard",
     "catInvisible",
     "catUnpickable",
     "catLowIntensity",
     "catUnpickableLowIntensity",
-)
+))
 
-cat_view_filter_creation_mode = (
+cat_view_filter_creation_mode = CATIAEnumeration('cat_view_filter_creation_mode', (
     "catDefaultFilter",
     "catDisplayFilterDialogBox",
     "catDedicatedFilter",
-)
+))
 
-cat_view_side = (
+cat_view_side = CATIAEnumeration('cat_view_side', (
     "catTopSide",
     "catBottomSide",
     "catLeftSide",
@@ -1867,76 +1869,76 @@ cat_view_side = (
     "catTRCorner",
     "catBLCorner",
     "catBRCorner",
-)
+))
 
-cat_view_type = (
+cat_view_type = CATIAEnumeration('cat_view_type', (
     "catAuxiliaryView",
     "catSectionView",
     "catSectionCutView",
-)
+))
 
-cat_vis_layer_type = (
+cat_vis_layer_type = CATIAEnumeration('cat_vis_layer_type', (
     "catVisLayerBasic",
     "catVisLayerNone",
-)
+))
 
-cat_vis_property_pick = (
+cat_vis_property_pick = CATIAEnumeration('cat_vis_property_pick', (
     "catVisPropertyPickAttr",
     "catVisPropertyNoPickAttr",
-)
+))
 
-cat_vis_property_show = (
+cat_vis_property_show = CATIAEnumeration('cat_vis_property_show', (
     "catVisPropertyShowAttr",
     "catVisPropertyNoShowAttr",
-)
+))
 
-cat_vis_property_status = (
+cat_vis_property_status = CATIAEnumeration('cat_vis_property_status', (
     "catVisPropertyDefined",
     "catVisPropertyUnDefined",
-)
+))
 
-cat_vis_property_type = (
+cat_vis_property_type = CATIAEnumeration('cat_vis_property_type', (
     "catVisPropertyLineType",
     "catVisPropertyWidth",
     "catVisPropertyColor",
     "catVisPropertyOpacity",
-)
+))
 
-cat_visu_background_mode = (
+cat_visu_background_mode = CATIAEnumeration('cat_visu_background_mode', (
     "catNoBackground",
     "catPick",
     "catNoPick",
     "catLowIntPick",
     "catLowIntNoPick",
-)
+))
 
-cat_visu_in3_d_mode = (
+cat_visu_in3_d_mode = CATIAEnumeration('cat_visu_in3_d_mode', (
     "catShowAll",
     "catHideAll",
-)
+))
 
-cat_visualization_type = (
+cat_visualization_type = CATIAEnumeration('cat_visualization_type', (
     "Passed",
     "Failed",
     "Both",
-)
+))
 
-cat_weld_additional_symbol = (
+cat_weld_additional_symbol = CATIAEnumeration('cat_weld_additional_symbol', (
     "catNoneAddWelding",
     "catFlatWelding",
     "catConvexWelding",
     "catConcaveWelding",
     "catFlushWelding",
     "catSmoothWelding",
-)
+))
 
-cat_welding = (
+cat_welding = CATIAEnumeration('cat_welding', (
     "catNoneWelding",
     "catFirstWelding",
     "catSecondWelding",
-)
+))
 
-cat_welding_field = (
+cat_welding_field = CATIAEnumeration('cat_welding_field', (
     "catWeldingNone",
     "catWeldingFieldOne",
     "catWeldingFieldTwo",
@@ -1945,14 +1947,14 @@ cat_welding_field = (
     "catWeldingFieldFive",
     "catWeldingFieldSix",
     "catWeldingFieldSeven",
-)
+))
 
-cat_welding_side = (
+cat_welding_side = CATIAEnumeration('cat_welding_side', (
     "catWeldingUp",
     "catWeldingDown",
-)
+))
 
-cat_welding_symbol = (
+cat_welding_symbol = CATIAEnumeration('cat_welding_symbol', (
     "catNoneMainWelding",
     "catSquareWelding",
     "catVGrooveWelding",
@@ -1983,63 +1985,63 @@ cat_welding_symbol = (
     "catMeltThruWelding",
     "catSurfaceJointWelding",
     "catInclinedJointWelding",
-)
+))
 
-cat_window_state = (
+cat_window_state = CATIAEnumeration('cat_window_state', (
     "catWindowStateMaximized",
     "catWindowStateMinimized",
     "catWindowStateNormal",
-)
+))
 
-cat_work_mode_type = (
+cat_work_mode_type = CATIAEnumeration('cat_work_mode_type', (
     "DEFAULT_MODE",
     "VISUALIZATION_MODE",
     "DESIGN_MODE",
-)
+))
 
-catfta_dim_configure_snapping = (
+catfta_dim_configure_snapping = CATIAEnumeration('catfta_dim_configure_snapping', (
     "CATFTADimSnappingUndefined",
     "CATFTADimSnappingOnGrid",
     "CATFTADimSnappingValue",
     "CATFTADimSnappingBoth",
-)
+))
 
-catfta_dim_create_on = (
+catfta_dim_create_on = CATIAEnumeration('catfta_dim_create_on', (
     "CATFTADimCreateOnUndefined",
     "CATFTADimCreateOnCenter",
     "CATFTADimCreateOnEdge",
-)
+))
 
-catfta_leader_associativity = (
+catfta_leader_associativity = CATIAEnumeration('catfta_leader_associativity', (
     "CATFTALeaderAssociativityUndefined",
     "CATFTALeaderAssociativityFree",
     "CATFTALeaderAssociativityPerpendicular",
-)
+))
 
-catv4_iv4_v5_spec_draft_migration_enum = (
+catv4_iv4_v5_spec_draft_migration_enum = CATIAEnumeration('catv4_iv4_v5_spec_draft_migration_enum', (
     "squareMode",
     "coneMode",
-)
+))
 
-catv4_iv5_v4_associativity_mode_enum = (
+catv4_iv5_v4_associativity_mode_enum = CATIAEnumeration('catv4_iv5_v4_associativity_mode_enum', (
     "AssociativeMode",
     "NonAssociativeMode",
     "NonAssociativityModeAndNoSolidCreation",
-)
+))
 
-catv4_iv5_v4_error_feature_creation_enum = (
+catv4_iv5_v4_error_feature_creation_enum = CATIAEnumeration('catv4_iv5_v4_error_feature_creation_enum', (
     "NeverCreateErrorFeatures",
     "CreateAnErrorFeatureAfterUserAgreement",
     "AlwaysCreateErrorFeatures",
-)
+))
 
-catv4_iv5_v4_internal_curve_creation_enum = (
+catv4_iv5_v4_internal_curve_creation_enum = CATIAEnumeration('catv4_iv5_v4_internal_curve_creation_enum', (
     "AllCurvesAreCreated",
     "OnlyConicsAreCreated",
     "NoInternalCurveIsCreated",
-)
+))
 
-cd5_save_item_status = (
+cd5_save_item_status = CATIAEnumeration('cd5_save_item_status', (
     "CD5SaveItem_New",
     "CD5SaveItem_Modified",
     "CD5SaveItem_Exists",
@@ -2048,70 +2050,70 @@ cd5_save_item_status = (
     "CD5SaveItem_Obsolete",
     "CD5SaveItem_UUIDConflict",
     "CD5SaveItem_NotFound",
-)
+))
 
-cd5_save_operation_scope = (
+cd5_save_operation_scope = CATIAEnumeration('cd5_save_operation_scope', (
     "CD5SaveOperation_ActiveDocument",
     "CD5SaveOperation_CurrentEditor",
     "CD5SaveOperation_Session",
-)
+))
 
-contact_stiffness_type = (
+contact_stiffness_type = CATIAEnumeration('contact_stiffness_type', (
     "DEFAULT",
     "STIFF_VALUE",
-)
+))
 
-distribution_type = (
+distribution_type = CATIAEnumeration('distribution_type', (
     "UNIFORM",
     "JOB",
     "USERDEFINED",
     "JOB_USERDEFINED",
-)
+))
 
-dmu_track_move_mode = (
+dmu_track_move_mode = CATIAEnumeration('dmu_track_move_mode', (
     "DMUTrackSpeedMode",
     "DMUTrackTimeMode",
-)
+))
 
-dnb_act_behavior_type = (
+dnb_act_behavior_type = CATIAEnumeration('dnb_act_behavior_type', (
     "DNBBehaviorProcess",
     "DNBBehaviorParent",
-)
+))
 
-dnb_analysis_level = (
+dnb_analysis_level = CATIAEnumeration('dnb_analysis_level', (
     "DNBAnalysisLevelOff",
     "DNBAnalysisLevelHighlight",
     "DNBAnalysisLevelVerbose",
     "DNBAnalysisLevelInterrupt",
-)
+))
 
-dnb_assign_status = (
+dnb_assign_status = CATIAEnumeration('dnb_assign_status', (
     "DNBUnknownState",
     "DNBSuccess",
     "DNBAlreadyAssigned",
     "DNBInvalidObjetAssignment",
     "DNBInvalidProcessVersion",
     "DNBPartsNotLoaded",
-)
+))
 
-dnb_auxilliary_device_type = (
+dnb_auxilliary_device_type = CATIAEnumeration('dnb_auxilliary_device_type', (
     "AuxilliaryDeviceType_RailTrackGantry",
     "AuxilliaryDeviceType_EndOfArmTooling",
     "AuxilliaryDeviceType_WorkpiecePositioner",
     "AuxilliaryDeviceType_Conveyor",
-)
+))
 
-dnb_hlnk_behavior_type = (
+dnb_hlnk_behavior_type = CATIAEnumeration('dnb_hlnk_behavior_type', (
     "DNBBehaviorContinue",
     "DNBBehaviorPause",
-)
+))
 
-dnb_sim_graph_update_mode = (
+dnb_sim_graph_update_mode = CATIAEnumeration('dnb_sim_graph_update_mode', (
     "DNBSimGraphUpdateDisabled",
     "DNBSimGraphUpdateEnabled",
-)
+))
 
-dnb_sim_init_state_attr = (
+dnb_sim_init_state_attr = CATIAEnumeration('dnb_sim_init_state_attr', (
     "DNBVisInitStateAttr",
     "DNBPosInitStateAttr",
     "DNBColInitStateAttr",
@@ -2127,33 +2129,33 @@ dnb_sim_init_state_attr = (
     "DNBPosColOpacInitStateAttr",
     "DNBColOpacInitStateAttr",
     "DNBAllInitStateAttr",
-)
+))
 
-dnb_sim_navigation_mode = (
+dnb_sim_navigation_mode = CATIAEnumeration('dnb_sim_navigation_mode', (
     "DNBSimNavigationModeStep",
     "DNBSimNavigationModeAnimate",
-)
+))
 
-dnb_visualization_mode = (
+dnb_visualization_mode = CATIAEnumeration('dnb_visualization_mode', (
     "DNBVisualizationModeHighlight",
     "DNBVisualizationModeCurves",
-)
+))
 
-dnbia_mfg_assembly_type = (
+dnbia_mfg_assembly_type = CATIAEnumeration('dnbia_mfg_assembly_type', (
     "manufacturingAssembly",
     "manufacturingKit",
     "assemblySpecTree",
     "manufacturingOutput",
     "notSpecified",
-)
+))
 
-dnbppr_remove_status = (
+dnbppr_remove_status = CATIAEnumeration('dnbppr_remove_status', (
     "DNBFastenerUnknownStatus",
     "DNBFastenerAssignedStatus",
     "DNBFastenerSuccessStatus",
-)
+))
 
-dnbtcp_trace_legends = (
+dnbtcp_trace_legends = CATIAEnumeration('dnbtcp_trace_legends', (
     "DNBTCPTraceLegendAllLegend",
     "DNBTCPTraceLegendName",
     "DNBTCPTraceLegendX",
@@ -2165,16 +2167,16 @@ dnbtcp_trace_legends = (
     "DNBTCPTraceLegendCycleTime",
     "DNBTCPTraceLegendHighlight",
     "DNBTCPTraceLegendAlwaysVisible",
-)
+))
 
-dnbtcp_trace_reps = (
+dnbtcp_trace_reps = CATIAEnumeration('dnbtcp_trace_reps', (
     "DNBTCPTraceRepAllRep",
     "DNBTCPTraceRepPoint",
     "DNBTCPTraceRepLine",
     "DNBTCPTraceRepAxis",
-)
+))
 
-elem_behav_enum = (
+elem_behav_enum = CATIAEnumeration('elem_behav_enum', (
     "BEHAVIOR_NONE",
     "SHELL",
     "MEMBRANE",
@@ -2182,9 +2184,9 @@ elem_behav_enum = (
     "CONTINUUM_SHELL",
     "BEAM",
     "GASKET",
-)
+))
 
-elem_id_enum = (
+elem_id_enum = CATIAEnumeration('elem_id_enum', (
     "TET_LINEAR",
     "TET_PARABOLIC",
     "HEX_LINEAR",
@@ -2197,42 +2199,42 @@ elem_id_enum = (
     "QUAD_PARABOLIC",
     "LINE_LINEAR",
     "LINE_PARABOLIC",
-)
+))
 
-fixed_time_increment_method = (
+fixed_time_increment_method = CATIAEnumeration('fixed_time_increment_method', (
     "ABQ_FTI_ELEMENT_BY_ELEMENT",
     "ABQ_FTI_USER_DEFINED",
-)
+))
 
-formulation_option_type = (
+formulation_option_type = CATIAEnumeration('formulation_option_type', (
     "SOLVERDEFAULT",
     "SURFACETOSURFACE",
     "NODETOSURFACE",
-)
+))
 
-formulation_type = (
+formulation_type = CATIAEnumeration('formulation_type', (
     "FRICTIONLESS",
     "PENALTY",
-)
+))
 
-frame_visibility = (
+frame_visibility = CATIAEnumeration('frame_visibility', (
     "VisNo",
     "VisYes",
     "VisRetain",
-)
+))
 
-hts_activity_group_motion_basis = (
+hts_activity_group_motion_basis = CATIAEnumeration('hts_activity_group_motion_basis', (
     "HAGMOTBASIS_DEFAULT",
     "HAGMOTBASIS_USERSPEED",
     "HAGMOTBASIS_USERTIME",
-)
+))
 
-hts_body_pose_options = (
+hts_body_pose_options = CATIAEnumeration('hts_body_pose_options', (
     "BODYPOSE_CURRENT",
     "BODYPOSE_RESET",
-)
+))
 
-hts_end_effector = (
+hts_end_effector = CATIAEnumeration('hts_end_effector', (
     "EE_LEFTHAND",
     "EE_RIGHTHAND",
     "EE_LEFTLEG",
@@ -2240,14 +2242,14 @@ hts_end_effector = (
     "EE_LINEOFSIGHT",
     "EE_BODY",
     "EE_NECK",
-)
+))
 
-hts_hand = (
+hts_hand = CATIAEnumeration('hts_hand', (
     "HAND_RIGHT",
     "HAND_LEFT",
-)
+))
 
-hts_manikin_referential = (
+hts_manikin_referential = CATIAEnumeration('hts_manikin_referential', (
     "REF_EYEPOINT",
     "REF_HPOINT",
     "REF_LEFTFOOT",
@@ -2258,54 +2260,54 @@ hts_manikin_referential = (
     "REF_RIGHTHAND",
     "REF_BETWEENFEET",
     "REF_HPOINTPROJECTION",
-)
+))
 
-hts_motion_basis = (
+hts_motion_basis = CATIAEnumeration('hts_motion_basis', (
     "MOTBASIS_SPEED",
     "MOTBASIS_TIME",
-)
+))
 
-hts_pick_type = (
+hts_pick_type = CATIAEnumeration('hts_pick_type', (
     "SINGLE_HAND",
     "BOTH_HANDS",
-)
+))
 
-hts_search_intensity = (
+hts_search_intensity = CATIAEnumeration('hts_search_intensity', (
     "FINESEARCH",
     "NORMALSEARCH",
     "COARSESEARCH",
-)
+))
 
-hts_stride_options = (
+hts_stride_options = CATIAEnumeration('hts_stride_options', (
     "STRIDE_SHORT",
     "STRIDE_MEDIUM",
     "STRIDE_LONG",
-)
+))
 
-hts_swing_options = (
+hts_swing_options = CATIAEnumeration('hts_swing_options', (
     "SWING_BOTHARMS",
     "SWING_LEFTARM",
     "SWING_RIGHTARM",
     "SWING_CURRENT",
-)
+))
 
-hts_walk_motion_basis = (
+hts_walk_motion_basis = CATIAEnumeration('hts_walk_motion_basis', (
     "WALKMOTBASIS_DEFAULT",
     "WALKMOTBASIS_USERSPEED",
     "WALKMOTBASIS_USERTIME",
-)
+))
 
-incrementation_type = (
+incrementation_type = CATIAEnumeration('incrementation_type', (
     "AUTO_INCREMENT",
     "FIXED_INCREMENT",
-)
+))
 
-initial_thickness_type = (
+initial_thickness_type = CATIAEnumeration('initial_thickness_type', (
     "USE_NODAL_COORDINATES",
     "INITIAL_THICKNESS_SPECIFY",
-)
+))
 
-item_assignment_type = (
+item_assignment_type = CATIAEnumeration('item_assignment_type', (
     "ProcessProcesses",
     "ProcessFirstProcesses",
     "ProcessRemoves",
@@ -2313,104 +2315,104 @@ item_assignment_type = (
     "ProcessImplementsRequirementComplete",
     "productviewpoint",
     "productvisualization",
-)
+))
 
-job_type = (
+job_type = CATIAEnumeration('job_type', (
     "ANALYSIS",
     "DATACHECK",
     "CONTINUE",
     "FROMINPUTFILE",
     "SYNTAXCHECK",
     "RESTART",
-)
+))
 
-max_stiffness_type = (
+max_stiffness_type = CATIAEnumeration('max_stiffness_type', (
     "MAX_STIFF_DEFAULT",
     "MAX_STIFF_VALUE",
-)
+))
 
-memory_unit_type = (
+memory_unit_type = CATIAEnumeration('memory_unit_type', (
     "MEGABYTES",
     "PERCENT",
-)
+))
 
-motion_basis = (
+motion_basis = CATIAEnumeration('motion_basis', (
     "MOTION_ABSOLUTE",
     "MOTION_PERCENT",
     "MOTION_TIME",
-)
+))
 
-parallel_method_std_type = (
+parallel_method_std_type = CATIAEnumeration('parallel_method_std_type', (
     "TREE",
     "SUPERNODE",
-)
+))
 
-position_tolerance_type = (
+position_tolerance_type = CATIAEnumeration('position_tolerance_type', (
     "COMPUTED",
     "SPECIFIED",
-)
+))
 
-pressure_overclosure_type = (
+pressure_overclosure_type = CATIAEnumeration('pressure_overclosure_type', (
     "HARD",
     "EXPONENTIAL",
     "LINEAR",
     "TABULAR",
-)
+))
 
-raster_level_of_detail = (
+raster_level_of_detail = CATIAEnumeration('raster_level_of_detail', (
     "LowQuality",
     "NormalQuality",
     "HighQuality",
     "Customize",
-)
+))
 
-response_type = (
+response_type = CATIAEnumeration('response_type', (
     "STEADY_STATE",
     "TRANSIENT",
-)
+))
 
-sliding_type = (
+sliding_type = CATIAEnumeration('sliding_type', (
     "FINITE",
     "SMALL",
-)
+))
 
-spm_distribution_mode = (
+spm_distribution_mode = CATIAEnumeration('spm_distribution_mode', (
     "SPM_LINEAR",
     "SPM_HISTOGRAM",
     "SPM_LOG",
-)
+))
 
-spring_def_type = (
+spring_def_type = CATIAEnumeration('spring_def_type', (
     "ABQ_LINE",
     "ABQ_NON_LINEAR",
-)
+))
 
-spring_dof_type = (
+spring_dof_type = CATIAEnumeration('spring_dof_type', (
     "U1_DOF",
     "U2_DOF",
     "U3_DOF",
     "UR1_DOF",
     "UR2_DOF",
     "UR3_DOF",
-)
+))
 
-spring_type_type = (
+spring_type_type = CATIAEnumeration('spring_type_type', (
     "AXIAL",
     "GENERAL",
-)
+))
 
-stabilization_stiffness_type = (
+stabilization_stiffness_type = CATIAEnumeration('stabilization_stiffness_type', (
     "STABILIZATION_DEFAULT",
     "STABILIZATION_SPECIFY",
-)
+))
 
-stabilization_type = (
+stabilization_type = CATIAEnumeration('stabilization_type', (
     "NONE",
     "DISSIPATION",
     "FACTOR",
-)
+))
 
-swk_posture_spec = (
+swk_posture_spec = CATIAEnumeration('swk_posture_spec', (
     "SWKPostureSpecDefault",
     "SWKPostureSpecStand",
     "SWKPostureSpecSit",
@@ -2419,9 +2421,9 @@ swk_posture_spec = (
     "SWKPostureSpecSpan",
     "SWKPostureSpecKneel",
     "SWKPostureSpecInitial",
-)
+))
 
-time_span_type = (
+time_span_type = CATIAEnumeration('time_span_type', (
     "STEP_TIME",
     "TOTAL_TIME",
-)
+))
@@ -0,0 +1,52 @@
+#! /usr/bin/python3.9
+"""
+
+    The CATIA enumerations of :mod:`~pycatia.enumeration.enumeration_types` as :class:`~enum.IntEnum` classes,
+    named in CamelCase: cat_work_mode_type becomes CatWorkModeType.
+
+    Each class is created when it is first imported from this module, so only the enumerations used are built.
+    The members are ints and can be passed to pycatia methods in place of values. Values returned by pycatia
+    methods can be converted to members in O(1).
+
+    :Example - Set and read a work mode:
+
+        >>> from pycatia.enumeration.enums import CatWorkModeType
+        >>> product.apply_work_mode(CatWorkModeType.DESIGN_MODE)
+        >>> CatWorkModeType(2).name
+        'DESIGN_MODE'
+
+"""
+
+from pycatia.enumeration.catia_enumeration import enum_name
+
+# {class name: enumeration name}
+_enumeration_names = None
+
+
+def _names() -> dict:
+    global _enumeration_names
+    if _enumeration_names is None:
+        from pycatia.enumeration import enumeration_types
+        from pycatia.enumeration.catia_enumeration import CATIAEnumeration
+
+        _enumeration_names = {enum_name(name): name for name, value in vars(enumeration_types).items()
+                              if isinstance(value, CATIAEnumeration)}
+
+    return _enumeration_names
+
+
+def __getattr__(name):
+    enumeration_name = _names().get(name) if not name.startswith('__') else None
+    if enumeration_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    from pycatia.enumeration import enumeration_types
+
+    value = getattr(enumeration_types, enumeration_name).enum
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_names()))
@@ -1,5 +1,13 @@
 #! /usr/bin/python3.9
 
+try:
+    from pywintypes import com_error
+except ImportError:
+    # pywin32 isn't installed, eg when replaying a recording without CATIA. See
+    # :class:`~pycatia.base_interfaces.com_backend.ReplayBackend`.
+    class com_error(Exception):
+        pass
+
 
 class PYCATIABaseException(Exception):
     """
@@ -20,3 +28,10 @@ class CATIAApplicationException(PYCATIABaseException):
         """
 
         self.message = message
+
+
+class COMReplayException(CATIAApplicationException):
+    """
+    Raised when a replayed session diverges from the recording.
+    """
+    pass
@@ -641,7 +641,7 @@ class HybridShapeCurvePar(HybridShape):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def put_plane_normal(self, i_normal: tuple) -> None:
         """
@@ -8,6 +8,10 @@
         and thus help debugging in pycatia.
         
 """
+import itertools
+from typing import Iterable
+from typing import Sequence
+from typing import TYPE_CHECKING
 
 from pycatia.hybrid_shape_interfaces.hybrid_shape_3d_curve_offset import HybridShape3DCurveOffset
 from pycatia.hybrid_shape_interfaces.hybrid_shape_affinity import HybridShapeAffinity
@@ -113,6 +117,68 @@ from pycatia.hybrid_shape_interfaces.hybrid_shape_wrap_surface import HybridShap
 from pycatia.in_interfaces.reference import Reference
 from pycatia.mec_mod_interfaces.factory import Factory
 
+if TYPE_CHECKING:
+    from pycatia.mec_mod_interfaces.hybrid_body import HybridBody
+    from pycatia.mec_mod_interfaces.part import Part
+    from pycatia.system_interfaces.any_object import AnyObject
+
+# creates a point for each (x, y, z) in coordinates and appends it to hybrid_body. If part is given each point
+# is replaced by a datum point.
+_build_points_template = """
+Function {name}(factory, hybrid_body, coordinates, part)
+    Dim i, count, point, reference, points()
+    count = (UBound(coordinates) + 1) / 3
+    ReDim points(count - 1)
+    For i = 0 To count - 1
+        Set point = factory.AddNewPointCoord(coordinates(3 * i), coordinates(3 * i + 1), coordinates(3 * i + 2))
+        hybrid_body.AppendHybridShape point
+        If IsObject(part) Then
+            part.UpdateObject point
+            Set reference = part.CreateReferenceFromObject(point)
+            Set point = factory.AddNewPointDatum(reference)
+            hybrid_body.AppendHybridShape point
+            factory.DeleteObjectForDatum reference
+        End If
+        Set points(i) = point
+    Next
+    {name} = points
+End Function
+"""
+
+
+def _build_points_vba(name: str) -> str:
+    # each script gets its own copy so the scripts can share one helper module.
+    return _build_points_template.replace('{name}', name)
+
+
+def _flatten_coordinates(coordinates: Sequence[Sequence[float]]) -> tuple:
+    if any(len(coordinate) != 3 for coordinate in coordinates):
+        raise ValueError('Each coordinate must have 3 components (x, y, z).')
+
+    return tuple(float(c) for coordinate in coordinates for c in coordinate)
+
+
+def _optional_vectors(vectors: Sequence, count: int, name: str) -> tuple:
+    # a flag and (x, y, z) for each point, None meaning no vector at the point.
+    if vectors is None:
+        return (False,) * count, (0.0,) * 3 * count
+    if len(vectors) != count:
+        raise ValueError(f'There must be one of {name} per coordinate.')
+
+    return (
+        tuple(vector is not None for vector in vectors),
+        _flatten_coordinates([vector if vector is not None else (0.0, 0.0, 0.0) for vector in vectors])
+    )
+
+
+def _optional_values(values: Sequence, count: int, name: str, default: float) -> tuple:
+    if values is None:
+        return (float(default),) * count
+    if len(values) != count:
+        raise ValueError(f'There must be one of {name} per coordinate.')
+
+    return tuple(float(value) if value is not None else float(default) for value in values)
+
 
 class HybridShapeFactory(Factory):
     """
@@ -4015,6 +4081,234 @@ class HybridShapeFactory(Factory):
 
         return r
 
+    def add_new_points_coord(self, coordinates: Iterable[Sequence[float]], hybrid_body: 'HybridBody',
+                             names: Iterable[str] = None, chunk_size: int = 5000,
+                             update: 'AnyObject' = None) -> list:
+        """
+        Create points from their coordinates and append them to hybrid_body with one call to
+        SystemService.evaluate() per chunk of points rather than two COM calls per point.
+
+        coordinates is consumed chunk_size points at a time so it can be a generator reading a large file.
+
+        :Example - Create a 100 x 100 grid of points and update the part once:
+
+            >>> coordinates = ((x * 10, y * 10, 0) for x in range(100) for y in range(100))
+            >>> points = hsf.add_new_points_coord(coordinates, geometrical_set, update=part)
+
+        :param coordinates: the (x, y, z) of each point.
+        :param HybridBody hybrid_body: the geometrical set the points are appended to.
+        :param names: (optional) the name of each point. None keeps the default name.
+        :param int chunk_size: (optional) the number of points created per call.
+        :param AnyObject update: (optional) a Part updated once after all the points are created.
+        :return: list[HybridShapePointCoord]
+        :rtype: list
+        """
+
+        vba_function_name = 'hybrid_shape_factory_add_points'
+        vba_code = """
+        Public Function hybrid_shape_factory_add_points(factory, hybrid_body, coordinates, names)
+            Dim i, count, point, points()
+            count = (UBound(coordinates) + 1) / 3
+            ReDim points(count - 1)
+            For i = 0 To count - 1
+                Set point = factory.AddNewPointCoord(coordinates(3 * i), coordinates(3 * i + 1), _
+                                                     coordinates(3 * i + 2))
+                If IsArray(names) Then
+                    If Not IsNull(names(i)) And Not IsEmpty(names(i)) Then point.Name = names(i)
+                End If
+                hybrid_body.AppendHybridShape point
+                Set points(i) = point
+            Next
+            hybrid_shape_factory_add_points = points
+        End Function
+        """
+
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1.')
+
+        system_service = self.application.system_service
+        coordinates = iter(coordinates)
+        names = iter(names) if names is not None else None
+        points = []
+        while True:
+            chunk = list(itertools.islice(coordinates, chunk_size))
+            if not chunk:
+                break
+            chunk_names = tuple(itertools.islice(names, len(chunk))) if names is not None else None
+            if chunk_names is not None and len(chunk_names) != len(chunk):
+                raise ValueError('There are fewer names than coordinates.')
+
+            com_points = system_service.evaluate_function(
+                vba_code,
+                vba_function_name,
+                [
+                    self.hybrid_shape_factory,
+                    hybrid_body.com_object,
+                    _flatten_coordinates(chunk),
+                    chunk_names
+                ]
+            )
+            points.extend(HybridShapePointCoord(com_point) for com_point in com_points)
+
+        if update is not None:
+            update.update()
+
+        return points
+
+    def add_new_spline_from_coords(self, coordinates: Sequence[Sequence[float]], hybrid_body: 'HybridBody',
+                                   tangents: Sequence[Sequence[float]] = None, tensions: Sequence[float] = None,
+                                   curvature_directions: Sequence[Sequence[float]] = None,
+                                   curvature_radii: Sequence[float] = None, closed: bool = False,
+                                   datum_part: 'Part' = None, update: 'AnyObject' = None) -> HybridShapeSpline:
+        """
+        Create a spline through points created from coordinates with one call to SystemService.evaluate(). The
+        points and then the spline are appended to hybrid_body.
+
+        The tangent and curvature constraints are optional per point. Use None at a point without a constraint.
+
+        :Example - A spline through a scanned profile with a tangent at each end:
+
+            >>> profile = [(0, 0, 0), (10, 4, 0), (20, 5, 0), (30, 3, 0)]
+            >>> spline = hsf.add_new_spline_from_coords(profile, geometrical_set,
+            >>>                                         tangents=[(1, 0, 0), None, None, (1, -1, 0)], update=part)
+
+        :param list coordinates: the (x, y, z) of each point.
+        :param HybridBody hybrid_body: the geometrical set the points and the spline are appended to.
+        :param list tangents: (optional) the (x, y, z) tangent direction at each point or None.
+        :param list tensions: (optional) the tangent tension at each point. Defaults to 1.0.
+        :param list curvature_directions: (optional) the (x, y, z) curvature direction at each point or None.
+        :param list curvature_radii: (optional) the curvature radius at each point with a curvature direction.
+        :param bool closed: (optional) close the spline.
+        :param Part datum_part: (optional) create the points as datum (explicit) points. The Part containing
+            hybrid_body is needed to create them.
+        :param AnyObject update: (optional) a Part updated once after the spline is created.
+        :return: HybridShapeSpline
+        :rtype: HybridShapeSpline
+        """
+
+        vba_function_name = 'hybrid_shape_factory_add_spline'
+        vba_code = _build_points_vba('hybrid_shape_factory_spline_points') + """
+        Public Function hybrid_shape_factory_add_spline(factory, hybrid_body, coordinates, part, has_tangents, _
+                                                        tangents, tensions, has_curvatures, curvature_directions, _
+                                                        curvature_radii, closed)
+            Dim i, points, spline, tangent, curvature, radius
+            points = hybrid_shape_factory_spline_points(factory, hybrid_body, coordinates, part)
+            Set spline = factory.AddNewSpline
+            For i = 0 To UBound(points)
+                If has_tangents(i) Or has_curvatures(i) Then
+                    Set tangent = Nothing
+                    Set curvature = Nothing
+                    radius = 0
+                    If has_tangents(i) Then
+                        Set tangent = factory.AddNewDirectionByCoord(tangents(3 * i), tangents(3 * i + 1), _
+                                                                     tangents(3 * i + 2))
+                    End If
+                    If has_curvatures(i) Then
+                        Set curvature = factory.AddNewDirectionByCoord(curvature_directions(3 * i), _
+                                                                       curvature_directions(3 * i + 1), _
+                                                                       curvature_directions(3 * i + 2))
+                        radius = curvature_radii(i)
+                    End If
+                    spline.AddPointWithConstraintExplicit points(i), tangent, tensions(i), 1, curvature, radius
+                Else
+                    spline.AddPoint points(i)
+                End If
+            Next
+            If closed Then spline.SetClosing 1
+            hybrid_body.AppendHybridShape spline
+            Set hybrid_shape_factory_add_spline = spline
+        End Function
+        """
+
+        coordinates = list(coordinates)
+        count = len(coordinates)
+        if count < 2:
+            raise ValueError('A spline needs at least 2 points.')
+        has_tangents, flat_tangents = _optional_vectors(tangents, count, 'tangents')
+        has_curvatures, flat_curvatures = _optional_vectors(curvature_directions, count, 'curvature_directions')
+
+        system_service = self.application.system_service
+        spline = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [
+                self.hybrid_shape_factory,
+                hybrid_body.com_object,
+                _flatten_coordinates(coordinates),
+                datum_part.com_object if datum_part is not None else None,
+                has_tangents,
+                flat_tangents,
+                _optional_values(tensions, count, 'tensions', 1.0),
+                has_curvatures,
+                flat_curvatures,
+                _optional_values(curvature_radii, count, 'curvature_radii', 0.0),
+                closed
+            ]
+        )
+        if update is not None:
+            update.update()
+
+        return HybridShapeSpline(spline)
+
+    def add_new_polyline_from_coords(self, coordinates: Sequence[Sequence[float]], hybrid_body: 'HybridBody',
+                                     radii: Sequence[float] = None, closed: bool = False,
+                                     datum_part: 'Part' = None, update: 'AnyObject' = None) -> HybridShapePolyline:
+        """
+        Create a polyline through points created from coordinates with one call to SystemService.evaluate().
+        The points and then the polyline are appended to hybrid_body.
+
+        :param list coordinates: the (x, y, z) of each point.
+        :param HybridBody hybrid_body: the geometrical set the points and the polyline are appended to.
+        :param list radii: (optional) the corner radius at each point. None or 0 for a sharp corner.
+        :param bool closed: (optional) close the polyline.
+        :param Part datum_part: (optional) create the points as datum (explicit) points. The Part containing
+            hybrid_body is needed to create them.
+        :param AnyObject update: (optional) a Part updated once after the polyline is created.
+        :return: HybridShapePolyline
+        :rtype: HybridShapePolyline
+        """
+
+        vba_function_name = 'hybrid_shape_factory_add_polyline'
+        vba_code = _build_points_vba('hybrid_shape_factory_polyline_points') + """
+        Public Function hybrid_shape_factory_add_polyline(factory, hybrid_body, coordinates, part, radii, closed)
+            Dim i, points, polyline
+            points = hybrid_shape_factory_polyline_points(factory, hybrid_body, coordinates, part)
+            Set polyline = factory.AddNewPolyline
+            For i = 0 To UBound(points)
+                polyline.InsertElement points(i), i + 1
+            Next
+            For i = 0 To UBound(points)
+                If radii(i) > 0 Then polyline.SetRadius i + 1, radii(i)
+            Next
+            polyline.Closure = closed
+            hybrid_body.AppendHybridShape polyline
+            Set hybrid_shape_factory_add_polyline = polyline
+        End Function
+        """
+
+        coordinates = list(coordinates)
+        count = len(coordinates)
+        if count < 2:
+            raise ValueError('A polyline needs at least 2 points.')
+
+        system_service = self.application.system_service
+        polyline = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [
+                self.hybrid_shape_factory,
+                hybrid_body.com_object,
+                _flatten_coordinates(coordinates),
+                datum_part.com_object if datum_part is not None else None,
+                _optional_values(radii, count, 'radii', 0.0),
+                closed
+            ]
+        )
+        if update is not None:
+            update.update()
+
+        return HybridShapePolyline(polyline)
+
     def add_new_point_coord_with_reference(self, i_x: float, i_y: float, i_z: float,
                                            i_pt: Reference) -> HybridShapePointCoord:
         """
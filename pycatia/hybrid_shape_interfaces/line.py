@@ -151,7 +151,7 @@ class Line(HybridShape):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_origin(self, o_origin: tuple) -> None:
         """
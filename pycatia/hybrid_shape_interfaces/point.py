@@ -75,7 +75,7 @@ class Point(HybridShape):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def set_coordinates(self, o_coordinates: tuple) -> None:
         """
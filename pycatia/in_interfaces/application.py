@@ -1,26 +1,27 @@
 #! /usr/bin/python3.9
 # module initially auto generated using V5Automation.chm from CATIA R25
 
-from pywintypes import com_error
-
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pycatia.enumeration.enumeration_types import cat_script_language
 from pycatia.exception_handling.exceptions import CATIAApplicationException
-from pycatia.in_interfaces.document import Document
-from pycatia.in_interfaces.documents import Documents
-from pycatia.in_interfaces.file_system import FileSystem
-from pycatia.in_interfaces.printer import Printer
-from pycatia.in_interfaces.printers import Printers
-from pycatia.in_interfaces.send_to_service import SendToService
-from pycatia.in_interfaces.system_configuration import SystemConfiguration
-from pycatia.in_interfaces.window import Window
-from pycatia.in_interfaces.windows import Windows
+from pycatia.exception_handling.exceptions import com_error
 from pycatia.system_interfaces.any_object import AnyObject
-from pycatia.system_interfaces.system_service import SystemService
-from pycatia.in_interfaces.setting_controllers import SettingControllers
 from pycatia.types.document_types import document_type
 
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.document import Document
+    from pycatia.in_interfaces.documents import Documents
+    from pycatia.in_interfaces.file_system import FileSystem
+    from pycatia.in_interfaces.printer import Printer
+    from pycatia.in_interfaces.printers import Printers
+    from pycatia.in_interfaces.send_to_service import SendToService
+    from pycatia.in_interfaces.system_configuration import SystemConfiguration
+    from pycatia.in_interfaces.window import Window
+    from pycatia.in_interfaces.windows import Windows
+    from pycatia.system_interfaces.system_service import SystemService
+    from pycatia.in_interfaces.setting_controllers import SettingControllers
+
 
 class Application(AnyObject):
     """
@@ -69,7 +70,7 @@ class Application(AnyObject):
         self.com_object = com_object
 
     @property
-    def active_document(self) -> Document:
+    def active_document(self) -> 'Document':
         """
         .. note::
             :class: toggle
@@ -99,7 +100,7 @@ class Application(AnyObject):
             raise CATIAApplicationException('Is there an active document?')
 
     @property
-    def active_printer(self) -> Printer:
+    def active_printer(self) -> 'Printer':
         """
         .. note::
             :class: toggle
@@ -122,10 +123,11 @@ class Application(AnyObject):
         :rtype: Printer
         """
 
+        from pycatia.in_interfaces.printer import Printer
         return Printer(self.com_object.ActivePrinter)
 
     @active_printer.setter
-    def active_printer(self, value: Printer):
+    def active_printer(self, value: 'Printer'):
         """
         :param Printer value:
         """
@@ -133,7 +135,7 @@ class Application(AnyObject):
         self.com_object.ActivePrinter = value
 
     @property
-    def active_window(self) -> Window:
+    def active_window(self) -> 'Window':
         """
         .. note::
             :class: toggle
@@ -156,6 +158,7 @@ class Application(AnyObject):
         :rtype: Window
         """
 
+        from pycatia.in_interfaces.window import Window
         return Window(self.com_object.ActiveWindow)
 
     @property
@@ -270,7 +273,7 @@ class Application(AnyObject):
         self.com_object.DisplayFileAlerts = value
 
     @property
-    def documents(self) -> Documents:
+    def documents(self) -> 'Documents':
         """
         .. note::
             :class: toggle
@@ -292,6 +295,7 @@ class Application(AnyObject):
         :return: Documents
         :rtype: Documents
         """
+        from pycatia.in_interfaces.documents import Documents
         return Documents(self.com_object.Documents)
 
     @property
@@ -339,7 +343,7 @@ class Application(AnyObject):
         self.com_object.FileSearchOrder = value
 
     @property
-    def file_system(self) -> FileSystem:
+    def file_system(self) -> 'FileSystem':
         """
         .. note::
             :class: toggle
@@ -362,6 +366,7 @@ class Application(AnyObject):
         :rtype: FileSystem
         """
 
+        from pycatia.in_interfaces.file_system import FileSystem
         return FileSystem(self.com_object.FileSystem)
 
     @property
@@ -622,7 +627,7 @@ class Application(AnyObject):
         return Path(self.com_object.Path)
 
     @property
-    def printers(self) -> Printers:
+    def printers(self) -> 'Printers':
         """
         .. note::
             :class: toggle
@@ -645,6 +650,7 @@ class Application(AnyObject):
         :rtype: Printers
         """
 
+        from pycatia.in_interfaces.printers import Printers
         return Printers(self.com_object.Printers)
 
     @property
@@ -724,7 +730,7 @@ class Application(AnyObject):
         self.com_object.StatusBar = value
 
     @property
-    def system_configuration(self) -> SystemConfiguration:
+    def system_configuration(self) -> 'SystemConfiguration':
         """
         .. note::
             :class: toggle
@@ -746,10 +752,11 @@ class Application(AnyObject):
         :rtype: SystemConfiguration
         """
 
+        from pycatia.in_interfaces.system_configuration import SystemConfiguration
         return SystemConfiguration(self.com_object.SystemConfiguration)
 
     @property
-    def system_service(self) -> SystemService:
+    def system_service(self) -> 'SystemService':
         """
         .. note::
             :class: toggle
@@ -771,6 +778,7 @@ class Application(AnyObject):
         :rtype: SystemService
         """
 
+        from pycatia.system_interfaces.system_service import SystemService
         return SystemService(self.com_object.SystemService)
 
     @property
@@ -915,7 +923,7 @@ class Application(AnyObject):
         self.com_object.Width = value
 
     @property
-    def windows(self) -> Windows:
+    def windows(self) -> 'Windows':
         """
         .. note::
             :class: toggle
@@ -938,9 +946,10 @@ class Application(AnyObject):
         :rtype: Windows
         """
 
+        from pycatia.in_interfaces.windows import Windows
         return Windows(self.com_object.Windows)
 
-    def create_send_to(self) -> SendToService:
+    def create_send_to(self) -> 'SendToService':
         """
         .. note::
             :class: toggle
@@ -959,6 +968,7 @@ class Application(AnyObject):
         :return: SendToService
         :rtype: SendToService
         """
+        from pycatia.in_interfaces.send_to_service import SendToService
         return SendToService(self.com_object.CreateSendTo())
 
     def disable_new_undo_redo_transaction(self) -> None:
@@ -1177,13 +1187,12 @@ class Application(AnyObject):
         :rtype: int
         """
         function_name = "message_box"
-        msg_box = f"Public Function {function_name}(message_text, buttons, title)\n" \
-                  f"    {function_name} = MsgBox(message_text, buttons, title)\n" \
+        msg_box = "Public Function message_box(message_text, buttons, title)\n" \
+                  "    message_box = MsgBox(message_text, buttons, title)\n" \
                   "End Function"
 
-        return self.system_service.evaluate(
+        return self.system_service.evaluate_function(
             msg_box,
-            cat_script_language.index('CATVBScriptLanguage'),
             function_name,
             [message_text, buttons, title]
         )
@@ -1214,6 +1223,7 @@ class Application(AnyObject):
         """
         Application.SettingControllers
         """
+        from pycatia.in_interfaces.setting_controllers import SettingControllers
         return SettingControllers(self.com_object.SettingControllers)
 
     def start_command(self, i_command_id: str) -> None:
@@ -14,14 +14,14 @@ from typing import TYPE_CHECKING
 from pathlib import Path
 
 from pycatia.exception_handling import CATIAApplicationException
-from pycatia.in_interfaces.cameras import Cameras
-from pycatia.in_interfaces.reference import Reference
-from pycatia.in_interfaces.window import Window
-from pycatia.in_interfaces.workbench import Workbench
-from pycatia.space_analyses_interfaces.spa_workbench import SPAWorkbench
 from pycatia.system_interfaces.any_object import AnyObject
 
 if TYPE_CHECKING:
+    from pycatia.in_interfaces.cameras import Cameras
+    from pycatia.in_interfaces.reference import Reference
+    from pycatia.in_interfaces.window import Window
+    from pycatia.in_interfaces.workbench import Workbench
+    from pycatia.space_analyses_interfaces.spa_workbench import SPAWorkbench
     from pycatia.in_interfaces.selection import Selection
 
 
@@ -59,7 +59,7 @@ class Document(AnyObject):
         self.document = com_object
 
     @property
-    def cameras(self) -> Cameras:
+    def cameras(self) -> 'Cameras':
         """
         .. note::
             :class: toggle
@@ -80,6 +80,7 @@ class Document(AnyObject):
         :rtype: Cameras
         """
 
+        from pycatia.in_interfaces.cameras import Cameras
         return Cameras(self.document.Cameras)
 
     @property
@@ -389,7 +390,7 @@ class Document(AnyObject):
         """
         return self.document.CreateFilter(i_filter_name, i_filter_definition)
 
-    def create_reference_from_name(self, i_label: str) -> Reference:
+    def create_reference_from_name(self, i_label: str) -> 'Reference':
         """
         .. note::
             :class: toggle
@@ -412,9 +413,10 @@ class Document(AnyObject):
         :return: Reference
         :rtype: Reference
         """
+        from pycatia.in_interfaces.reference import Reference
         return Reference(self.document.CreateReferenceFromName(i_label))
 
-    def get_workbench(self, workbench_name: str) -> Workbench:
+    def get_workbench(self, workbench_name: str) -> 'Workbench':
         """
         .. note::
             :class: toggle
@@ -439,6 +441,7 @@ class Document(AnyObject):
         :return: Workbench
         :rtype: Workbench
         """
+        from pycatia.in_interfaces.workbench import Workbench
         return Workbench(self.document.GetWorkbench(workbench_name))
 
     def export_data(self, file_name: Path, file_type: str, overwrite=False) -> None:
@@ -692,6 +695,7 @@ class Document(AnyObject):
 
         :return: Window
         """
+        from pycatia.in_interfaces.window import Window
         return Window(self.document.NewWindow())
 
     def path(self):
@@ -807,6 +811,9 @@ class Document(AnyObject):
             #     self.logger.warning('File already exists. Click YES in CATIA V5.')
 
         self.document.SaveAs(path_file_name)
+        # the file names of products in the document have changed.
+        from pycatia.product_structure_interfaces.product_identity import product_identity_cache
+        product_identity_cache.clear()
 
         self.document.Application.DisplayFileAlerts = current_dfa_setting
 
@@ -816,7 +823,7 @@ class Document(AnyObject):
         Selection objects is a list of items to search for.
         Example: selection_objects = ['Point', 'Line']
         Example query string to search for all lines and points
-        "('Generative Shape Design'.Point + 'Generative Shape Design'.Line),in"
+        "'Generative Shape Design'.Point + 'Generative Shape Design'.Line,in"
         :param list selection_objects:
         :return Selected Automation Object:
         """
@@ -828,26 +835,20 @@ class Document(AnyObject):
             'Line'
         ]
 
-        query_string = str()
-        # build query string
+        from pycatia.in_interfaces.search_query import SearchQuery
+        from pycatia.in_interfaces.search_query import search
 
-        for counter, item in enumerate(selection_objects):
-            boolean = str()
-            if counter > 0 and not counter == len(selection_objects):
-                boolean = ' + '
-            if item in gsd_items:
-                query_string = f"{query_string}{boolean}'Generative Shape Design'.{item}"
+        queries = [SearchQuery('Generative Shape Design', item) for item in selection_objects if item in gsd_items]
+        if not queries:
+            raise CATIAApplicationException(f'Could not search for {selection_objects}. Only {gsd_items} are '
+                                            f'supported.')
+        query = queries[0]
+        for other in queries[1:]:
+            query = query | other
 
-        query_string = f"({query_string}),in"
+        values = search(self, query, 'in', attrs=['value'])['value']
 
-        selection = self.document.Selection
-        selection.Search(query_string)
-
-        selected = list()
-        for i in range(0, selection.Count):
-            selected.append(AnyObject(selection.Item(i + 1).Value))
-
-        return selected
+        return [value for value in values if value is not None]
 
     def spa_workbench(self):
         """
@@ -855,6 +856,7 @@ class Document(AnyObject):
         :rtype: SPAWorkbench
         """
 
+        from pycatia.space_analyses_interfaces.spa_workbench import SPAWorkbench
         return SPAWorkbench(self.com_object)
 
     def __repr__(self):
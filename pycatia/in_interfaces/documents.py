@@ -3,9 +3,8 @@ from typing import Iterator
 import os
 import warnings
 
-from pywintypes import com_error
-
 from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.exceptions import com_error
 from pycatia.in_interfaces.document import Document
 from pycatia.system_interfaces.collection import Collection
 from pycatia.types.document_types import document_type
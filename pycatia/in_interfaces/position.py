@@ -81,7 +81,7 @@ class Position(Move):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def set_components(self, i_axis_components_array: tuple) -> None:
         """
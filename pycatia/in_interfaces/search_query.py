@@ -0,0 +1,202 @@
+#! /usr/bin/python3.9
+"""
+
+    Build Edit/Search strings for :meth:`~pycatia.in_interfaces.selection.Selection.search` from Python and cache
+    the results.
+
+    A :class:`SearchQuery` matches elements by workbench and type, name and other attributes. Queries are combined
+    with & (and), | (or) and - (except) and compiled to a search string with a scope.
+
+    :Example - Points whose names start with Point or lines, anywhere in the document:
+
+        >>> from pycatia.in_interfaces.search_query import SearchQuery
+        >>> points = SearchQuery('Generative Shape Design', 'Point', name='Point*')
+        >>> lines = SearchQuery('Generative Shape Design', 'Line')
+        >>> (points | lines).compile('all')
+        "('Generative Shape Design'.Point & Name=Point*) + 'Generative Shape Design'.Line,all"
+
+    :func:`search` runs a query with :meth:`~pycatia.in_interfaces.selection.Selection.search_fetch`. Within a
+    :data:`~pycatia.base_interfaces.com_cache.search_cache` context the results of each query are kept per
+    document and a repeated search returns them without searching the document again.
+
+    The cache is cleared by Part.update(), Part.update_object(), Selection.cut(), Selection.delete(),
+    Selection.paste(), Selection.paste_special(), the add, create, delete, remove and replace methods of
+    collections, the add_new methods of factories and on exit of the context. Call
+    :meth:`~pycatia.base_interfaces.com_cache.SearchCache.clear` after changing documents by other means.
+
+    :Example - Repeated lookups in a pipeline:
+
+        >>> from pycatia.in_interfaces.search_query import search, search_cache
+        >>> with search_cache:
+        >>>     found = search(document, points, attrs=['name', 'value'])
+        >>>     # no search is run.
+        >>>     found = search(document, points, attrs=['name', 'value'])
+
+"""
+
+import re
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+
+# SearchCache and search_cache are imported so they can still be imported from here.
+from pycatia.base_interfaces.com_cache import SearchCache
+from pycatia.base_interfaces.com_cache import com_object_key
+from pycatia.base_interfaces.com_cache import search_cache
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.document import Document
+
+search_scopes = ('all', 'in', 'sel', 'scr')
+
+# values made of these characters are written without quotes, like recorded macros.
+_plain_value = re.compile(r'^[\w.*]+$')
+
+
+def _quote(value) -> str:
+    value = str(value)
+    if "'" in value:
+        raise CATIAApplicationException(f'Search values can not contain a single quote: {value}.')
+    if _plain_value.match(value):
+        return value
+
+    return f"'{value}'"
+
+
+class SearchQuery:
+    """
+    Matches the elements of a workbench type whose name and attributes match.
+
+    :param str workbench: (optional) eg 'Part Design' or 'Generative Shape Design'.
+    :param str object_type: (optional) eg 'Pad' or 'Point'. The workbench and type are given together.
+    :param str name: (optional) the name, * can be used as a wildcard.
+    :param attributes: (optional) other attributes to match, eg color='Red' or visibility='Visible'. The
+        attribute names are capitalised, color becomes Color.
+    """
+
+    def __init__(self, workbench: str = None, object_type: str = None, name: str = None, **attributes):
+        if (workbench is None) != (object_type is None):
+            raise CATIAApplicationException('The workbench and type of a search query are given together.')
+
+        self.workbench = workbench
+        self.object_type = object_type
+        self.name = name
+        self.attributes = attributes
+
+    def where(self, **attributes) -> 'SearchQuery':
+        """
+        :param attributes: attributes to match in addition to those of this query.
+        :return: a new query.
+        :rtype: SearchQuery
+        """
+
+        return SearchQuery(self.workbench, self.object_type, self.name, **{**self.attributes, **attributes})
+
+    def criteria(self) -> str:
+        """
+        :return: the search string without the scope.
+        :rtype: str
+        """
+
+        terms = []
+        if self.object_type is not None:
+            terms.append(f"'{self.workbench}'.{self.object_type}")
+        if self.name is not None:
+            terms.append(f'Name={_quote(self.name)}')
+        for attribute, value in self.attributes.items():
+            terms.append(f'{attribute[:1].upper()}{attribute[1:]}={_quote(value)}')
+        if not terms:
+            raise CATIAApplicationException('An empty search query matches nothing.')
+
+        return ' & '.join(terms)
+
+    def compile(self, scope: str = 'all') -> str:
+        """
+        :param str scope: (optional) 'all' the whole document, 'in' the current UI active object, 'sel' the
+            current selection or 'scr' the visible elements.
+        :return: the search string.
+        :rtype: str
+        """
+
+        if scope not in search_scopes:
+            raise CATIAApplicationException(f'"{scope}" is not one of {search_scopes}.')
+
+        return f'{self.criteria()},{scope}'
+
+    def _operand(self) -> str:
+        criteria = self.criteria()
+        if ' & ' in criteria:
+            return f'({criteria})'
+
+        return criteria
+
+    def __and__(self, other: 'SearchQuery') -> 'SearchQuery':
+        return _CombinedQuery('&', self, other)
+
+    def __or__(self, other: 'SearchQuery') -> 'SearchQuery':
+        return _CombinedQuery('+', self, other)
+
+    def __sub__(self, other: 'SearchQuery') -> 'SearchQuery':
+        return _CombinedQuery('-', self, other)
+
+    def __eq__(self, other):
+        return isinstance(other, SearchQuery) and self.criteria() == other.criteria()
+
+    def __hash__(self):
+        return hash(self.criteria())
+
+    def __repr__(self):
+        return f'SearchQuery("{self.criteria()}")'
+
+
+class _CombinedQuery(SearchQuery):
+
+    def __init__(self, operator: str, left: SearchQuery, right: SearchQuery):
+        super().__init__()
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def where(self, **attributes) -> SearchQuery:
+        return self & SearchQuery(**attributes)
+
+    def criteria(self) -> str:
+        return f'{self.left._operand()} {self.operator} {self.right._operand()}'
+
+    def _operand(self) -> str:
+        return f'({self.criteria()})'
+
+
+def search(document: 'Document', query: Union[SearchQuery, str], scope: str = 'all',
+           attrs: Sequence[str] = ('type', 'name', 'value', 'display_name')) -> dict:
+    """
+    Search the document, see :meth:`~pycatia.in_interfaces.selection.Selection.search_fetch`. Within a
+    :data:`~pycatia.base_interfaces.com_cache.search_cache` context a repeated search returns the cached results
+    and doesn't change the selection.
+
+    :param Document document:
+    :param SearchQuery or str query: a query or a complete search string, including its scope.
+    :param str scope: (optional) see :meth:`SearchQuery.compile`.
+    :param list(str) attrs: (optional) the attributes to read.
+    :return: {attribute: [value of each element]}
+    :rtype: dict
+    """
+
+    if isinstance(query, SearchQuery):
+        search_string = query.compile(scope)
+    else:
+        search_string = query
+
+    key = None
+    if search_cache.enabled:
+        key = (com_object_key(document.com_object), search_string, tuple(attrs))
+        results = search_cache.get(key)
+        if results is not None:
+            return {attr: list(values) for attr, values in results.items()}
+
+    results = document.selection.search_fetch(search_string, attrs)
+    if key is not None:
+        search_cache.set(key, {attr: tuple(values) for attr, values in results.items()})
+
+    return results
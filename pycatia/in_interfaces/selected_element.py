@@ -316,7 +316,7 @@ class SelectedElement(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def __repr__(self):
         return f'SelectedElement(name="{self.name}")'
@@ -9,11 +9,12 @@
 
 """
 from typing import Iterator
-
-from pywintypes import com_error
+from typing import Sequence
 
 from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.exceptions import com_error
 from pycatia.in_interfaces.document import Document
+from pycatia.base_interfaces.com_cache import search_cache
 from pycatia.in_interfaces.selected_element import SelectedElement
 from pycatia.in_interfaces.vis_property_set import VisPropertySet
 from pycatia.scripts.checking import check_type
@@ -374,6 +375,7 @@ class Selection(AnyObject):
         :return: None
         :rtype: None
         """
+        search_cache.clear()
         return self.selection.Cut()
 
     def delete(self) -> None:
@@ -401,6 +403,7 @@ class Selection(AnyObject):
         :return: None
         :rtype: None
         """
+        search_cache.clear()
         return self.selection.Delete()
 
     def filter_correspondence(self, i_filter_type: tuple) -> bool:
@@ -911,8 +914,8 @@ class Selection(AnyObject):
         :rtype: str
         """
         vba_function_name = 'indicate_or_select_element_3d'
-        vba_code = f'''   
-        Public Function {vba_function_name}(selection, i_planar_geometric_object, i_message, i_filterType, i_object_selection_before_command_use_possibility, i_tooltip, i_triggering_on_mouse_move)
+        vba_code = '''   
+        Public Function indicate_or_select_element_3d(selection, i_planar_geometric_object, i_message, i_filterType, i_object_selection_before_command_use_possibility, i_tooltip, i_triggering_on_mouse_move)
         Dim o_object_selected
         Dim o_window_location_2d (1)
         Dim o_window_location_3d (2)
@@ -921,24 +924,23 @@ class Selection(AnyObject):
         o_output_state (1) = o_object_selected
         o_output_state (2) = o_window_location_2d
         o_output_state (3) = o_window_location_3d
-        {vba_function_name} = o_output_state
+        indicate_or_select_element_3d = o_output_state
         End Function
         '''
 
         system_service = self.application.system_service
-        result = system_service.evaluate(vba_code,
-                                         0,
-                                         vba_function_name,
-                                         [
-                                             self.selection,
-                                             i_planar_geometric_object.com_object,
-                                             i_message, i_filter_type,
-                                             i_object_selection_before_command_use_possibility,
-                                             i_tooltip,
-                                             i_triggering_on_mouse_move
-
-                                         ]
-                                         )
+        result = system_service.evaluate_function(vba_code,
+                                                  vba_function_name,
+                                                  [
+                                                      self.selection,
+                                                      i_planar_geometric_object.com_object,
+                                                      i_message, i_filter_type,
+                                                      i_object_selection_before_command_use_possibility,
+                                                      i_tooltip,
+                                                      i_triggering_on_mouse_move
+
+                                                  ]
+                                                  )
         
         return result
 
@@ -1041,6 +1043,7 @@ class Selection(AnyObject):
         :return: None
         :rtype: None
         """
+        search_cache.clear()
         return self.selection.Paste()
 
     def paste_special(self, i_format: str) -> None:
@@ -1153,6 +1156,7 @@ class Selection(AnyObject):
         :param str i_format:
         :return: None
         """
+        search_cache.clear()
         return self.selection.PasteSpecial(i_format)
 
     def remove(self, i_index):
@@ -1241,6 +1245,85 @@ class Selection(AnyObject):
             raise CATIAApplicationException(
                 f'The method Search failed with search string "{i_string_bstr}". Try changing your search string.')
 
+    def search_fetch(self, query: str, attrs: Sequence[str] = ('type', 'name', 'value', 'display_name')) -> dict:
+        """
+        Search the document and read attributes of all the found elements in one call rather than several
+        calls per element.
+
+        The attributes that can be read are:
+
+        * 'type': :attr:`SelectedElement.type`
+        * 'name': the name of :attr:`SelectedElement.value`
+        * 'value': :attr:`SelectedElement.value`
+        * 'display_name': the display name of :attr:`SelectedElement.reference`
+        * 'leaf_product': :attr:`SelectedElement.leaf_product`
+
+        Elements not exposed to automation are included with None for the attributes that can't be read.
+
+        :Example - The names of all the points of a part:
+
+            >>> selection = document.selection
+            >>> found = selection.search_fetch("'Generative Shape Design'.Point,all", attrs=['name'])
+            >>> print(found['name'])
+
+        :param str query: a search string, see :meth:`search`.
+        :param list(str) attrs: (optional) the attributes to read.
+        :return: {attribute: [value of each element]}
+        :rtype: dict
+        """
+
+        fetch_attrs = ('type', 'name', 'value', 'display_name', 'leaf_product')
+        for attr in attrs:
+            if attr not in fetch_attrs:
+                raise CATIAApplicationException(f'"{attr}" is not one of {fetch_attrs}.')
+
+        self.search(query)
+
+        vba_function_name = 'selection_search_fetch'
+        vba_code = '''
+        Public Function selection_search_fetch(selection, fetch)
+            n = selection.Count2
+            Dim types(), names(), values(), display_names(), leaf_products()
+            ReDim types(n - 1)
+            ReDim names(n - 1)
+            ReDim values(n - 1)
+            ReDim display_names(n - 1)
+            ReDim leaf_products(n - 1)
+            On Error Resume Next
+            For i = 1 To n
+                Set element = selection.Item2(i)
+                If fetch(0) Then types(i - 1) = element.Type
+                If fetch(1) Or fetch(2) Then
+                    Set value = Nothing
+                    Set value = element.Value
+                    If Not value Is Nothing Then
+                        If fetch(1) Then names(i - 1) = value.Name
+                        If fetch(2) Then Set values(i - 1) = value
+                    End If
+                End If
+                If fetch(3) Then display_names(i - 1) = element.Reference.DisplayName
+                If fetch(4) Then Set leaf_products(i - 1) = element.LeafProduct
+                Err.Clear
+            Next
+            On Error GoTo 0
+            selection_search_fetch = Array(types, names, values, display_names, leaf_products)
+        End Function
+        '''
+
+        system_service = self.application.system_service
+        fetched = system_service.evaluate_function(vba_code, vba_function_name,
+                                                   [self.selection, tuple(attr in attrs for attr in fetch_attrs)])
+
+        result = {}
+        for attr, values in zip(fetch_attrs, fetched):
+            if attr not in attrs:
+                continue
+            if attr in ('value', 'leaf_product'):
+                values = [AnyObject(value) if value is not None else None for value in values]
+            result[attr] = list(values)
+
+        return result
+
     def select_element2(self,
                         i_filter_type: tuple,
                         i_message: str,
@@ -196,7 +196,7 @@ class SystemConfiguration(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def is_product_authorized(self, i_product_name: str) -> bool:
         """
@@ -211,7 +211,7 @@ class Viewer(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def create_viewer_2d(self) -> 'Viewer2D':
         from pycatia.in_interfaces.viewer_2d import Viewer2D
@@ -213,7 +213,7 @@ class Viewpoint3D(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_sight_direction(self) -> tuple:
         """
@@ -247,7 +247,7 @@ class Viewpoint3D(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_up_direction(self) -> tuple:
         """
@@ -280,7 +280,7 @@ class Viewpoint3D(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def put_origin(self, origin: tuple) -> None:
         """
@@ -9,12 +9,22 @@
         
 """
 
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from pycatia.knowledge_interfaces.relation import Relation
 
 if TYPE_CHECKING:
     from pycatia.knowledge_interfaces.parameter import Parameter
+    from pycatia.system_interfaces.any_object import AnyObject
+
+
+def _to_float(value: str):
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
 
 class DesignTable(Relation):
     """
@@ -245,6 +255,184 @@ class DesignTable(Relation):
         """
         return self.design_table.CellAsString(i_row, i_column)
 
+    def _read_cells(self, configurations: Sequence[int], columns: Sequence[int], header: bool) -> list:
+        vba_function_name = 'design_table_read_cells'
+        vba_code = """
+        Public Function design_table_read_cells(design_table, configurations, columns, header)
+            Dim i, j, offset, rows, cells, row, result()
+            If IsArray(configurations) Then
+                ReDim rows(UBound(configurations))
+                For i = 0 To UBound(configurations)
+                    rows(i) = configurations(i) + 1
+                Next
+            Else
+                ReDim rows(design_table.ConfigurationsNb - 1)
+                For i = 0 To UBound(rows)
+                    rows(i) = i + 2
+                Next
+            End If
+            If IsArray(columns) Then
+                cells = columns
+            Else
+                ReDim cells(design_table.ColumnsNb - 1)
+                For j = 0 To UBound(cells)
+                    cells(j) = j + 1
+                Next
+            End If
+            offset = 0
+            If header Then offset = 1
+            ReDim result(UBound(rows) + offset)
+            If UBound(cells) < 0 Then
+                design_table_read_cells = result
+                Exit Function
+            End If
+            For i = 0 - offset To UBound(rows)
+                ReDim row(UBound(cells))
+                For j = 0 To UBound(cells)
+                    If i < 0 Then
+                        row(j) = design_table.CellAsString(1, cells(j))
+                    Else
+                        row(j) = design_table.CellAsString(rows(i), cells(j))
+                    End If
+                Next
+                result(i + offset) = row
+            Next
+            design_table_read_cells = result
+        End Function
+        """
+
+        system_service = self.application.system_service
+        result = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [
+                self.design_table,
+                tuple(configurations) if configurations is not None else None,
+                tuple(columns) if columns is not None else None,
+                header
+            ]
+        )
+
+        return [list(row) if row is not None else [] for row in (result or ())]
+
+    def to_rows(self, configurations: Sequence[int] = None, columns: Sequence[int] = None,
+                numeric: bool = False) -> list:
+        """
+        Read the cells of many configurations with one call to SystemService.evaluate() rather than one call
+        per cell with :meth:`cell_as_string`.
+
+        Configuration n is row n + 1 of the sheet, row 1 holding the column names (see :meth:`column_names`).
+
+        :Example - Read the whole sheet as numbers:
+
+            >>> rows = design_table.to_rows(numeric=True)
+            >>> print(rows[0])
+            [110.0, 1.0, 5.0, 10.0]
+
+        :param list(int) configurations: (optional) the configuration numbers (1 to :attr:`configurations_nb`)
+            to read. Defaults to all of them.
+        :param list(int) columns: (optional) the column numbers (1 to :attr:`columns_nb`) to read. Defaults to
+            all of them.
+        :param bool numeric: (optional) convert the cells to float. Cells that aren't numbers are None.
+        :return: a list of cells for each configuration.
+        :rtype: list(list)
+        """
+
+        if configurations is not None and len(configurations) == 0:
+            return []
+
+        rows = self._read_cells(configurations, columns, False)
+        if numeric:
+            rows = [[_to_float(cell) for cell in row] for row in rows]
+
+        return rows
+
+    def to_columns(self, configurations: Sequence[int] = None, columns: Sequence[int] = None,
+                   numeric: bool = False) -> dict:
+        """
+        Read the cells of many configurations with one call to SystemService.evaluate() and return them by
+        column.
+
+        :Example - Get the values of a column:
+
+            >>> columns = design_table.to_columns(numeric=True)
+            >>> print(columns['d(mm)'])
+            [1.0, 2.0, 3.0]
+
+        :param list(int) configurations: (optional) see :meth:`to_rows`.
+        :param list(int) columns: (optional) see :meth:`to_rows`.
+        :param bool numeric: (optional) see :meth:`to_rows`.
+        :return: {column name: [cell of each configuration]}
+        :rtype: dict
+        """
+
+        names, *rows = self._read_cells(configurations, columns, True)
+        if numeric:
+            rows = [[_to_float(cell) for cell in row] for row in rows]
+
+        return {name: [row[j] for row in rows] for j, name in enumerate(names)}
+
+    def column_names(self, columns: Sequence[int] = None) -> list:
+        """
+        :param list(int) columns: (optional) the column numbers. Defaults to all of them.
+        :return: the names in the first row of the sheet.
+        :rtype: list(str)
+        """
+
+        return self._read_cells((), columns, True)[0]
+
+    def find_configuration(self, values: dict) -> int:
+        """
+        Find the first configuration matching all the values given.
+
+        :Example - Find and apply a configuration:
+
+            >>> configuration = design_table.find_configuration({'design': '120'})
+            >>> design_table.apply_configuration(configuration, update=part)
+
+        :param dict values: {column name: cell} the cells are compared as strings.
+        :return: the configuration number or None if none match.
+        :rtype: int
+        """
+
+        columns = self.to_columns()
+        missing = [name for name in values if name not in columns]
+        if missing:
+            raise KeyError(f'Could not find columns {missing} in design table "{self.name}".')
+
+        rows = zip(*(columns[name] for name in values))
+        cells = tuple(str(value) for value in values.values())
+        for i, row in enumerate(rows):
+            if row == cells:
+                return i + 1
+
+        return None
+
+    def apply_configuration(self, configuration: int, update: 'AnyObject' = None) -> None:
+        """
+        Set the current configuration and update update once, with one call to SystemService.evaluate().
+
+        :param int configuration: 1 to :attr:`configurations_nb`.
+        :param AnyObject update: (optional) a Part or Product updated after the configuration is set.
+        :return: None
+        """
+
+        vba_function_name = 'design_table_apply_configuration'
+        vba_code = """
+        Public Function design_table_apply_configuration(design_table, configuration, update)
+            design_table.Configuration = configuration
+            If IsObject(update) Then update.Update
+            design_table_apply_configuration = configuration
+        End Function
+        """
+
+        system_service = self.application.system_service
+        system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [self.design_table, configuration, update.com_object if update is not None else None]
+        )
+
     def remove_association(self, i_sheet_column: str) -> None:
         """
         .. note::
@@ -12,9 +12,9 @@ from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import Optional
 
-from pywintypes import com_error
-
+from pycatia.base_interfaces.com_cache import search_cache
 from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.exceptions import com_error
 from pycatia.knowledge_interfaces.bool_param import BoolParam
 from pycatia.knowledge_interfaces.dimension import Dimension
 from pycatia.knowledge_interfaces.int_param import IntParam
@@ -426,20 +426,24 @@ class Parameters(Collection):
 
         p: any_parameter
 
-        if not self.is_parameter(index):
+        try:
+            parameter = self.parameters.Item(index)
+        except com_error:
             raise CATIAApplicationException(f'Could not find parameter name "{index}".')
 
-        if isinstance(self.parameters.Item(index).value, bool):
-            p = BoolParam(self.parameters.Item(index))
+        value = parameter.Value
+
+        if isinstance(value, bool):
+            p = BoolParam(parameter)
 
-        elif isinstance(self.parameters.Item(index).value, int):
-            p = IntParam(self.parameters.Item(index))
+        elif isinstance(value, int):
+            p = IntParam(parameter)
 
-        elif isinstance(self.parameters.Item(index).value, str):
-            p = StrParam(self.parameters.Item(index))
+        elif isinstance(value, str):
+            p = StrParam(parameter)
 
-        elif isinstance(self.parameters.Item(index).value, float):
-            p = RealParam(self.parameters.Item(index))
+        elif isinstance(value, float):
+            p = RealParam(parameter)
 
         else:
 
@@ -447,6 +451,135 @@ class Parameters(Collection):
 
         return p
 
+    def read_all(self) -> dict:
+        """
+        Read every parameter in the collection with one call to SystemService.evaluate().
+
+        For each parameter the kind (the CATIA type name eg 'RealParam', 'Length', 'StrParam'), the value as a
+        string, the value of numeric parameters and the unit symbol of dimensions are returned.
+
+        :Example - Print the lengths of a part:
+
+            >>> for name, reading in part.parameters.read_all().items():
+            >>>     if reading['kind'] == 'Length':
+            >>>         print(name, reading['value'], reading['unit'])
+
+        :return: {name: {'kind': str, 'value_as_string': str, 'value': float or None, 'unit': str}}
+        :rtype: dict
+        """
+
+        vba_function_name = 'parameters_read_all'
+        vba_code = """
+        Public Function parameters_read_all(parameters)
+            Dim count, i, parameter, value, names, kinds, strings, values, units
+            count = parameters.Count
+            If count = 0 Then
+                parameters_read_all = Array()
+                Exit Function
+            End If
+            ReDim names(count - 1), kinds(count - 1), strings(count - 1), values(count - 1), units(count - 1)
+            For i = 1 To count
+                Set parameter = parameters.Item(i)
+                names(i - 1) = parameter.Name
+                kinds(i - 1) = TypeName(parameter)
+                strings(i - 1) = ""
+                units(i - 1) = ""
+                On Error Resume Next
+                strings(i - 1) = parameter.ValueAsString
+                value = Empty
+                value = parameter.Value
+                Select Case VarType(value)
+                    Case 2, 3, 4, 5, 6, 14, 17, 20
+                        values(i - 1) = value
+                End Select
+                units(i - 1) = parameter.Unit.Symbol
+                On Error Goto 0
+            Next
+            parameters_read_all = Array(names, kinds, strings, values, units)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        columns = system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
+        if not columns:
+            return {}
+
+        return {
+            name: {'kind': kind, 'value_as_string': value_as_string, 'value': value, 'unit': unit}
+            for name, kind, value_as_string, value, unit in zip(*columns)
+        }
+
+    def write_many(self, values: dict, update: AnyObject = None) -> None:
+        """
+        Set the values of many parameters with one call to SystemService.evaluate().
+
+        Values are set like :attr:`Parameter.value` except that a string given for a parameter that isn't a
+        string parameter is set with :meth:`Parameter.valuate_from_string` so it may include units eg '25mm'.
+        All the parameter names are checked before any value is set.
+
+        :Example - Apply a variant and update the part once:
+
+            >>> part.parameters.write_many({
+            >>>     'Length.1': 120.0,
+            >>>     'Material_Code': 'AL6061',
+            >>>     'Thickness': '3mm',
+            >>> }, update=part)
+
+        :param dict values: {parameter name: value}
+        :param AnyObject update: (optional) a Part or Product updated once, with its update() method, after all
+            the values are set.
+        :return: None
+        """
+
+        if not values:
+            return
+
+        vba_function_name = 'parameters_write_many'
+        vba_code = """
+        Public Function parameters_write_many(parameters, names, values)
+            Dim i, missing, items()
+            ReDim items(UBound(names))
+            missing = ""
+            For i = 0 To UBound(names)
+                Set items(i) = Nothing
+                On Error Resume Next
+                Set items(i) = parameters.Item(names(i))
+                On Error Goto 0
+                If items(i) Is Nothing Then missing = missing & vbTab & names(i)
+            Next
+            If missing <> "" Then
+                parameters_write_many = Mid(missing, 2)
+                Exit Function
+            End If
+            For i = 0 To UBound(names)
+                If VarType(values(i)) = vbString And TypeName(items(i)) <> "StrParam" Then
+                    items(i).ValuateFromString values(i)
+                Else
+                    items(i).Value = values(i)
+                End If
+            Next
+            parameters_write_many = ""
+        End Function
+        """
+
+        system_service = self.application.system_service
+        missing = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [
+                self.com_object,
+                tuple(values.keys()),
+                tuple(values.values()),
+            ]
+        )
+        if missing:
+            missing = missing.split('\t')
+            raise CATIAApplicationException(f'Could not find parameter names {missing}. No values were set.')
+
+        search_cache.clear()
+        if update is not None:
+            update.update()
+
     def remove(self, i_index: cat_variant) -> None:
         """
         .. note::
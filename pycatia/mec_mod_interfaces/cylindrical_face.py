@@ -106,7 +106,7 @@ class CylindricalFace(Face):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_origin(self) -> tuple:
         """
@@ -142,7 +142,7 @@ class CylindricalFace(Face):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def __repr__(self):
         return f'CylindricalFace(name="{self.name}")'
@@ -8,7 +8,10 @@
         and thus help debugging in pycatia.
 
 """
+import functools
+from types import FunctionType
 
+from pycatia.base_interfaces.com_cache import search_cache
 from pycatia.system_interfaces.any_object import AnyObject
 
 
@@ -31,9 +34,27 @@ class Factory(AnyObject):
 
     """
 
+    # methods of subclasses starting with these names create elements and clear the search cache.
+    _creating_methods = ('add_new',)
+
     def __init__(self, com_object):
         super().__init__(com_object)
         self.factory = com_object
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if isinstance(attribute, FunctionType) and name.startswith(cls._creating_methods):
+                setattr(cls, name, _clears_search_cache(attribute))
+
     def __repr__(self):
         return f'Factory(name="{self.name}")'
+
+
+def _clears_search_cache(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        search_cache.clear()
+        return method(self, *args, **kwargs)
+
+    return wrapper
@@ -10,9 +10,8 @@
 """
 from typing import Iterator
 
-from pywintypes import com_error
-
 from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.exception_handling.exceptions import com_error
 from pycatia.mec_mod_interfaces.hybrid_body import HybridBody
 from pycatia.system_interfaces.collection import Collection
 from pycatia.types.general import cat_variant
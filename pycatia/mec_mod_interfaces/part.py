@@ -14,6 +14,7 @@ from pathlib import Path
 from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.hybrid_shape_interfaces.hybrid_shape_factory import HybridShapeFactory
 from pycatia.in_interfaces.reference import Reference
+from pycatia.base_interfaces.com_cache import search_cache
 from pycatia.knowledge_interfaces.parameters import Parameters
 from pycatia.knowledge_interfaces.relations import Relations
 from pycatia.mec_mod_interfaces.axis_systems import AxisSystems
@@ -915,6 +916,7 @@ class Part(AnyObject):
         :return: None
         :rtype: None
         """
+        search_cache.clear()
         return self.part.Update()
 
     def update_object(self, i_object: AnyObject) -> None:
@@ -945,6 +947,7 @@ class Part(AnyObject):
         :return: None
         :rtype: None
         """
+        search_cache.clear()
         return self.part.UpdateObject(i_object.com_object)
 
     def __repr__(self):
@@ -1 +1,6 @@
 #! /usr/bin/python3.9
+
+from pycatia.base_interfaces.lazy_loader import lazy_loader
+
+# submodules are imported on first use.
+__getattr__, __dir__ = lazy_loader(__name__, __path__)
@@ -81,7 +81,7 @@ class AssemblyConvertor(AnyObject):
         End Function
         """
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object, i_file_type, str(i_file), i_product.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object, i_file_type, str(i_file), i_product.com_object])
 
     def set_current_format(self, ilist_props: tuple) -> None:
         """
@@ -0,0 +1,239 @@
+#! /usr/bin/python3.9
+"""
+
+    Bills of materials computed from a :class:`~pycatia.product_structure_interfaces.product_snapshot.ProductSnapshot`.
+
+    The product structure is collected with one call to CATIA. The quantities of every level are then computed in
+    python and the rows can be written to CSV or JSON one at a time.
+
+    :Example - Write a flattened and an indented BOM grouped by part number and a user defined property:
+
+        >>> from pycatia.product_structure_interfaces.bill_of_materials import BillOfMaterials
+        >>> product = caa.active_document.product
+        >>> bom = BillOfMaterials.from_product(product, group_by=['part_number', 'Material'])
+        >>> with open('flattened.csv', 'w', newline='') as file:
+        >>>     bom.write_csv(file)
+        >>> with open('indented.json', 'w') as file:
+        >>>     bom.write_json(file, indented=True)
+
+"""
+
+import csv
+import json
+from typing import Iterator
+from typing import Sequence
+from typing import TextIO
+from typing import TYPE_CHECKING
+
+from pycatia.product_structure_interfaces.product_snapshot import ProductSnapshot
+
+if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product import Product
+
+_node_properties = ('name', 'part_number', 'nomenclature', 'revision', 'full_name', 'file_name', 'document_type')
+
+
+class BillOfMaterials:
+    """
+    A bill of materials of the product structure in snapshot.
+
+    Rows are grouped by the properties in group_by. These can be SnapshotNode properties (eg 'part_number',
+    'revision') or user defined properties collected by the snapshot. The properties in columns are added to
+    each row from the first product in the group.
+
+    :param ProductSnapshot snapshot:
+    :param list(str) group_by: (optional) properties identifying a row. Defaults to ['part_number'].
+    :param list(str) columns: (optional) other properties written for each row. Defaults to
+        ['nomenclature', 'revision', 'document_type'].
+    """
+
+    def __init__(self, snapshot: ProductSnapshot, group_by: Sequence[str] = ('part_number',),
+                 columns: Sequence[str] = ('nomenclature', 'revision', 'document_type')):
+        self.snapshot = snapshot
+        self.group_by = tuple(group_by)
+        self.columns = tuple(c for c in columns if c not in self.group_by)
+        for name in self.group_by + self.columns:
+            if name not in _node_properties and name not in snapshot.user_ref_properties:
+                raise ValueError(f'"{name}" is neither a product property nor a user defined property of the '
+                                 f'snapshot.')
+        self._keys = None
+
+    @classmethod
+    def from_product(cls, product: 'Product', group_by: Sequence[str] = ('part_number',),
+                     columns: Sequence[str] = ('nomenclature', 'revision', 'document_type')) -> 'BillOfMaterials':
+        """
+        Take a snapshot of product, collecting any user defined properties in group_by and columns, and create
+        the bill of materials.
+
+        :param Product product:
+        :param list(str) group_by:
+        :param list(str) columns:
+        :return: BillOfMaterials
+        """
+
+        user_ref_properties = [name for name in dict.fromkeys(tuple(group_by) + tuple(columns))
+                               if name not in _node_properties]
+
+        return cls(product.snapshot(user_ref_properties), group_by, columns)
+
+    @property
+    def fieldnames(self) -> tuple:
+        """
+        :return: the keys of the rows of :meth:`flattened`.
+        :rtype: tuple
+        """
+
+        return self.group_by + self.columns + ('quantity',)
+
+    @property
+    def indented_fieldnames(self) -> tuple:
+        """
+        :return: the keys of the rows of :meth:`indented`.
+        :rtype: tuple
+        """
+
+        return ('level',) + self.group_by + self.columns + ('quantity', 'total_quantity')
+
+    def _column(self, name: str) -> list:
+        if name in self.snapshot.user_ref_properties:
+            return [self.snapshot.user_ref_property(i, name) for i in range(len(self.snapshot))]
+        if name == 'file_name':
+            return [node.file_name for node in self.snapshot]
+
+        return getattr(self.snapshot, f'{name}s')
+
+    def keys(self) -> list:
+        """
+        :return: the group_by values of each node of the snapshot.
+        :rtype: list(tuple)
+        """
+
+        if self._keys is None:
+            self._keys = list(zip(*(self._column(name) for name in self.group_by)))
+
+        return self._keys
+
+    def _row(self, index: int) -> dict:
+        row = dict(zip(self.group_by, self.keys()[index]))
+        for name in self.columns:
+            if name in self.snapshot.user_ref_properties:
+                row[name] = self.snapshot.user_ref_property(index, name)
+            else:
+                row[name] = getattr(self.snapshot[index], name)
+
+        return row
+
+    def flattened(self, document_types: Sequence[str] = None) -> Iterator[dict]:
+        """
+        The total quantity of each group in the whole product structure. The root product isn't included.
+
+        :param list(str) document_types: (optional) only count products of these document types eg
+            ['CATPart'] for a parts list.
+        :return: Iterator[dict] of rows with the keys :attr:`fieldnames` in the order first found.
+        """
+
+        keys = self.keys()
+        types = self.snapshot.document_types
+        quantities = {}
+        first = {}
+        for i in range(1, len(keys)):
+            if document_types is not None and types[i] not in document_types:
+                continue
+            key = keys[i]
+            if key in quantities:
+                quantities[key] += 1
+            else:
+                quantities[key] = 1
+                first[key] = i
+
+        for key, quantity in quantities.items():
+            row = self._row(first[key])
+            row['quantity'] = quantity
+            yield row
+
+    def indented(self, max_depth: int = None) -> Iterator[dict]:
+        """
+        The product structure with the children of each product grouped. quantity is the number of the group in
+        its parent and total_quantity the number in the whole product structure. The children of a group are
+        listed once, from the first product of the group.
+
+        :param int max_depth: (optional) the deepest level to include.
+        :return: Iterator[dict] of rows with the keys :attr:`indented_fieldnames` in tree order.
+        """
+
+        snapshot = self.snapshot
+        stack = self._child_groups(0, 1)[::-1]
+        while stack:
+            index, row = stack.pop()
+            yield row
+            if max_depth is None or snapshot.depths[index] < max_depth:
+                stack.extend(self._child_groups(index, row['total_quantity'])[::-1])
+
+    def _child_groups(self, index: int, parent_total: int) -> list:
+        keys = self.keys()
+        groups = {}
+        for child in self.snapshot.child_indices(index):
+            if keys[child] in groups:
+                groups[keys[child]][1] += 1
+            else:
+                groups[keys[child]] = [child, 1]
+
+        child_groups = []
+        for child, quantity in groups.values():
+            row = {'level': self.snapshot.depths[child]}
+            row.update(self._row(child))
+            row['quantity'] = quantity
+            row['total_quantity'] = quantity * parent_total
+            child_groups.append((child, row))
+
+        return child_groups
+
+    def write_csv(self, file: TextIO, indented: bool = False, **kwargs) -> int:
+        """
+        Write the rows to the open file as CSV one row at a time.
+
+        :param file: a file opened with newline=''.
+        :param bool indented: (optional) write :meth:`indented` rather than :meth:`flattened`.
+        :param kwargs: passed to :meth:`flattened` or :meth:`indented`.
+        :return: the number of rows written.
+        :rtype: int
+        """
+
+        fieldnames = self.indented_fieldnames if indented else self.fieldnames
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        count = 0
+        for row in (self.indented(**kwargs) if indented else self.flattened(**kwargs)):
+            writer.writerow(row)
+            count += 1
+
+        return count
+
+    def write_json(self, file: TextIO, indented: bool = False, lines: bool = False, **kwargs) -> int:
+        """
+        Write the rows to the open file as a JSON array, or as JSON lines, one row at a time.
+
+        :param file:
+        :param bool indented: (optional) write :meth:`indented` rather than :meth:`flattened`.
+        :param bool lines: (optional) write one JSON object per line rather than an array.
+        :param kwargs: passed to :meth:`flattened` or :meth:`indented`.
+        :return: the number of rows written.
+        :rtype: int
+        """
+
+        count = 0
+        if not lines:
+            file.write('[')
+        for row in (self.indented(**kwargs) if indented else self.flattened(**kwargs)):
+            if lines:
+                file.write(json.dumps(row) + '\n')
+            else:
+                file.write((',\n' if count else '\n') + json.dumps(row))
+            count += 1
+        if not lines:
+            file.write('\n]\n' if count else ']\n')
+
+        return count
+
+    def __repr__(self):
+        return f'BillOfMaterials(group_by={list(self.group_by)})'
@@ -0,0 +1,415 @@
+#! /usr/bin/python3.9
+"""
+
+    Mass properties of an assembly rolled up from its leaf products.
+
+    The mass, gravity centre and inertia matrix of the reference product of each leaf of a
+    :class:`~pycatia.product_structure_interfaces.product_snapshot.ProductSnapshot` are collected with one call to
+    CATIA, once per distinct part. The totals of the assembly are then computed in python using the positions of
+    the snapshot. When some parts change only those are analysed again and the totals are updated by removing
+    their previous contribution and adding the new one.
+
+    The leaves must be loaded in design mode (see Product.apply_work_mode()) to be analysed.
+
+    :Example - Weight control of an assembly:
+
+        >>> from pycatia.product_structure_interfaces.mass_properties import MassRollup
+        >>> rollup = MassRollup.from_product(product)
+        >>> print(rollup.mass, rollup.gravity_center)
+        >>> # after changing the part 'Bracket-01'
+        >>> rollup.refresh(part_numbers=['Bracket-01'])
+        >>> print(rollup.mass, rollup.gravity_center)
+
+    Masses are in kg and gravity centres in mm as returned by Analyze. The inertia matrices are about the
+    gravity centre in kg.m², so gravity centre offsets are multiplied by length_scale (0.001 by default) in the
+    parallel axis terms.
+
+"""
+
+from typing import Iterable
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.product_structure_interfaces.product_snapshot import ProductSnapshot
+
+if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product import Product
+
+_zero = (0.0,) * 9
+
+
+def _rotation(position: Sequence[float]) -> tuple:
+    # the columns of the rotation matrix are the x, y and z axis vectors of the position.
+    return tuple(position[3 * j + k] for k in range(3) for j in range(3))
+
+
+def _rotate_vector(rotation: Sequence[float], v: Sequence[float]) -> tuple:
+    return tuple(sum(rotation[3 * k + j] * v[j] for j in range(3)) for k in range(3))
+
+
+def _rotate_matrix(rotation: Sequence[float], matrix: Sequence[float]) -> tuple:
+    # rotation . matrix . transpose(rotation)
+    rm = [sum(rotation[3 * k + i] * matrix[3 * i + j] for i in range(3)) for k in range(3) for j in range(3)]
+
+    return tuple(sum(rm[3 * k + i] * rotation[3 * j + i] for i in range(3)) for k in range(3) for j in range(3))
+
+
+def _point_mass_inertia(mass: float, d: Sequence[float]) -> tuple:
+    # the inertia of a point mass at d about the origin: mass * (|d|² E - d d^T).
+    d2 = d[0] * d[0] + d[1] * d[1] + d[2] * d[2]
+
+    return tuple(
+        mass * ((d2 if k == j else 0.0) - d[k] * d[j]) for k in range(3) for j in range(3)
+    )
+
+
+class MassProperties:
+    """
+    The mass, gravity centre and inertia matrix (about the gravity centre) of a product.
+
+    :param float mass:
+    :param tuple gravity_center: (x, y, z)
+    :param tuple inertia: the 9 components of the inertia matrix as returned by Analyze.get_inertia().
+    """
+
+    __slots__ = ('mass', 'gravity_center', 'inertia')
+
+    def __init__(self, mass: float, gravity_center: Sequence[float], inertia: Sequence[float]):
+        self.mass = float(mass)
+        self.gravity_center = tuple(float(c) for c in gravity_center)
+        self.inertia = tuple(float(c) for c in inertia)
+        if len(self.gravity_center) != 3 or len(self.inertia) != 9:
+            raise ValueError('gravity_center must have 3 components and inertia 9.')
+
+    def transformed(self, position: Sequence[float]) -> 'MassProperties':
+        """
+        :param tuple position: the 12 position components of the product in the target axis system.
+        :return: the mass properties expressed in the target axis system.
+        :rtype: MassProperties
+        """
+
+        rotation = _rotation(position)
+        center = _rotate_vector(rotation, self.gravity_center)
+
+        return MassProperties(
+            self.mass,
+            tuple(position[9 + k] + center[k] for k in range(3)),
+            _rotate_matrix(rotation, self.inertia)
+        )
+
+    @classmethod
+    def combine(cls, items: Iterable['MassProperties'], length_scale: float = 0.001) -> 'MassProperties':
+        """
+        The mass properties of several products given in the same axis system.
+
+        :param items: MassProperties
+        :param float length_scale: (optional) converts gravity centre offsets to the length unit of the
+            inertia matrices.
+        :return: MassProperties
+        """
+
+        items = list(items)
+        mass = sum(item.mass for item in items)
+        if mass == 0:
+            return cls(0.0, (0.0, 0.0, 0.0), _zero)
+
+        center = tuple(sum(item.mass * item.gravity_center[k] for item in items) / mass for k in range(3))
+        inertia = [0.0] * 9
+        for item in items:
+            d = [(item.gravity_center[k] - center[k]) * length_scale for k in range(3)]
+            for k, value in enumerate(_point_mass_inertia(item.mass, d)):
+                inertia[k] += item.inertia[k] + value
+
+        return cls(mass, center, inertia)
+
+    def __repr__(self):
+        return f'MassProperties(mass={self.mass}, gravity_center={self.gravity_center})'
+
+
+class MassRollup:
+    """
+    The mass properties of the product structure in snapshot, in the axis system of its root product.
+
+    Each leaf contributes its mass, its mass moment and its inertia about a fixed reference point. The totals
+    are kept up to date so changing the properties of a few leaves doesn't recompute the whole assembly.
+
+    :param ProductSnapshot snapshot:
+    :param dict properties: {node index: MassProperties} of the reference product of each leaf.
+    :param float length_scale: (optional) see :meth:`MassProperties.combine`.
+    :param Product product: (optional) the product the snapshot was taken from. Needed by :meth:`refresh`.
+    """
+
+    def __init__(self, snapshot: ProductSnapshot, properties: dict, length_scale: float = 0.001,
+                 product: 'Product' = None):
+        self.snapshot = snapshot
+        self.length_scale = length_scale
+        self.product = product
+        self.leaves = [node.index for node in snapshot.leaves()]
+        self._leaf_set = set(self.leaves)
+        self._properties = {}
+        self._contributions = {}
+        self._mass = 0.0
+        self._moment = [0.0, 0.0, 0.0]
+        self._inertia = [0.0] * 9
+        self._positions = {}
+
+        # the reference point is near the assembly so the sums don't lose precision.
+        self._reference = (0.0, 0.0, 0.0)
+        reference = MassProperties.combine(
+            (properties[i].transformed(self._absolute_position(i)) for i in self.leaves if i in properties),
+            length_scale
+        )
+        if reference.mass:
+            self._reference = reference.gravity_center
+
+        self.update(properties)
+
+    @classmethod
+    def from_product(cls, product: 'Product', length_scale: float = 0.001) -> 'MassRollup':
+        """
+        Take a snapshot of product and collect the mass properties of its leaves.
+
+        :param Product product:
+        :param float length_scale: (optional)
+        :return: MassRollup
+        """
+
+        snapshot = product.snapshot()
+        leaves = [node.index for node in snapshot.leaves()]
+
+        return cls(snapshot, collect_mass_properties(product, snapshot, leaves), length_scale, product)
+
+    def _absolute_position(self, index: int) -> tuple:
+        position = self._positions.get(index)
+        if position is None:
+            position = self._positions[index] = self.snapshot.absolute_position(index)
+
+        return position
+
+    def _contribution(self, index: int, properties: MassProperties) -> tuple:
+        absolute = properties.transformed(self._absolute_position(index))
+        d = [(absolute.gravity_center[k] - self._reference[k]) * self.length_scale for k in range(3)]
+        point = _point_mass_inertia(absolute.mass, d)
+
+        return (
+            absolute.mass,
+            tuple(absolute.mass * c for c in absolute.gravity_center),
+            tuple(absolute.inertia[k] + point[k] for k in range(9)),
+        )
+
+    def update(self, properties: dict) -> None:
+        """
+        Set the mass properties of some leaves and update the totals.
+
+        :param dict properties: {node index: MassProperties} of the reference product of the leaf.
+        :return: None
+        """
+
+        for index, leaf_properties in properties.items():
+            if index not in self._leaf_set:
+                raise CATIAApplicationException(f'Node {index} is not a leaf of the snapshot.')
+            old = self._contributions.get(index)
+            if old is not None:
+                self._add(old, -1.0)
+            new = self._contribution(index, leaf_properties)
+            self._add(new, 1.0)
+            self._contributions[index] = new
+            self._properties[index] = leaf_properties
+
+    def _add(self, contribution: tuple, sign: float) -> None:
+        mass, moment, inertia = contribution
+        self._mass += sign * mass
+        for k in range(3):
+            self._moment[k] += sign * moment[k]
+        for k in range(9):
+            self._inertia[k] += sign * inertia[k]
+
+    def refresh(self, part_numbers: Sequence[str] = None, indices: Sequence[int] = None) -> None:
+        """
+        Collect the mass properties of some leaves from CATIA again and update the totals. Each part is
+        analysed once whatever its number of instances.
+
+        :param list(str) part_numbers: (optional) refresh the leaves with these part numbers.
+        :param list(int) indices: (optional) refresh these leaves. All the leaves are refreshed if neither
+            part_numbers nor indices are given.
+        :return: None
+        """
+
+        if self.product is None:
+            raise CATIAApplicationException('The rollup was not created from a product.')
+
+        if part_numbers is None and indices is None:
+            leaves = self.leaves
+        else:
+            wanted = set(part_numbers or ())
+            leaves = set(indices or ()) | {i for i in self.leaves if self.snapshot.part_numbers[i] in wanted}
+            leaves = sorted(leaves)
+
+        self.update(collect_mass_properties(self.product, self.snapshot, leaves))
+
+    def properties(self, index: int) -> MassProperties:
+        """
+        :param int index: a leaf of the snapshot.
+        :return: the mass properties of the reference product of the leaf.
+        :rtype: MassProperties
+        """
+
+        return self._properties.get(index)
+
+    def totals(self, index: int = 0) -> MassProperties:
+        """
+        :param int index: (optional) a node of the snapshot. Defaults to the root product.
+        :return: the mass properties of the node in the axis system of the root product. The totals of the
+            root product are kept up to date; those of other nodes are computed from their leaves.
+        :rtype: MassProperties
+        """
+
+        if index == 0:
+            return self._totals(self._mass, self._moment, self._inertia)
+
+        mass, moment, inertia = 0.0, [0.0] * 3, [0.0] * 9
+        for i in (index,) + tuple(self.snapshot.descendant_indices(index)):
+            contribution = self._contributions.get(i)
+            if contribution is not None:
+                mass += contribution[0]
+                for k in range(3):
+                    moment[k] += contribution[1][k]
+                for k in range(9):
+                    inertia[k] += contribution[2][k]
+
+        return self._totals(mass, moment, inertia)
+
+    def _totals(self, mass: float, moment: Sequence[float], inertia: Sequence[float]) -> MassProperties:
+        if mass == 0:
+            return MassProperties(0.0, (0.0, 0.0, 0.0), _zero)
+
+        center = tuple(moment[k] / mass for k in range(3))
+        e = [(center[k] - self._reference[k]) * self.length_scale for k in range(3)]
+        point = _point_mass_inertia(mass, e)
+
+        return MassProperties(mass, center, tuple(inertia[k] - point[k] for k in range(9)))
+
+    @property
+    def mass(self) -> float:
+        """
+        :return: the total mass.
+        :rtype: float
+        """
+
+        return self._mass
+
+    @property
+    def gravity_center(self) -> tuple:
+        """
+        :return: the gravity centre of the assembly in the axis system of the root product.
+        :rtype: tuple
+        """
+
+        return self.totals().gravity_center
+
+    @property
+    def inertia(self) -> tuple:
+        """
+        :return: the inertia matrix of the assembly about its gravity centre.
+        :rtype: tuple
+        """
+
+        return self.totals().inertia
+
+    def __repr__(self):
+        return f'MassRollup(leaves={len(self.leaves)}, mass={self._mass})'
+
+
+def collect_mass_properties(product: 'Product', snapshot: ProductSnapshot, indices: Sequence[int]) -> dict:
+    """
+    Collect the mass properties of the reference products of the nodes indices of a snapshot of product with one
+    call to SystemService.evaluate(). Nodes with the same part and document share one analysis. Products that
+    can't be analysed have no mass.
+
+    :param Product product: the product the snapshot was taken from.
+    :param ProductSnapshot snapshot:
+    :param list(int) indices:
+    :return: {node index: MassProperties}
+    :rtype: dict
+    """
+
+    vba_function_name = 'mass_properties_collect'
+    vba_code = """
+    Dim mass_visit_count, mass_last, mass_wanted, mass_values
+
+    Public Function mass_properties_collect(product, indices)
+        Dim i
+        Set mass_wanted = CreateObject("Scripting.Dictionary")
+        mass_last = -1
+        For i = 0 To UBound(indices)
+            mass_wanted(CLng(indices(i))) = i
+            If indices(i) > mass_last Then mass_last = indices(i)
+        Next
+        ReDim mass_values(13 * (UBound(indices) + 1) - 1)
+        For i = 0 To UBound(mass_values)
+            mass_values(i) = 0.0
+        Next
+        mass_visit_count = 0
+        mass_properties_visit product
+        mass_properties_collect = mass_values
+    End Function
+
+    Sub mass_properties_visit(product)
+        Dim index, i, j, count, analyze, mass, center(2), inertia(8)
+        index = mass_visit_count
+        mass_visit_count = index + 1
+        If mass_wanted.Exists(CLng(index)) Then
+            j = 13 * mass_wanted(CLng(index))
+            On Error Resume Next
+            Err.Clear
+            Set analyze = product.ReferenceProduct.Analyze
+            mass = analyze.Mass
+            analyze.GetGravityCenter center
+            analyze.GetInertia inertia
+            If Err.Number = 0 Then
+                mass_values(j) = mass
+                For i = 0 To 2
+                    mass_values(j + 1 + i) = center(i)
+                Next
+                For i = 0 To 8
+                    mass_values(j + 4 + i) = inertia(i)
+                Next
+            End If
+            On Error Goto 0
+        End If
+
+        count = 0
+        On Error Resume Next
+        count = product.Products.Count
+        On Error Goto 0
+        For i = 1 To count
+            If mass_visit_count > mass_last Then Exit For
+            mass_properties_visit product.Products.Item(i)
+        Next
+    End Sub
+    """
+
+    # one analysis per part.
+    representatives = {}
+    for index in indices:
+        representatives.setdefault((snapshot.full_names[index], snapshot.part_numbers[index]), []).append(index)
+    if not representatives:
+        return {}
+    keys = list(representatives)
+
+    system_service = product.application.system_service
+    values = system_service.evaluate_function(
+        vba_code,
+        vba_function_name,
+        [product.com_object, tuple(representatives[key][0] for key in keys)]
+    )
+
+    properties = {}
+    for n, key in enumerate(keys):
+        row = values[13 * n:13 * n + 13]
+        mass_properties = MassProperties(row[0], row[1:4], row[4:13])
+        for index in representatives[key]:
+            properties[index] = mass_properties
+
+    return properties
@@ -10,12 +10,12 @@
 """
 
 from pathlib import Path
+from typing import Sequence
 from typing import TYPE_CHECKING
 import warnings
 
-from pywintypes import com_error
-
 from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.exception_handling.exceptions import com_error
 from pycatia.in_interfaces.move import Move
 from pycatia.in_interfaces.position import Position
 from pycatia.in_interfaces.reference import Reference
@@ -23,10 +23,13 @@ from pycatia.knowledge_interfaces.parameters import Parameters
 from pycatia.knowledge_interfaces.relations import Relations
 from pycatia.mec_mod_interfaces.constraints import Constraints
 from pycatia.product_structure_interfaces.analyze import Analyze
+from pycatia.product_structure_interfaces.product_identity import ProductIdentity
+from pycatia.product_structure_interfaces.product_identity import product_identity_cache
 from pycatia.product_structure_interfaces.publications import Publications
 from pycatia.system_interfaces.any_object import AnyObject
 
 if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product_snapshot import ProductSnapshot
     from pycatia.product_structure_interfaces.products import Products
     from pycatia.in_interfaces.document import Document
 
@@ -208,6 +211,9 @@ class Product(AnyObject):
         :return: str()
         """
 
+        if product_identity_cache.enabled:
+            return self.identity().file_name
+
         return self.reference_product.parent.name
 
     @property
@@ -216,6 +222,9 @@ class Product(AnyObject):
         :return: str()
         """
 
+        if product_identity_cache.enabled:
+            return self.identity().full_name
+
         return self.reference_product.parent.com_object.FullName
 
     @property
@@ -553,7 +562,10 @@ class Product(AnyObject):
         :return: str
         :rtype: str
         """
-        
+
+        if product_identity_cache.enabled:
+            return self.identity().document_type
+
         root_product_name = self.reference_product.com_object.Parent.Product.Name
         self_product_name = self.reference_product.name
         if root_product_name == self_product_name:
@@ -636,10 +648,11 @@ class Product(AnyObject):
         def loop_d_loop(products_):
 
             for product in products_:
-                if product.is_catpart():
+                if product.identity().document_type == 'CATPart':
                     product.activate_default_shape()
-                elif product.is_catproduct():
-                    loop_d_loop(product.get_products())
+                else:
+                    # CATProducts and components.
+                    loop_d_loop(product.products)
 
         loop_d_loop(products)
 
@@ -1352,6 +1365,49 @@ class Product(AnyObject):
         """
         return self.product.HasShapeRepresentation(i_shape_name, i_rep_behavior, i_context)
 
+    def identity(self) -> ProductIdentity:
+        """
+        The file name, full name and document type of the reference product. Within a
+        :data:`~pycatia.product_structure_interfaces.product_identity.product_identity_cache` context the identity
+        is resolved once per product and reused.
+
+        :Example - Resolve the identities of an assembly once:
+
+            >>> from pycatia.product_structure_interfaces.product_identity import product_identity_cache
+            >>> with product_identity_cache:
+            >>>     for product in products:
+            >>>         print(product.is_catpart(), product.path())
+
+        :return: ProductIdentity
+        :rtype: ProductIdentity
+        """
+
+        cache = product_identity_cache.enabled
+        if cache:
+            identity = product_identity_cache.get(self.product)
+            if identity is not None:
+                return identity
+
+        reference = self.product.ReferenceProduct
+        if cache:
+            identity = product_identity_cache.get_reference(self.product, reference)
+            if identity is not None:
+                return identity
+
+        document = reference.Parent
+        file_name = document.Name
+        is_root = document.Product.Name == reference.Name
+        identity = ProductIdentity(
+            file_name,
+            document.FullName,
+            file_name.split('.')[-1] if is_root else 'Component',
+            is_root
+        )
+        if cache:
+            product_identity_cache.set(reference, identity)
+
+        return identity
+
     def is_catproduct(self):
         """
         :return: bool
@@ -1486,6 +1542,145 @@ class Product(AnyObject):
         # # system_service = self.application.system_service
         # # return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
 
+    def snapshot(self, user_ref_properties: Sequence[str] = ()) -> 'ProductSnapshot':
+        """
+        Collect the product structure below this product with one call to SystemService.evaluate().
+
+        For each product the instance name, part number, nomenclature, revision, full name of the reference
+        document, document type, depth, parent and position are collected. The returned
+        :class:`~pycatia.product_structure_interfaces.product_snapshot.ProductSnapshot` can be queried without
+        any further calls to CATIA. Properties of products whose document isn't loaded are empty strings.
+
+        :Example - Count the part instances in an assembly:
+
+            >>> snapshot = product.snapshot()
+            >>> part_instances = sum(node.is_catpart() for node in snapshot)
+
+        :param list(str) user_ref_properties: (optional) names of the user defined properties (see
+            :attr:`user_ref_properties`) to collect as strings for each product.
+        :return: ProductSnapshot
+        :rtype: ProductSnapshot
+        """
+
+        from pycatia.product_structure_interfaces.product_snapshot import ProductSnapshot
+
+        vba_function_name = 'product_snapshot'
+        vba_code = """
+        Dim snapshot_size, snapshot_names, snapshot_part_numbers, snapshot_nomenclatures, snapshot_revisions
+        Dim snapshot_full_names, snapshot_types, snapshot_depths, snapshot_parents, snapshot_positions
+        Dim snapshot_property_count, snapshot_property_index, snapshot_property_values
+
+        Public Function product_snapshot(product, property_names)
+            Dim names, j
+            names = Split(property_names, vbTab)
+            snapshot_property_count = UBound(names) + 1
+            Set snapshot_property_index = CreateObject("Scripting.Dictionary")
+            For j = 0 To UBound(names)
+                snapshot_property_index(names(j)) = j
+            Next
+            snapshot_size = 0
+            ReDim snapshot_names(63), snapshot_part_numbers(63), snapshot_nomenclatures(63), snapshot_revisions(63)
+            ReDim snapshot_full_names(63), snapshot_types(63), snapshot_depths(63), snapshot_parents(63)
+            ReDim snapshot_positions(767), snapshot_property_values(64 * snapshot_property_count - 1)
+            product_snapshot_visit product, 0, -1
+            product_snapshot_resize snapshot_size
+            product_snapshot = Array(snapshot_names, snapshot_part_numbers, snapshot_nomenclatures, _
+                snapshot_revisions, snapshot_full_names, snapshot_types, snapshot_depths, snapshot_parents, _
+                snapshot_positions, snapshot_property_values)
+        End Function
+
+        Sub product_snapshot_resize(size)
+            ReDim Preserve snapshot_names(size - 1), snapshot_part_numbers(size - 1)
+            ReDim Preserve snapshot_nomenclatures(size - 1), snapshot_revisions(size - 1)
+            ReDim Preserve snapshot_full_names(size - 1), snapshot_types(size - 1)
+            ReDim Preserve snapshot_depths(size - 1), snapshot_parents(size - 1)
+            ReDim Preserve snapshot_positions(12 * size - 1)
+            ReDim Preserve snapshot_property_values(snapshot_property_count * size - 1)
+        End Sub
+
+        Sub product_snapshot_visit(product, depth, parent)
+            Dim index, i, count, reference, document, full_name, is_root, components(11), properties, name
+            index = snapshot_size
+            If index > UBound(snapshot_names) Then product_snapshot_resize 2 * (index + 1)
+            snapshot_size = index + 1
+            snapshot_depths(index) = depth
+            snapshot_parents(index) = parent
+            snapshot_names(index) = product.Name
+
+            On Error Resume Next
+            snapshot_part_numbers(index) = ""
+            snapshot_nomenclatures(index) = ""
+            snapshot_revisions(index) = ""
+            snapshot_full_names(index) = ""
+            snapshot_types(index) = ""
+            snapshot_part_numbers(index) = product.PartNumber
+            snapshot_nomenclatures(index) = product.Nomenclature
+            snapshot_revisions(index) = product.Revision
+
+            Err.Clear
+            Set reference = product.ReferenceProduct
+            Set document = reference.Parent
+            full_name = document.FullName
+            is_root = (document.Product.Name = reference.Name)
+            If Err.Number = 0 Then
+                snapshot_full_names(index) = full_name
+                If is_root Then
+                    snapshot_types(index) = Mid(document.Name, InStrRev(document.Name, ".") + 1)
+                Else
+                    snapshot_types(index) = "Component"
+                End If
+            End If
+
+            For i = 0 To 11
+                components(i) = 0.0
+            Next
+            components(0) = 1.0
+            components(4) = 1.0
+            components(8) = 1.0
+            product.Position.GetComponents components
+            For i = 0 To 11
+                snapshot_positions(12 * index + i) = components(i)
+            Next
+
+            For i = 0 To snapshot_property_count - 1
+                snapshot_property_values(snapshot_property_count * index + i) = ""
+            Next
+            If snapshot_property_count > 0 Then
+                Set properties = reference.UserRefProperties
+                count = 0
+                count = properties.Count
+                For i = 1 To count
+                    name = properties.Item(i).Name
+                    name = Mid(name, InStrRev(name, "\\") + 1)
+                    If snapshot_property_index.Exists(name) Then
+                        snapshot_property_values(snapshot_property_count * index + snapshot_property_index(name)) = _
+                            properties.Item(i).ValueAsString
+                    End If
+                Next
+            End If
+
+            count = 0
+            count = product.Products.Count
+            On Error Goto 0
+
+            For i = 1 To count
+                product_snapshot_visit product.Products.Item(i), depth + 1, index
+            Next
+        End Sub
+        """
+
+        system_service = self.application.system_service
+        user_ref_properties = list(user_ref_properties)
+        if any('\t' in name for name in user_ref_properties):
+            raise ValueError('User defined property names can not contain tabs.')
+        columns = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [self.com_object, '\t'.join(user_ref_properties)]
+        )
+
+        return ProductSnapshot(*columns[:-1], user_ref_properties=user_ref_properties, user_ref_values=columns[-1])
+
     def update(self) -> None:
         """
         .. note::
@@ -0,0 +1,150 @@
+#! /usr/bin/python3.9
+"""
+
+    An opt-in cache of the document identity of products.
+
+    :attr:`Product.type`, :meth:`Product.is_catpart`, :meth:`Product.is_catproduct`, :attr:`Product.file_name`,
+    :attr:`Product.full_name` and :meth:`Product.path` resolve the reference product and its document with several
+    COM calls on every access. Within a :data:`product_identity_cache` context the identity of each product is
+    resolved once and reused.
+
+    The cache is cleared by Products.replace_component(), Products.replace_product(), Document.save_as() and on
+    exit of the context. Call :meth:`ProductIdentityCache.clear` after changing the product structure or
+    documents by other means.
+
+    :Example - Walk an assembly using the cache:
+
+        >>> from pycatia.product_structure_interfaces.product_identity import product_identity_cache
+        >>> with product_identity_cache:
+        >>>     Product.activate_terminal_node(product.products)
+
+"""
+
+from pycatia.base_interfaces.com_cache import com_object_key
+
+
+class ProductIdentity:
+    """
+    The document identity of a reference product.
+    """
+
+    __slots__ = ('file_name', 'full_name', 'document_type', 'is_root')
+
+    def __init__(self, file_name: str, full_name: str, document_type: str, is_root: bool):
+        """
+        :param str file_name: the name of the document containing the reference product.
+        :param str full_name: the full name of the document containing the reference product.
+        :param str document_type: 'CATPart', 'CATProduct' or 'Component'.
+        :param bool is_root: True if the reference product is the root product of the document.
+        """
+
+        self.file_name = file_name
+        self.full_name = full_name
+        self.document_type = document_type
+        self.is_root = is_root
+
+    def __repr__(self):
+        return f'ProductIdentity(file_name="{self.file_name}", document_type="{self.document_type}")'
+
+
+class ProductIdentityCache:
+    """
+    The cache of product identities. Use the module instance :data:`product_identity_cache`.
+
+    Identities are stored by reference product. The reference product of each product (instance) is also stored
+    so a cached identity is found without any COM calls.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.hits = 0
+        self.misses = 0
+        self._identities = {}
+        self._references = {}
+        self._depth = 0
+
+    def enable(self) -> None:
+        """
+        :return: None
+        """
+
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Disable and clear the cache.
+
+        :return: None
+        """
+
+        self.enabled = False
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        :return: None
+        """
+
+        self._identities = {}
+        self._references = {}
+
+    def get(self, com_object) -> ProductIdentity:
+        """
+        :param com_object: the dispatch object of a product.
+        :return: the cached identity of the product or None.
+        :rtype: ProductIdentity
+        """
+
+        reference_key = self._references.get(com_object_key(com_object))
+        identity = self._identities.get(reference_key) if reference_key is not None else None
+        if identity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return identity
+
+    def get_reference(self, com_object, reference) -> ProductIdentity:
+        """
+        Get the cached identity of the reference product and remember it as the reference product of com_object.
+
+        :param com_object: the dispatch object of a product.
+        :param reference: the dispatch object of its reference product.
+        :return: the cached identity of the reference product or None.
+        :rtype: ProductIdentity
+        """
+
+        reference_key = com_object_key(reference)
+        self._references[com_object_key(com_object)] = reference_key
+
+        return self._identities.get(reference_key)
+
+    def set(self, reference, identity: ProductIdentity) -> None:
+        """
+        :param reference: the dispatch object of a reference product.
+        :param ProductIdentity identity:
+        :return: None
+        """
+
+        self._identities[com_object_key(reference)] = identity
+
+    def __len__(self):
+        return len(self._identities)
+
+    def __enter__(self):
+        if self._depth == 0:
+            self.enable()
+        self._depth += 1
+
+        return self
+
+    def __exit__(self, *args):
+        self._depth -= 1
+        if self._depth == 0:
+            self.disable()
+
+    def __repr__(self):
+        return f'ProductIdentityCache(enabled={self.enabled}, identities={len(self._identities)})'
+
+
+product_identity_cache = ProductIdentityCache()
@@ -0,0 +1,386 @@
+#! /usr/bin/python3.9
+"""
+
+    A snapshot of a product structure collected by :meth:`~pycatia.product_structure_interfaces.product.Product.snapshot`.
+
+    The snapshot is a list of the nodes of the tree in depth first order with one python list per property
+    (parallel arrays). It can be queried and iterated without any further calls to CATIA.
+
+    :Example - Print the product tree:
+
+        >>> snapshot = caa.active_document.product.snapshot()
+        >>> for node in snapshot:
+        >>>     print('    ' * node.depth, node.part_number, node.document_type)
+
+"""
+
+from typing import Iterator
+from typing import Sequence
+
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+_identity = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+
+
+def multiply_positions(parent: Sequence[float], child: Sequence[float]) -> tuple:
+    """
+    Combine the position child, given in the axis system of parent, with the position parent.
+
+    A position is the 12 components returned by Position.get_components(): the x, y and z axis vectors followed
+    by the origin.
+
+    :param tuple parent:
+    :param tuple child:
+    :return: tuple
+    """
+
+    x, y, z = parent[0:3], parent[3:6], parent[6:9]
+
+    def rotate(v):
+        return tuple(x[k] * v[0] + y[k] * v[1] + z[k] * v[2] for k in range(3))
+
+    origin = rotate(child[9:12])
+
+    return (
+        rotate(child[0:3]) + rotate(child[3:6]) + rotate(child[6:9]) +
+        tuple(parent[9 + k] + origin[k] for k in range(3))
+    )
+
+
+class SnapshotNode:
+    """
+    A node of a :class:`ProductSnapshot`. The node is a view of one row of the snapshot.
+    """
+
+    __slots__ = ('snapshot', 'index')
+
+    def __init__(self, snapshot: 'ProductSnapshot', index: int):
+        self.snapshot = snapshot
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        """
+        :return: the instance name.
+        :rtype: str
+        """
+
+        return self.snapshot.names[self.index]
+
+    @property
+    def part_number(self) -> str:
+        """
+        :return: str
+        """
+
+        return self.snapshot.part_numbers[self.index]
+
+    @property
+    def nomenclature(self) -> str:
+        """
+        :return: str
+        """
+
+        return self.snapshot.nomenclatures[self.index]
+
+    @property
+    def revision(self) -> str:
+        """
+        :return: str
+        """
+
+        return self.snapshot.revisions[self.index]
+
+    @property
+    def full_name(self) -> str:
+        """
+        :return: the full name of the document containing the reference product. An empty string if the
+            document isn't loaded.
+        :rtype: str
+        """
+
+        return self.snapshot.full_names[self.index]
+
+    @property
+    def file_name(self) -> str:
+        """
+        :return: str
+        """
+
+        return self.full_name.replace('/', '\\').rsplit('\\', 1)[-1]
+
+    @property
+    def document_type(self) -> str:
+        """
+        :return: 'CATPart', 'CATProduct', 'Component' or an empty string if the document isn't loaded.
+        :rtype: str
+        """
+
+        return self.snapshot.document_types[self.index]
+
+    @property
+    def depth(self) -> int:
+        """
+        :return: 0 for the root product.
+        :rtype: int
+        """
+
+        return self.snapshot.depths[self.index]
+
+    @property
+    def parent(self) -> 'SnapshotNode':
+        """
+        :return: SnapshotNode or None for the root product.
+        :rtype: SnapshotNode
+        """
+
+        parent = self.snapshot.parents[self.index]
+        if parent < 0:
+            return None
+
+        return SnapshotNode(self.snapshot, parent)
+
+    @property
+    def children(self) -> list:
+        """
+        :return: [SnapshotNode]
+        :rtype: list
+        """
+
+        return [SnapshotNode(self.snapshot, i) for i in self.snapshot.child_indices(self.index)]
+
+    @property
+    def position(self) -> tuple:
+        """
+        :return: the 12 position components relative to the parent product.
+        :rtype: tuple
+        """
+
+        return self.snapshot.position(self.index)
+
+    @property
+    def absolute_position(self) -> tuple:
+        """
+        :return: the 12 position components relative to the root product.
+        :rtype: tuple
+        """
+
+        return self.snapshot.absolute_position(self.index)
+
+    def user_ref_property(self, name: str) -> str:
+        """
+        :param str name: a user defined property collected by the snapshot.
+        :return: str
+        """
+
+        return self.snapshot.user_ref_property(self.index, name)
+
+    def is_catpart(self) -> bool:
+        """
+        :return: bool
+        """
+
+        return self.document_type == 'CATPart'
+
+    def is_catproduct(self) -> bool:
+        """
+        :return: bool
+        """
+
+        return self.document_type == 'CATProduct'
+
+    def is_component(self) -> bool:
+        """
+        :return: bool
+        """
+
+        return self.document_type == 'Component'
+
+    def path(self) -> list:
+        """
+        :return: the instance names from the root product to this node.
+        :rtype: list
+        """
+
+        names = []
+        index = self.index
+        while index >= 0:
+            names.append(self.snapshot.names[index])
+            index = self.snapshot.parents[index]
+
+        return names[::-1]
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotNode) and other.snapshot is self.snapshot and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.snapshot), self.index))
+
+    def __repr__(self):
+        return f'SnapshotNode(name="{self.name}", part_number="{self.part_number}")'
+
+
+class ProductSnapshot:
+    """
+    The product structure below a product collected in one call. Node 0 is the product the snapshot was taken
+    from. Nodes are in depth first order so the descendants of a node follow it.
+
+    The columns can be used directly for fast queries. parents holds the index of the parent node or -1 for the
+    root. positions holds 12 components per node. user_ref_values holds a value for each name in
+    user_ref_properties per node.
+    """
+
+    columns = (
+        'names', 'part_numbers', 'nomenclatures', 'revisions', 'full_names', 'document_types', 'depths',
+        'parents', 'positions',
+    )
+
+    __slots__ = columns + ('user_ref_properties', 'user_ref_values', '_children')
+
+    def __init__(self, names, part_numbers, nomenclatures, revisions, full_names, document_types, depths, parents,
+                 positions, user_ref_properties=(), user_ref_values=()):
+        self.names = list(names)
+        self.part_numbers = list(part_numbers)
+        self.nomenclatures = list(nomenclatures)
+        self.revisions = list(revisions)
+        self.full_names = list(full_names)
+        self.document_types = list(document_types)
+        self.depths = list(depths)
+        self.parents = list(parents)
+        self.positions = list(positions)
+        self.user_ref_properties = tuple(user_ref_properties)
+        self.user_ref_values = list(user_ref_values or ())
+        self._children = None
+
+        if any(len(getattr(self, column)) != len(self.names) for column in self.columns[:-1]) or \
+                len(self.positions) != 12 * len(self.names) or \
+                len(self.user_ref_values) != len(self.user_ref_properties) * len(self.names):
+            raise CATIAApplicationException('The columns of the product snapshot have different lengths.')
+
+    @property
+    def root(self) -> SnapshotNode:
+        """
+        :return: SnapshotNode
+        """
+
+        return SnapshotNode(self, 0)
+
+    def child_indices(self, index: int) -> list:
+        """
+        :param int index:
+        :return: the indices of the children of node index.
+        :rtype: list
+        """
+
+        if self._children is None:
+            self._children = [[] for _ in self.names]
+            for i, parent in enumerate(self.parents):
+                if parent >= 0:
+                    self._children[parent].append(i)
+
+        return self._children[index]
+
+    def descendant_indices(self, index: int) -> range:
+        """
+        :param int index:
+        :return: the indices of all the nodes below node index.
+        :rtype: range
+        """
+
+        depth = self.depths[index]
+        end = index + 1
+        while end < len(self.depths) and self.depths[end] > depth:
+            end += 1
+
+        return range(index + 1, end)
+
+    def position(self, index: int) -> tuple:
+        """
+        :param int index:
+        :return: the 12 position components of node index relative to its parent.
+        :rtype: tuple
+        """
+
+        return tuple(self.positions[12 * index:12 * index + 12])
+
+    def user_ref_property(self, index: int, name: str) -> str:
+        """
+        :param int index:
+        :param str name: one of user_ref_properties.
+        :return: the value of the user defined property name of node index. An empty string if the product
+            doesn't have the property.
+        :rtype: str
+        """
+
+        try:
+            j = self.user_ref_properties.index(name)
+        except ValueError:
+            raise CATIAApplicationException(f'User defined property "{name}" was not collected by the snapshot.')
+
+        return self.user_ref_values[len(self.user_ref_properties) * index + j]
+
+    def absolute_position(self, index: int) -> tuple:
+        """
+        :param int index:
+        :return: the 12 position components of node index relative to the root product.
+        :rtype: tuple
+        """
+
+        position = _identity
+        while index > 0:
+            position = multiply_positions(self.position(index), position)
+            index = self.parents[index]
+
+        return position
+
+    def find(self, **properties) -> Iterator[SnapshotNode]:
+        """
+        Find the nodes matching all the properties given.
+
+        :Example - Find all the instances of a part:
+
+            >>> bolts = list(snapshot.find(part_number='M8x20', document_type='CATPart'))
+
+        :param properties: SnapshotNode property names and values eg part_number='M8x20'.
+        :return: Iterator[SnapshotNode]
+        """
+
+        columns = []
+        for name, value in properties.items():
+            column = f'{name}s'
+            if column not in self.columns[:-2]:
+                raise ValueError(f'Can not find nodes by "{name}".')
+            columns.append((getattr(self, column), value))
+
+        for i in range(len(self.names)):
+            if all(column[i] == value for column, value in columns):
+                yield SnapshotNode(self, i)
+
+    def leaves(self) -> Iterator[SnapshotNode]:
+        """
+        :return: the nodes without children.
+        :rtype: Iterator[SnapshotNode]
+        """
+
+        for i in range(len(self.names)):
+            if i + 1 == len(self.names) or self.depths[i + 1] <= self.depths[i]:
+                yield SnapshotNode(self, i)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> SnapshotNode:
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError(index)
+
+        return SnapshotNode(self, index)
+
+    def __iter__(self) -> Iterator[SnapshotNode]:
+        for i in range(len(self.names)):
+            yield SnapshotNode(self, i)
+
+    def __repr__(self):
+        root = self.names[0] if self.names else ''
+        return f'ProductSnapshot(root="{root}", nodes={len(self.names)})'
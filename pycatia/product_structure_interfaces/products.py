@@ -12,6 +12,7 @@ from typing import Iterator
 from typing import TYPE_CHECKING
 
 from pycatia.product_structure_interfaces.product import Product
+from pycatia.product_structure_interfaces.product_identity import product_identity_cache
 from pycatia.system_interfaces.collection import Collection
 from pycatia.types.general import cat_variant
 
@@ -356,6 +357,7 @@ class Products(Collection):
         :return: Product
         :rtype: Product
         """
+        product_identity_cache.clear()
         return Product(self.products.ReplaceComponent(i_old_component.com_object, i_file_path, i_multi_instances))
 
     def replace_product(self, i_old_component: Product, i_new_reference: Product, i_multi_instances: bool) -> Product:
@@ -388,6 +390,7 @@ class Products(Collection):
         :return: Product
         :rtype: Product
         """
+        product_identity_cache.clear()
         return Product(
             self.products.ReplaceProduct(
                 i_old_component.com_object,
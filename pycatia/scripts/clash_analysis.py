@@ -0,0 +1,544 @@
+#! /usr/bin/python3.9
+"""
+
+    Clash analysis of a large CATProduct spread across several CATIA sessions.
+
+    The leaf products are split into subsets. A clash is computed inside each subset and between each pair of
+    subsets, which together cover every pair of products. Each of these jobs runs in one call to CATIA: the
+    groups and the clash are created, computed, exported to XML and removed again. Jobs can run in several
+    worker processes, each with its own CATIA session.
+
+    The exported XML files are parsed one element at a time into a :class:`ConflictTable`, a compact set of
+    arrays holding the product pair, type and value of each conflict.
+
+    Every job is recorded in a manifest in the results directory with a fingerprint of its products. On the next
+    run a job whose products haven't changed (same documents, same modification times and same positions) is
+    skipped and its previous XML is reused.
+
+    :Example - Clash an assembly in 4 CATIA sessions:
+
+        >>> from pycatia.scripts.clash_analysis import ClashAnalysis
+        >>> if __name__ == '__main__':
+        >>>     analysis = ClashAnalysis.from_product(caa.active_document.product, 'clash_results', subset_size=200)
+        >>>     conflicts = analysis.run(workers=4)
+        >>>     for first, second, conflict_type, value in conflicts.filter(conflict_type='Clash'):
+        >>>         print(first, second, value)
+
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import time
+import xml.etree.ElementTree as ElementTree
+from array import array
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+
+from pycatia.base_interfaces.base_application import catia_application
+from pycatia.base_interfaces.session_pool import SessionPool
+from pycatia.enumeration.enumeration_types import cat_clash_computation_type
+from pycatia.enumeration.enumeration_types import cat_clash_interference_type
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product import Product
+    from pycatia.product_structure_interfaces.product_snapshot import ProductSnapshot
+
+# the open documents of a worker process.
+_worker_documents = {}
+
+_manifest_name = 'manifest.json'
+
+
+class ConflictTable:
+    """
+    The conflicts of one or more clash results as parallel arrays. Product names and conflict types are stored
+    once in products and types and referenced by index.
+    """
+
+    __slots__ = ('products', 'types', 'firsts', 'seconds', 'type_indices', 'values', '_product_index',
+                 '_type_index')
+
+    def __init__(self):
+        self.products = []
+        self.types = []
+        self.firsts = array('l')
+        self.seconds = array('l')
+        self.type_indices = array('l')
+        self.values = array('d')
+        self._product_index = {}
+        self._type_index = {}
+
+    def _index(self, values: list, index: dict, value: str) -> int:
+        i = index.get(value)
+        if i is None:
+            i = index[value] = len(values)
+            values.append(value)
+
+        return i
+
+    def append(self, first: str, second: str, conflict_type: str, value: float) -> None:
+        """
+        :param str first: the first product.
+        :param str second: the second product.
+        :param str conflict_type: eg 'Clash', 'Contact' or 'Clearance'.
+        :param float value: the penetration or distance.
+        :return: None
+        """
+
+        # the pair is stored in a stable order so the same conflict found from either side matches.
+        if second < first:
+            first, second = second, first
+        self.firsts.append(self._index(self.products, self._product_index, first))
+        self.seconds.append(self._index(self.products, self._product_index, second))
+        self.type_indices.append(self._index(self.types, self._type_index, conflict_type))
+        self.values.append(value)
+
+    def extend(self, other: 'ConflictTable') -> None:
+        """
+        Append the conflicts of other.
+
+        :param ConflictTable other:
+        :return: None
+        """
+
+        for first, second, conflict_type, value in other:
+            self.append(first, second, conflict_type, value)
+
+    def pairs(self) -> set:
+        """
+        :return: the (first product, second product) of each conflict.
+        :rtype: set
+        """
+
+        return {(self.products[f], self.products[s]) for f, s in zip(self.firsts, self.seconds)}
+
+    def filter(self, conflict_type: str = None, product: str = None) -> Iterator[tuple]:
+        """
+        :param str conflict_type: (optional) only the conflicts of this type.
+        :param str product: (optional) only the conflicts involving this product.
+        :return: Iterator[tuple] of (first product, second product, type, value)
+        """
+
+        type_index = self._type_index.get(conflict_type, -1) if conflict_type is not None else None
+        product_index = self._product_index.get(product, -1) if product is not None else None
+        for i in range(len(self.values)):
+            if type_index is not None and self.type_indices[i] != type_index:
+                continue
+            if product_index is not None and product_index not in (self.firsts[i], self.seconds[i]):
+                continue
+            yield self[i]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> tuple:
+        return (
+            self.products[self.firsts[i]], self.products[self.seconds[i]], self.types[self.type_indices[i]],
+            self.values[i]
+        )
+
+    def __iter__(self) -> Iterator[tuple]:
+        for i in range(len(self.values)):
+            yield self[i]
+
+    def __repr__(self):
+        return f'ConflictTable(conflicts={len(self.values)}, products={len(self.products)})'
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _attribute(element, names: Sequence[str]) -> str:
+    for name in names:
+        for key, value in element.attrib.items():
+            if _local_name(key).lower() == name:
+                return value
+
+    return None
+
+
+def parse_clash_xml(source: Union[str, BinaryIO], table: ConflictTable = None) -> ConflictTable:
+    """
+    Read the conflicts of a clash result exported with Clash.export() (the format read by
+    ClashResults.add_from_xml()). The file is parsed one element at a time and each element is discarded once
+    read so large results use little memory.
+
+    A conflict is a Conflict element with Type and Value attributes. Its two products are the first two
+    Product elements inside it, named by their Name or Alias attribute or by a reference (Id / Ref) to a
+    Product element defined elsewhere in the file, or else its FirstProduct and SecondProduct attributes.
+
+    :param source: the path of the XML file or a file opened in binary mode.
+    :param ConflictTable table: (optional) append the conflicts to this table.
+    :return: ConflictTable
+    """
+
+    if table is None:
+        table = ConflictTable()
+
+    names = {}
+    conflict = None
+    references = []
+    for event, element in ElementTree.iterparse(source, events=('start', 'end')):
+        tag = _local_name(element.tag).lower()
+        if event == 'start':
+            if tag == 'conflict':
+                conflict = element
+                references = []
+            continue
+
+        if tag == 'conflict':
+            if len(references) < 2:
+                references = [_attribute(element, (f'{name}product', f'product{n}'))
+                              for n, name in ((1, 'first'), (2, 'second'))]
+            if None not in references[:2]:
+                first, second = (names.get(r, r) for r in references[:2])
+                value = _attribute(element, ('value',))
+                table.append(first, second, _attribute(element, ('type',)) or '', float(value) if value else 0.0)
+            conflict = None
+        elif 'product' in tag:
+            name = _attribute(element, ('name', 'alias'))
+            identifier = _attribute(element, ('id',))
+            if name is not None and identifier is not None:
+                names[identifier] = name
+            if conflict is not None:
+                reference = name if name is not None else _attribute(element, ('ref', 'idref', 'id'))
+                if reference is not None:
+                    references.append(reference)
+        if conflict is None:
+            element.clear()
+
+    return table
+
+
+def snapshot_paths(snapshot: 'ProductSnapshot') -> dict:
+    """
+    :param ProductSnapshot snapshot:
+    :return: {leaf path: fingerprint} for the leaves of snapshot. The path is the instance names below the root
+        product joined by '/'. The fingerprint changes when the document, its modification time or the
+        position of the leaf changes.
+    :rtype: dict
+    """
+
+    paths = {}
+    for node in snapshot.leaves():
+        if node.index == 0:
+            continue
+        full_name = node.full_name
+        modified = os.path.getmtime(full_name) if full_name and os.path.isfile(full_name) else 0
+        position = ','.join(f'{c:.6g}' for c in node.absolute_position)
+        paths['/'.join(node.path()[1:])] = f'{full_name}|{modified}|{position}'
+
+    return paths
+
+
+def compute_clash(application, file_name: str, first_paths: Sequence[str], second_paths: Sequence[str],
+                  xml_path: str, interference_type: int = 0, clearance: float = 0.0, document=None) -> int:
+    """
+    Compute the clashes inside the products first_paths, or between first_paths and second_paths, and export
+    them to xml_path with one call to SystemService.evaluate(). The groups and the clash are removed
+    afterwards.
+
+    :param Application application:
+    :param str file_name: the CATProduct. Opened if document isn't given.
+    :param list(str) first_paths: product paths (see :func:`snapshot_paths`).
+    :param list(str) second_paths: product paths or None to clash inside first_paths.
+    :param str xml_path:
+    :param int interference_type: (optional) see enumeration_types.cat_clash_interference_type.
+    :param float clearance: (optional) the clearance for catClashInterferenceTypeClearance.
+    :param Document document: (optional) the open document.
+    :return: the number of conflicts.
+    :rtype: int
+    """
+
+    vba_function_name = 'clash_analysis_compute'
+    vba_code = """
+    Function clash_analysis_find(product, path)
+        Dim names, i, found
+        Set found = product
+        names = Split(path, "/")
+        For i = 0 To UBound(names)
+            Set found = found.Products.Item(names(i))
+        Next
+        Set clash_analysis_find = found
+    End Function
+
+    Function clash_analysis_group(product, groups, paths)
+        Dim group, i
+        Set group = groups.Add
+        For i = 0 To UBound(paths)
+            group.AddExplicit clash_analysis_find(product, paths(i))
+        Next
+        Set clash_analysis_group = group
+    End Function
+
+    Public Function clash_analysis_compute(product, first_paths, second_paths, computation_type, _
+                                           interference_type, clearance, path)
+        Dim groups, clashes, first, second, clash, count
+        Set groups = product.GetTechnologicalObject("Groups")
+        Set clashes = product.GetTechnologicalObject("Clashes")
+        Set first = clash_analysis_group(product, groups, first_paths)
+        Set clash = clashes.Add
+        clash.ComputationType = computation_type
+        clash.FirstGroup = first
+        If IsArray(second_paths) Then
+            Set second = clash_analysis_group(product, groups, second_paths)
+            clash.SecondGroup = second
+        End If
+        clash.InterferenceType = interference_type
+        If interference_type = 1 Then clash.Clearance = clearance
+        clash.Compute
+        clash.Export 0, path
+        count = clash.Conflicts.Count
+        clashes.Remove clash.Name
+        If IsArray(second_paths) Then groups.Remove second.Name
+        groups.Remove first.Name
+        clash_analysis_compute = count
+    End Function
+    """
+
+    if document is None:
+        document = application.documents.open(file_name)
+    product = _product_document(document).product
+
+    if second_paths is None:
+        computation_type = cat_clash_computation_type.index('catClashComputationTypeInsideOne')
+    else:
+        computation_type = cat_clash_computation_type.index('catClashComputationTypeBetweenTwo')
+
+    system_service = application.system_service
+
+    return system_service.evaluate_function(
+        vba_code,
+        vba_function_name,
+        [
+            product.com_object,
+            tuple(first_paths),
+            tuple(second_paths) if second_paths is not None else None,
+            computation_type,
+            interference_type,
+            clearance,
+            os.path.abspath(xml_path)
+        ]
+    )
+
+
+def _product_document(document):
+    from pycatia.product_structure_interfaces.product_document import ProductDocument
+
+    if isinstance(document, ProductDocument):
+        return document
+    if not document.name.lower().endswith('.catproduct'):
+        raise CATIAApplicationException(f'Clash analysis needs a CATProduct, not "{document.name}".')
+
+    return ProductDocument(document.com_object)
+
+
+def _compute_in_worker(application, key: str, file_name: str, first_paths, second_paths, xml_path: str,
+                       interference_type: int, clearance: float) -> dict:
+    start = time.perf_counter()
+    try:
+        document = _worker_documents.get(file_name)
+        if document is None:
+            document = _worker_documents[file_name] = _product_document(application.documents.open(file_name))
+        count = compute_clash(application, file_name, first_paths, second_paths, xml_path,
+                              interference_type, clearance, document)
+        row = {'conflicts': count, 'error': None}
+    except Exception as e:
+        row = {'conflicts': None, 'error': f'{type(e).__name__}: {e}'}
+    row['key'] = key
+    row['elapsed'] = time.perf_counter() - start
+    row['pid'] = os.getpid()
+
+    return row
+
+
+class ClashAnalysis:
+    """
+    Clash the products of file_name subset by subset.
+
+    :param str file_name: the CATProduct.
+    :param list subsets: lists of product paths. See :func:`snapshot_paths`.
+    :param str results_dir: the directory of the exported XML files and the manifest.
+    :param dict fingerprints: (optional) {product path: fingerprint}. Jobs are only skipped on later runs when
+        fingerprints are given.
+    :param int interference_type: (optional) see enumeration_types.cat_clash_interference_type. Defaults to
+        contact.
+    :param float clearance: (optional) the clearance when interference_type is clearance.
+    """
+
+    def __init__(self, file_name: str, subsets: Sequence[Sequence[str]], results_dir: str,
+                 fingerprints: dict = None, interference_type: int = 0, clearance: float = 0.0):
+        if not os.path.isfile(file_name):
+            raise FileNotFoundError(f'Could not find file {file_name}.')
+        if not str(file_name).lower().endswith('.catproduct'):
+            raise CATIAApplicationException(f'Clash analysis needs a CATProduct, not "{file_name}".')
+        if not 0 <= interference_type < len(cat_clash_interference_type):
+            raise ValueError(f'interference_type must be an index of {cat_clash_interference_type}.')
+        self.file_name = os.path.abspath(file_name)
+        self.subsets = [list(subset) for subset in subsets if subset]
+        self.results_dir = results_dir
+        self.fingerprints = dict(fingerprints or {})
+        self.interference_type = interference_type
+        self.clearance = clearance
+
+    @classmethod
+    def from_product(cls, product: 'Product', results_dir: str, subset_size: int = 200,
+                     interference_type: int = 0, clearance: float = 0.0) -> 'ClashAnalysis':
+        """
+        Split the leaves of product into subsets of subset_size products in tree order, so products of the
+        same sub-assembly tend to be in the same subset.
+
+        :param Product product: the root product of a saved CATProduct.
+        :param str results_dir:
+        :param int subset_size: (optional)
+        :param int interference_type: (optional)
+        :param float clearance: (optional)
+        :return: ClashAnalysis
+        """
+
+        fingerprints = snapshot_paths(product.snapshot())
+        paths = list(fingerprints)
+        subsets = [paths[i:i + subset_size] for i in range(0, len(paths), subset_size)]
+
+        return cls(product.identity().full_name, subsets, results_dir, fingerprints, interference_type, clearance)
+
+    def jobs(self) -> dict:
+        """
+        :return: {job key: (first subset index, second subset index or None)}. A job is a clash inside one
+            subset or between two.
+        :rtype: dict
+        """
+
+        jobs = {}
+        for i, j in itertools.combinations_with_replacement(range(len(self.subsets)), 2):
+            jobs[f'{i}-{j}'] = (i, j if i != j else None)
+
+        return jobs
+
+    def _fingerprint(self, first: int, second: int) -> str:
+        if not self.fingerprints:
+            return None
+        digest = hashlib.sha1(f'{self.interference_type}|{self.clearance}'.encode())
+        for index in (first, second):
+            if index is None:
+                continue
+            for path in self.subsets[index]:
+                digest.update(f'\n{path}|{self.fingerprints.get(path, "")}'.encode())
+
+        return digest.hexdigest()
+
+    def _xml_path(self, key: str) -> str:
+        return os.path.join(self.results_dir, f'clash_{key}.xml')
+
+    def _read_manifest(self) -> dict:
+        path = os.path.join(self.results_dir, _manifest_name)
+        if not os.path.isfile(path):
+            return {}
+        with open(path) as file:
+            return json.load(file)
+
+    def _write_manifest(self, manifest: dict) -> None:
+        path = os.path.join(self.results_dir, _manifest_name)
+        with open(path + '.tmp', 'w') as file:
+            json.dump(manifest, file, indent=1)
+        os.replace(path + '.tmp', path)
+
+    def pending(self) -> list:
+        """
+        :return: the keys of the jobs to compute. Jobs computed by a previous run with the same fingerprint are
+            not pending.
+        :rtype: list
+        """
+
+        manifest = self._read_manifest()
+        pending = []
+        for key, (first, second) in self.jobs().items():
+            entry = manifest.get(key)
+            fingerprint = self._fingerprint(first, second)
+            if entry is None or entry['error'] is not None or fingerprint is None or \
+                    entry['fingerprint'] != fingerprint or not os.path.isfile(self._xml_path(key)):
+                pending.append(key)
+
+        return pending
+
+    def run(self, workers: int = 1, backend=None, on_result: Callable[[dict], None] = None) -> ConflictTable:
+        """
+        Compute the pending jobs and merge the conflicts of all the jobs.
+
+        :param int workers: (optional) the number of worker processes, each with its own CATIA session. With 1
+            the jobs run in this process.
+        :param backend: (optional) the backend creating the CATIA session of each worker. Defaults to a new
+            session per worker, or the running session when workers is 1.
+        :param on_result: (optional) called with the manifest entry of each job as it finishes.
+        :return: ConflictTable
+        """
+
+        os.makedirs(self.results_dir, exist_ok=True)
+        manifest = self._read_manifest()
+        jobs = self.jobs()
+        for row in self._compute(self.pending(), jobs, workers, backend):
+            first, second = jobs[row['key']]
+            row['fingerprint'] = self._fingerprint(first, second)
+            manifest[row.pop('key')] = row
+            self._write_manifest(manifest)
+            if on_result is not None:
+                on_result(row)
+
+        failed = [key for key in jobs if manifest.get(key, {}).get('error') is not None]
+        if failed:
+            raise CATIAApplicationException(f'Clash jobs {failed} failed. See {_manifest_name} in '
+                                            f'{self.results_dir}. Run again to retry them.')
+
+        return self.conflicts()
+
+    def conflicts(self) -> ConflictTable:
+        """
+        Merge the exported conflicts of all the jobs computed so far.
+
+        :return: ConflictTable
+        """
+
+        table = ConflictTable()
+        for key in self.jobs():
+            path = self._xml_path(key)
+            if os.path.isfile(path):
+                parse_clash_xml(path, table)
+
+        return table
+
+    def _compute(self, pending: list, jobs: dict, workers: int, backend) -> Iterator[dict]:
+        def arguments(key):
+            first, second = jobs[key]
+            return (
+                key, self.file_name, self.subsets[first], self.subsets[second] if second is not None else None,
+                self._xml_path(key), self.interference_type, self.clearance
+            )
+
+        if workers <= 1:
+            application = catia_application(backend)
+            try:
+                for key in pending:
+                    yield _compute_in_worker(application, *arguments(key))
+            finally:
+                _worker_documents.clear()
+            return
+
+        with SessionPool(workers=workers, backend=backend) as pool:
+            keys = {pool.submit(_compute_in_worker, *arguments(key)): key for key in pending}
+            for result in pool.results():
+                if result.error is None:
+                    yield result.value
+                else:
+                    yield {'conflicts': None, 'error': result.error, 'key': keys[result.job_id],
+                           'elapsed': result.elapsed, 'pid': result.pid}
+
+    def __repr__(self):
+        return f'ClashAnalysis(file_name="{self.file_name}", subsets={len(self.subsets)})'
@@ -1,8 +1,8 @@
 #! /usr/bin/python3.9
 
 import csv
+import itertools
 import os
-import time
 
 from typing import Generator
 
@@ -70,16 +70,23 @@ def csv_reader(file_name: str, units: str, delimiter: str = ',') -> Generator[di
             yield point
 
 
-def create_points(part: Part, file_name: str, units: str = 'mm', geometry_set_name: str = 'New_Points') -> None:
+def create_points(part: Part, file_name: str, units: str = 'mm', geometry_set_name: str = 'New_Points',
+                  chunk_size: int = 5000) -> int:
     """
     Parses a csv file in the format defined in :func:`~csv_reader` and populates the geometry_set_name with new
-    points. Once complete the part is updated.
+    points named after the first column. Once complete the part is updated.
+
+    The file is read chunk_size lines at a time and each chunk of points is created with one call to
+    :meth:`~pycatia.hybrid_shape_interfaces.hybrid_shape_factory.HybridShapeFactory.add_new_points_coord` so the
+    whole file is never loaded.
 
     :param Part part:
     :param str file_name: full path to csv file.
     :param str units: length units of csv_file eg 'in'
     :param str geometry_set_name: name of new geometrical set in which to add points.
-    :return:
+    :param int chunk_size: the number of points created per call to CATIA.
+    :return: the number of points created.
+    :rtype: int
     """
 
     points = csv_reader(file_name, units)
@@ -89,12 +96,20 @@ def create_points(part: Part, file_name: str, units: str = 'mm', geometry_set_na
 
     hsf = part.hybrid_shape_factory
 
-    for point in points:
-        start = time.time()
-        new_point = hsf.add_new_point_coord(point['x'], point['y'], point['z'])
-        geometrical_set.append_hybrid_shape(new_point)
-        end = time.time()
-        time_taken = end - start
-        print(f"Added point: {point['name']}. Time taken = {round(time_taken, 3)} seconds", end="\r")
+    count = 0
+    while True:
+        chunk = list(itertools.islice(points, chunk_size))
+        if not chunk:
+            break
+        hsf.add_new_points_coord(
+            [(point['x'], point['y'], point['z']) for point in chunk],
+            geometrical_set,
+            names=[point['name'] for point in chunk],
+            chunk_size=chunk_size
+        )
+        count += len(chunk)
+        part.logger.debug(f'Added {count} points.')
 
     part.update()
+
+    return count
@@ -0,0 +1,321 @@
+#! /usr/bin/python3.9
+"""
+
+    Evaluate many variants of a CATPart or CATProduct, for example for a design of experiments or trade study.
+
+    Each variant is a {parameter name: value} dict. The values are set with
+    :meth:`~pycatia.knowledge_interfaces.parameters.Parameters.write_many` and the document is updated once. The
+    outputs (mass, volume, wet area, gravity centre, parameters and custom measures) are then read and a row is
+    appended to a JSON lines results file as soon as each variant finishes. Variants already in the results file
+    are skipped so an interrupted sweep continues where it stopped when run again.
+
+    Variants can be spread across several CATIA sessions, one per worker process.
+
+    :Example - A grid of 9 variants evaluated in 3 CATIA sessions:
+
+        >>> from pycatia.scripts.parameter_sweep import ParameterSweep, grid
+        >>> if __name__ == '__main__':
+        >>>     variants = grid({'Part1\\\\Length': [100, 150, 200], 'Part1\\\\Width': ['20mm', '30mm', '40mm']})
+        >>>     sweep = ParameterSweep(r'C:\\models\\bracket.CATPart', variants, 'bracket_results.jsonl')
+        >>>     sweep.run(workers=3)
+        >>>     for row in sweep.results():
+        >>>         print(row['values'], row['outputs']['mass'])
+
+    Custom measures are functions of (application, document) returning a JSON serializable value. When workers
+    are used they must be defined at module level so they can be sent to the worker processes.
+
+"""
+
+import itertools
+import json
+import os
+import random
+import time
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+
+from pycatia.base_interfaces.base_application import catia_application
+from pycatia.base_interfaces.session_pool import SessionPool
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+analyze_outputs = ('mass', 'volume', 'wet_area', 'gravity_center')
+
+# the documents of a worker process, {file name: (document, True if the worker opened it)}.
+_worker_documents = {}
+
+
+def grid(parameters: dict) -> list:
+    """
+    All the combinations of the parameter values.
+
+    :param dict parameters: {parameter name: [values]}
+    :return: [{parameter name: value}]
+    :rtype: list
+    """
+
+    names = list(parameters)
+
+    return [dict(zip(names, values)) for values in itertools.product(*(parameters[name] for name in names))]
+
+
+def latin_hypercube(ranges: dict, samples: int, seed: int = None) -> list:
+    """
+    A latin hypercube sample of the parameter ranges. Each range is split into samples intervals and each
+    interval is sampled once. Use the same seed to get the same variants when resuming a sweep.
+
+    :param dict ranges: {parameter name: (minimum, maximum)}
+    :param int samples: the number of variants.
+    :param int seed: (optional)
+    :return: [{parameter name: value}]
+    :rtype: list
+    """
+
+    rng = random.Random(seed)
+    columns = {}
+    for name, (minimum, maximum) in ranges.items():
+        intervals = list(range(samples))
+        rng.shuffle(intervals)
+        columns[name] = [minimum + (maximum - minimum) * (i + rng.random()) / samples for i in intervals]
+
+    return [{name: columns[name][i] for name in ranges} for i in range(samples)]
+
+
+def evaluate_variant(application, file_name: str, values: dict, outputs: Sequence[str] = analyze_outputs,
+                     output_parameters: Sequence[str] = (), measures: dict = None, document=None) -> dict:
+    """
+    Set the parameter values of the document, update it once and read the outputs.
+
+    :param Application application:
+    :param str file_name: the CATPart or CATProduct. Opened if document isn't given.
+    :param dict values: {parameter name: value}
+    :param list(str) outputs: (optional) properties of the Analyze object of the root product, any of
+        'mass', 'volume', 'wet_area' and 'gravity_center'.
+    :param list(str) output_parameters: (optional) names of parameters to read after the update.
+    :param dict measures: (optional) {name: function(application, document)}
+    :param Document document: (optional) the open document.
+    :return: {output name: value}
+    :rtype: dict
+    """
+
+    if document is None:
+        document = _typed_document(application.documents.open(file_name))
+
+    product = document.product
+    if document.name.lower().endswith('.catpart'):
+        target = document.part
+        parameters = target.parameters
+    else:
+        target = product
+        parameters = product.parameters
+
+    parameters.write_many(values, update=target)
+
+    results = {}
+    analyze = product.analyze
+    for output in outputs:
+        if output not in analyze_outputs:
+            raise CATIAApplicationException(f'"{output}" is not one of {analyze_outputs}.')
+        if output == 'gravity_center':
+            results[output] = list(analyze.get_gravity_center())
+        else:
+            results[output] = getattr(analyze, output)
+
+    if output_parameters:
+        readings = parameters.read_all()
+        for name in output_parameters:
+            reading = readings.get(name)
+            if reading is None:
+                raise CATIAApplicationException(f'Could not find output parameter "{name}".')
+            results[name] = reading['value'] if reading['value'] is not None else reading['value_as_string']
+
+    for name, measure in (measures or {}).items():
+        results[name] = measure(application, document)
+
+    return results
+
+
+def _evaluate_in_worker(application, variant_id: int, file_name: str, values: dict, outputs, output_parameters,
+                        measures) -> dict:
+    start = time.perf_counter()
+    try:
+        document = _worker_document(application, file_name)
+        row = {'outputs': evaluate_variant(application, file_name, values, outputs, output_parameters, measures,
+                                           document), 'error': None}
+    except Exception as e:
+        row = {'outputs': None, 'error': f'{type(e).__name__}: {e}'}
+    row['id'] = variant_id
+    row['values'] = values
+    row['elapsed'] = time.perf_counter() - start
+    row['pid'] = os.getpid()
+
+    return row
+
+
+def _worker_document(application, file_name: str):
+    entry = _worker_documents.get(file_name)
+    if entry is None:
+        for document in application.documents:
+            if os.path.normcase(document.full_name) == os.path.normcase(file_name):
+                entry = (document, False)
+                break
+        else:
+            entry = (application.documents.open(file_name), True)
+        entry = _worker_documents[file_name] = (_typed_document(entry[0]), entry[1])
+
+    return entry[0]
+
+
+def _close_worker_documents(application) -> None:
+    # the documents opened by the worker are closed without saving the last variant. Documents that were already
+    # open are left open.
+    for document, opened in _worker_documents.values():
+        if opened:
+            try:
+                document.close()
+            except Exception:
+                pass
+    _worker_documents.clear()
+
+
+def _typed_document(document):
+    from pycatia.types.document_types import document_type
+    return document_type[document.name.split('.')[-1]](document.com_object)
+
+
+class ParameterSweep:
+    """
+    Evaluate variants of the document file_name and append the results to results_file.
+
+    :param str file_name: the CATPart or CATProduct.
+    :param list(dict) variants: {parameter name: value} for each variant. See :func:`grid` and
+        :func:`latin_hypercube`.
+    :param str results_file: the JSON lines file the results are appended to.
+    :param list(str) outputs: (optional) see :func:`evaluate_variant`.
+    :param list(str) output_parameters: (optional) see :func:`evaluate_variant`.
+    :param dict measures: (optional) see :func:`evaluate_variant`.
+    """
+
+    def __init__(self, file_name: str, variants: Sequence[dict], results_file: str,
+                 outputs: Sequence[str] = analyze_outputs, output_parameters: Sequence[str] = (),
+                 measures: dict = None):
+        if not os.path.isfile(file_name):
+            raise FileNotFoundError(f'Could not find file {file_name}.')
+        self.file_name = os.path.abspath(file_name)
+        self.variants = list(variants)
+        self.results_file = results_file
+        self.outputs = tuple(outputs)
+        self.output_parameters = tuple(output_parameters)
+        self.measures = dict(measures or {})
+
+    def completed(self) -> set:
+        """
+        The ids (index in variants) of the variants evaluated without error.
+
+        :return: set
+        """
+
+        completed = set()
+        for row in self.results():
+            if row['error'] is None:
+                if row['values'] != self.variants[row['id']]:
+                    raise CATIAApplicationException(f'Variant {row["id"]} in {self.results_file} does not match the '
+                                                    f'variants. Use a new results file for a new plan.')
+                completed.add(row['id'])
+
+        return completed
+
+    def pending(self) -> list:
+        """
+        :return: the ids of the variants still to be evaluated.
+        :rtype: list
+        """
+
+        completed = self.completed()
+
+        return [i for i in range(len(self.variants)) if i not in completed]
+
+    def results(self) -> Iterator[dict]:
+        """
+        Read the results file one row at a time. A variant that failed and was evaluated again has a row for each
+        attempt.
+
+        :return: Iterator[dict]
+        """
+
+        if not os.path.isfile(self.results_file):
+            return
+        with open(self.results_file) as file:
+            for line in file:
+                if line.endswith('\n'):
+                    yield json.loads(line)
+
+    def run(self, workers: int = 1, backend=None, on_result: Callable[[dict], None] = None) -> int:
+        """
+        Evaluate the pending variants.
+
+        The document is closed without saving once the variants are evaluated. If it was already open in the
+        session it is used and left open, with the values of the last variant.
+
+        :param int workers: (optional) the number of worker processes, each with its own CATIA session. With 1
+            the variants are evaluated in this process.
+        :param backend: (optional) the backend creating the CATIA session of each worker. Defaults to a new
+            session per worker, or the running session when workers is 1.
+        :param on_result: (optional) called with each row as it is written.
+        :return: the number of variants evaluated without error.
+        :rtype: int
+        """
+
+        pending = self.pending()
+        if not pending:
+            return 0
+
+        succeeded = 0
+        with self._open_results_file() as file:
+            for row in self._evaluate(pending, workers, backend):
+                file.write(json.dumps(row) + '\n')
+                file.flush()
+                if row['error'] is None:
+                    succeeded += 1
+                if on_result is not None:
+                    on_result(row)
+
+        return succeeded
+
+    def _evaluate(self, pending: list, workers: int, backend) -> Iterator[dict]:
+        arguments = (self.file_name, self.outputs, self.output_parameters, self.measures)
+        if workers <= 1:
+            application = catia_application(backend)
+            try:
+                for variant_id in pending:
+                    yield _evaluate_in_worker(application, variant_id, arguments[0], self.variants[variant_id],
+                                              *arguments[1:])
+            finally:
+                _close_worker_documents(application)
+            return
+
+        with SessionPool(workers=workers, backend=backend, finalizer=_close_worker_documents) as pool:
+            # the variants are read as sessions become free so results are written as they finish.
+            results = pool.map(_evaluate_in_worker, pending, itertools.repeat(arguments[0]),
+                               (self.variants[variant_id] for variant_id in pending),
+                               *(itertools.repeat(argument) for argument in arguments[1:]))
+            for result in results:
+                if result.error is None:
+                    yield result.value
+                else:
+                    variant_id = pending[result.job_id]
+                    yield {'outputs': None, 'error': result.error, 'id': variant_id,
+                           'values': self.variants[variant_id], 'elapsed': result.elapsed, 'pid': result.pid}
+
+    def _open_results_file(self):
+        # an interrupted run may have left a partial last row.
+        if os.path.isfile(self.results_file):
+            with open(self.results_file, 'rb+') as file:
+                content = file.read()
+                if content and not content.endswith(b'\n'):
+                    file.truncate(content.rfind(b'\n') + 1)
+
+        return open(self.results_file, 'a')
+
+    def __repr__(self):
+        return f'ParameterSweep(file_name="{self.file_name}", variants={len(self.variants)})'
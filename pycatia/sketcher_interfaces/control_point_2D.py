@@ -102,7 +102,7 @@ class ControlPoint2D(Point2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def set_tangent(self, i_tangent_x: float, i_tangent_y: float) -> None:
         """
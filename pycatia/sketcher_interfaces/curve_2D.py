@@ -182,7 +182,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object, i_param])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object, i_param])
 
     def get_derivatives(self, i_param: float) -> tuple:
         """
@@ -222,7 +222,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object, i_param])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object, i_param])
 
     def get_end_points(self) -> tuple:
         """
@@ -261,7 +261,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_length_at_param(self, i_from_param: float, i_to_param: float) -> float:
         """
@@ -360,7 +360,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_point_at_param(self, i_param: float) -> tuple:
         """
@@ -397,7 +397,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object, i_param])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object, i_param])
 
     def get_range_box(self) -> tuple:
         """
@@ -436,7 +436,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_tangent(self, i_param: float) -> tuple:
         """
@@ -473,7 +473,7 @@ class Curve2D(Geometry2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object, i_param])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object, i_param])
 
     def is_periodic(self) -> bool:
         """
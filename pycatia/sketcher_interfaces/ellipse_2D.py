@@ -145,7 +145,7 @@ class Ellipse2D(Curve2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_major_axis(self) -> tuple:
         """
@@ -179,7 +179,7 @@ class Ellipse2D(Curve2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_minor_axis(self) -> tuple:
         """
@@ -213,7 +213,7 @@ class Ellipse2D(Curve2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def set_data(self,
                  i_center_x: float,
@@ -8,6 +8,7 @@
         and thus help debugging in pycatia.
         
 """
+from typing import Sequence
 
 from pycatia.in_interfaces.reference import Reference
 from pycatia.mec_mod_interfaces.geometric_elements import GeometricElements
@@ -528,5 +529,159 @@ class Factory2D(AnyObject):
         """
         return Spline2D(self.factory_2d.CreateSpline(i_poles))
 
+    def create_points(self, coordinates: Sequence[Sequence[float]]) -> list:
+        """
+        Create many 2D points with one call to SystemService.evaluate(). The sketch edition must be open.
+
+        :param list coordinates: the (x, y) of each point.
+        :return: list[Point2D]
+        :rtype: list
+        """
+
+        vba_function_name = 'factory_2d_create_points'
+        vba_code = """
+        Public Function factory_2d_create_points(factory, coordinates)
+            Dim i, points()
+            ReDim points((UBound(coordinates) + 1) / 2 - 1)
+            For i = 0 To UBound(points)
+                Set points(i) = factory.CreatePoint(coordinates(2 * i), coordinates(2 * i + 1))
+            Next
+            factory_2d_create_points = points
+        End Function
+        """
+
+        return [Point2D(point) for point in self._evaluate_many(vba_code, vba_function_name, coordinates, 2)]
+
+    def create_lines(self, segments: Sequence[Sequence[float]]) -> list:
+        """
+        Create many 2D lines with one call to SystemService.evaluate(). The sketch edition must be open.
+
+        :Example - Create a grid of lines:
+
+            >>> factory_2d = sketch.open_edition()
+            >>> lines = factory_2d.create_lines([(0, y, 100, y) for y in range(0, 100, 10)])
+            >>> sketch.close_edition()
+
+        :param list segments: the (x1, y1, x2, y2) of each line.
+        :return: list[Line2D]
+        :rtype: list
+        """
+
+        vba_function_name = 'factory_2d_create_lines'
+        vba_code = """
+        Public Function factory_2d_create_lines(factory, coordinates)
+            Dim i, lines()
+            ReDim lines((UBound(coordinates) + 1) / 4 - 1)
+            For i = 0 To UBound(lines)
+                Set lines(i) = factory.CreateLine(coordinates(4 * i), coordinates(4 * i + 1), _
+                                                  coordinates(4 * i + 2), coordinates(4 * i + 3))
+            Next
+            factory_2d_create_lines = lines
+        End Function
+        """
+
+        return [Line2D(line) for line in self._evaluate_many(vba_code, vba_function_name, segments, 4)]
+
+    def create_circles(self, centers: Sequence[Sequence[float]], radii: Sequence[float]) -> list:
+        """
+        Create many closed 2D circles with one call to SystemService.evaluate(). The sketch edition must be
+        open.
+
+        :param list centers: the (x, y) of the centre of each circle.
+        :param list radii: the radius of each circle.
+        :return: list[Circle2D]
+        :rtype: list
+        """
+
+        vba_function_name = 'factory_2d_create_circles'
+        vba_code = """
+        Public Function factory_2d_create_circles(factory, coordinates)
+            Dim i, circles()
+            ReDim circles((UBound(coordinates) + 1) / 3 - 1)
+            For i = 0 To UBound(circles)
+                Set circles(i) = factory.CreateClosedCircle(coordinates(3 * i), coordinates(3 * i + 1), _
+                                                            coordinates(3 * i + 2))
+            Next
+            factory_2d_create_circles = circles
+        End Function
+        """
+
+        if len(centers) != len(radii):
+            raise ValueError('There must be one radius per centre.')
+        circles = [tuple(center) + (radius,) for center, radius in zip(centers, radii)]
+
+        return [Circle2D(circle) for circle in self._evaluate_many(vba_code, vba_function_name, circles, 3)]
+
+    def create_polyline(self, coordinates: Sequence[Sequence[float]], closed: bool = False) -> list:
+        """
+        Create a profile of lines joining the points with one call to SystemService.evaluate(). A point is
+        created at each vertex and shared by the end of one line and the start of the next so the profile is
+        connected. The sketch edition must be open.
+
+        :Example - A closed rectangular profile:
+
+            >>> factory_2d = sketch.open_edition()
+            >>> lines = factory_2d.create_polyline([(0, 0), (100, 0), (100, 50), (0, 50)], closed=True)
+            >>> sketch.close_edition()
+
+        :param list coordinates: the (x, y) of each vertex.
+        :param bool closed: (optional) join the last vertex to the first.
+        :return: list[Line2D]
+        :rtype: list
+        """
+
+        vba_function_name = 'factory_2d_create_polyline'
+        vba_code = """
+        Public Function factory_2d_create_polyline(factory, coordinates, closed)
+            Dim i, count, line_count, j, points(), lines()
+            count = (UBound(coordinates) + 1) / 2
+            line_count = count - 1
+            If closed Then line_count = count
+            ReDim points(count - 1), lines(line_count - 1)
+            For i = 0 To count - 1
+                Set points(i) = factory.CreatePoint(coordinates(2 * i), coordinates(2 * i + 1))
+            Next
+            For i = 0 To line_count - 1
+                j = (i + 1) Mod count
+                Set lines(i) = factory.CreateLine(coordinates(2 * i), coordinates(2 * i + 1), _
+                                                  coordinates(2 * j), coordinates(2 * j + 1))
+                lines(i).StartPoint = points(i)
+                lines(i).EndPoint = points(j)
+            Next
+            factory_2d_create_polyline = lines
+        End Function
+        """
+
+        if len(coordinates) < 2 or closed and len(coordinates) < 3:
+            raise ValueError('Not enough points for a polyline.')
+        for coordinate in coordinates:
+            if len(coordinate) != 2:
+                raise ValueError('Each coordinate must have 2 components (x, y).')
+
+        system_service = self.application.system_service
+        lines = system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [self.factory_2d, tuple(float(c) for coordinate in coordinates for c in coordinate), closed]
+        )
+
+        return [Line2D(line) for line in lines]
+
+    def _evaluate_many(self, vba_code: str, vba_function_name: str, items: Sequence[Sequence[float]],
+                       size: int) -> tuple:
+        if not items:
+            return ()
+        for item in items:
+            if len(item) != size:
+                raise ValueError(f'Each item must have {size} values.')
+
+        system_service = self.application.system_service
+
+        return system_service.evaluate_function(
+            vba_code,
+            vba_function_name,
+            [self.factory_2d, tuple(float(value) for item in items for value in item)]
+        )
+
     def __repr__(self):
         return f'Factory2D(name="{self.name}")'
@@ -91,7 +91,7 @@ class Parabola2D(Curve2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_center(self) -> tuple:
         """
@@ -126,7 +126,7 @@ class Parabola2D(Curve2D):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def set_data(self, i_center_x: float, i_center_y: float, i_axis_x: float, i_axis_y: float,
                  i_focal_distance: float) -> None:
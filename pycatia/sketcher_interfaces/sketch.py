@@ -8,6 +8,8 @@
         and thus help debugging in pycatia.
         
 """
+from contextlib import contextmanager
+from typing import Iterator
 
 from pycatia.mec_mod_interfaces.constraints import Constraints
 from pycatia.mec_mod_interfaces.geometric_elements import GeometricElements
@@ -225,6 +227,26 @@ class Sketch(AnyObject):
         """
         return self.sketch.CloseEdition()
 
+    @contextmanager
+    def edition(self) -> Iterator[Factory2D]:
+        """
+        Open the sketch edition and close it when the context exits, also if an exception is raised.
+
+        :Example - Create a profile in one edition:
+
+            >>> with sketch.edition() as factory_2d:
+            >>>     factory_2d.create_polyline([(0, 0), (100, 0), (100, 50), (0, 50)], closed=True)
+            >>>     factory_2d.create_circles([(25, 25), (75, 25)], [5, 5])
+
+        :return: Factory2D
+        """
+
+        factory_2d = self.open_edition()
+        try:
+            yield factory_2d
+        finally:
+            self.close_edition()
+
     def evaluate(self) -> None:
         """
         .. note::
@@ -291,7 +313,7 @@ class Sketch(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def inverse_orientation(self) -> None:
         """
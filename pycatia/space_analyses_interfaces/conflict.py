@@ -307,7 +307,7 @@ class Conflict(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_second_point_coordinates(self) -> tuple:
         """
@@ -353,7 +353,7 @@ class Conflict(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def __repr__(self):
         return f'Conflict(name="{ self.name }")'
@@ -589,7 +589,7 @@ class Distance(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_second_point_coordinates(self) -> tuple:
         """
@@ -635,7 +635,7 @@ class Distance(AnyObject):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def __repr__(self):
         return f'Distance(name="{self.name}")'
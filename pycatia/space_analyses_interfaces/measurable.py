@@ -1,5 +1,7 @@
 #! /usr/bin/python3.9
 
+from typing import Sequence, Union
+
 from pycatia.in_interfaces.reference import Reference
 from pycatia.system_interfaces.any_object import AnyObject
 from pycatia.system_interfaces.system_service import SystemService
@@ -249,18 +251,16 @@ class Measurable(AnyObject):
         :return: tuple(float, float, float)
         """
         vba_function_name = 'get_axis'
-        vba_function = 'GetAxis'
-        vba_code = f'''   
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''   
+        Public Function get_axis(measurable)
             Dim AxisVector (2)
-            measurable.{vba_function} AxisVector
-            {vba_function_name} = AxisVector
+            measurable.GetAxis AxisVector
+            get_axis = AxisVector
         End Function
         '''
 
         system_service = self.application.system_service
-        result = system_service.evaluate(vba_code, 0, vba_function_name,
-                                         [self.measurable])
+        result = system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
         return result
 
@@ -296,16 +296,15 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_axis_system'
-        vba_function = 'GetAxisSystem'
-        vba_code = f'''        
-            Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+            Public Function get_axis_system(measurable)
                 Dim Components (11)
-                measurable.{vba_function} Components
-                {vba_function_name} = Components
+                measurable.GetAxisSystem Components
+                get_axis_system = Components
             End Function
             '''
         system_service = self.application.system_service
-        result = system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        result = system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
         return result
 
@@ -332,17 +331,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'create_cog'
-        vba_function = 'GetCOG'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function create_cog(measurable)
             Dim coord(2)
-            measurable.{vba_function} coord
-            {vba_function_name} = coord
+            measurable.GetCOG coord
+            create_cog = coord
         End Function
         '''
 
         system_service = self.application.system_service
-        result = system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        result = system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
         return result
 
@@ -369,17 +367,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_center'
-        vba_function = 'GetCenter'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function get_center(measurable)
             Dim Coordinates (2)
-            measurable.{vba_function} Coordinates
-            {vba_function_name} = Coordinates
+            measurable.GetCenter Coordinates
+            get_center = Coordinates
         End Function
         '''
 
         system_service = self.application.system_service
-        result = system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        result = system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
         return result
 
@@ -409,17 +406,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_direction'
-        vba_function = 'GetDirection'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function get_direction(measurable)
             Dim direction (2) 
-            measurable.{vba_function} direction
-            {vba_function_name} = direction
+            measurable.GetDirection direction
+            get_direction = direction
         End Function
         '''
 
         system_service = self.application.system_service
-        result = system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        result = system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
         return result
 
@@ -491,17 +487,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_minimum_distance_points'
-        vba_function = 'GetMinimumDistancePoints'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable, i_measured_item)
+        vba_code = '''        
+        Public Function get_minimum_distance_points(measurable, i_measured_item)
             Dim Coordinates (8) 
-            measurable.{vba_function} i_measured_item, Coordinates
-            {vba_function_name} = Coordinates
+            measurable.GetMinimumDistancePoints i_measured_item, Coordinates
+            get_minimum_distance_points = Coordinates
         End Function
         '''
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable, i_measured_item.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.measurable, i_measured_item.com_object])
 
     def get_plane(self):
         """
@@ -534,17 +529,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_plane'
-        vba_function = 'GetPlane'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function get_plane(measurable)
             Dim Components (8)
-            measurable.{vba_function} Components
-            {vba_function_name} = Components
+            measurable.GetPlane Components
+            get_plane = Components
         End Function
         '''
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
     def get_point(self):
         """
@@ -570,17 +564,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_point'
-        vba_function = 'GetPoint'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function get_point(measurable)
             Dim Coordinates (2)
-            measurable.{vba_function} Coordinates
-            {vba_function_name} = Coordinates
+            measurable.GetPoint Coordinates
+            get_point = Coordinates
         End Function
         '''
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
     def get_points_on_axis(self):
         """
@@ -614,17 +607,16 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_points_on_axis'
-        vba_function = 'GetPointsOnAxis'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function get_points_on_axis(measurable)
             Dim Coordinates (8)
-            measurable.{vba_function} Coordinates
-            {vba_function_name} = Coordinates
+            measurable.GetPointsOnAxis Coordinates
+            get_points_on_axis = Coordinates
         End Function
         '''
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
 
     def get_points_on_curve(self):
         """
@@ -657,17 +649,156 @@ class Measurable(AnyObject):
         """
 
         vba_function_name = 'get_points_on_curve'
-        vba_function = 'GetPointsOnCurve'
-        vba_code = f'''        
-        Public Function {vba_function_name}(measurable)
+        vba_code = '''        
+        Public Function get_points_on_curve(measurable)
             Dim Coordinates (8)
-            measurable.{vba_function} Coordinates
-            {vba_function_name} = Coordinates
+            measurable.GetPointsOnCurve Coordinates
+            get_points_on_curve = Coordinates
         End Function
         '''
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.measurable])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.measurable])
+
+    @staticmethod
+    def _evaluate_many(measurables: Sequence['Measurable'], vba_function: str, size: int,
+                       i_measured_items: Union[Reference, Sequence[Reference]] = None) -> list:
+        """
+        Call the measurable method vba_function for all measurables in one SystemService.evaluate() call.
+
+        :param list(Measurable) measurables:
+        :param str vba_function: the CATIA method filling an array eg 'GetCOG'.
+        :param int size: the size of the array filled by vba_function.
+        :param Reference i_measured_items: (optional) measured item(s) passed to vba_function, either one
+            Reference for all measurables or one per measurable.
+        :return: [tuple(float)]
+        """
+
+        if not measurables:
+            return []
+
+        parameters = [tuple(measurable.com_object for measurable in measurables)]
+        vba_function_name = f'{vba_function.lower()}_many'
+        if i_measured_items is None:
+            arguments = 'measurables'
+            item = ''
+        else:
+            if isinstance(i_measured_items, Reference):
+                i_measured_items = [i_measured_items] * len(measurables)
+            if len(i_measured_items) != len(measurables):
+                raise ValueError('A measured item is required for each measurable.')
+            parameters.append(tuple(i_measured_item.com_object for i_measured_item in i_measured_items))
+            arguments = 'measurables, i_measured_items'
+            item = 'i_measured_items(i), '
+
+        vba_code = f'''
+        Public Function {vba_function_name}({arguments})
+            Dim results()
+            ReDim results(UBound(measurables))
+            For i = 0 To UBound(measurables)
+                ReDim values({size - 1})
+                measurables(i).{vba_function} {item}values
+                results(i) = values
+            Next
+            {vba_function_name} = results
+        End Function
+        '''
+
+        system_service = measurables[0].application.system_service
+        return list(system_service.evaluate_function(vba_code, vba_function_name, parameters))
+
+    @staticmethod
+    def get_axis_many(measurables: Sequence['Measurable']) -> list:
+        """
+        Batched version of :meth:`get_axis` for many measurables. The results are retrieved with one call to
+        SystemService.evaluate() rather than one call per measurable.
+
+        :param list(Measurable) measurables:
+        :return: [tuple(float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetAxis', 3)
+
+    @staticmethod
+    def get_cog_many(measurables: Sequence['Measurable']) -> list:
+        """
+        Batched version of :meth:`get_cog` for many measurables. The results are retrieved with one call to
+        SystemService.evaluate() rather than one call per measurable.
+
+        :Example - Centre of gravity of all bodies:
+
+            >>> references = [part.create_reference_from_object(body) for body in part.bodies]
+            >>> measurables = [spa_workbench.get_measurable(reference) for reference in references]
+            >>> cogs = Measurable.get_cog_many(measurables)
+
+        :param list(Measurable) measurables:
+        :return: [tuple(float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetCOG', 3)
+
+    @staticmethod
+    def get_center_many(measurables: Sequence['Measurable']) -> list:
+        """
+        Batched version of :meth:`get_center` for many measurables. The results are retrieved with one call to
+        SystemService.evaluate() rather than one call per measurable.
+
+        :param list(Measurable) measurables:
+        :return: [tuple(float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetCenter', 3)
+
+    @staticmethod
+    def get_direction_many(measurables: Sequence['Measurable']) -> list:
+        """
+        Batched version of :meth:`get_direction` for many measurables. The results are retrieved with one call
+        to SystemService.evaluate() rather than one call per measurable.
+
+        :param list(Measurable) measurables:
+        :return: [tuple(float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetDirection', 3)
+
+    @staticmethod
+    def get_minimum_distance_points_many(measurables: Sequence['Measurable'],
+                                         i_measured_items: Union[Reference, Sequence[Reference]]) -> list:
+        """
+        Batched version of :meth:`get_minimum_distance_points` for many measurables. The results are retrieved
+        with one call to SystemService.evaluate() rather than one call per measurable.
+
+        :param list(Measurable) measurables:
+        :param Reference or list(Reference) i_measured_items: one Reference measured from every measurable or
+            one Reference per measurable.
+        :return: [tuple(float, float, float, float, float, float, float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetMinimumDistancePoints', 9, i_measured_items)
+
+    @staticmethod
+    def get_plane_many(measurables: Sequence['Measurable']) -> list:
+        """
+        Batched version of :meth:`get_plane` for many measurables. The results are retrieved with one call to
+        SystemService.evaluate() rather than one call per measurable.
+
+        :param list(Measurable) measurables:
+        :return: [tuple(float, float, float, float, float, float, float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetPlane', 9)
+
+    @staticmethod
+    def get_point_many(measurables: Sequence['Measurable']) -> list:
+        """
+        Batched version of :meth:`get_point` for many measurables. The results are retrieved with one call to
+        SystemService.evaluate() rather than one call per measurable.
+
+        :param list(Measurable) measurables:
+        :return: [tuple(float, float, float)]
+        """
+
+        return Measurable._evaluate_many(measurables, 'GetPoint', 3)
 
     def __repr__(self):
         return f'CATIAMeasurable({self.name})'
@@ -428,7 +428,7 @@ class MeasureSettingAtt(SettingController):
         """
 
         system_service = self.application.system_service
-        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+        return system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
 
     def get_text_color_info(self, io_admin_level: str, io_locked: str) -> bool:
         """
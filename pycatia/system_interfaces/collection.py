@@ -8,10 +8,15 @@
         and thus help debugging in pycatia.
 
 """
+import functools
+import re
+from types import FunctionType
 from typing import Iterator
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from pycatia.base_interfaces.pycatia import PyCATIA
+from pycatia.base_interfaces.com_cache import search_cache
 from pycatia.system_interfaces.any_object import AnyObject
 
 # from pycatia.system_interfaces.cat_base_dispatch import CATBaseDispatch
@@ -39,10 +44,25 @@ class Collection(PyCATIA):
 
     """
 
+    # methods of subclasses starting with these names change the collection. They cause the name index to be rebuilt
+    # and clear the search cache.
+    _modifying_methods = ('add', 'create', 'delete', 'remove', 'replace')
+
     def __init__(self, com_object, child_object=AnyObject):
         super().__init__()
         self.com_object = com_object
         self.child_object = child_object
+        self._name_index = None
+        self._name_index_count = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if isinstance(attribute, FunctionType) and name.startswith(cls._modifying_methods):
+                setattr(cls, name, _invalidates_name_index(attribute))
+        # subclasses index by position. Keep collection['name'] working for them.
+        if '__getitem__' in vars(cls):
+            setattr(cls, '__getitem__', _gets_item_by_name(vars(cls)['__getitem__']))
 
     @property
     def application(self) -> 'Application':
@@ -194,15 +214,139 @@ class Collection(PyCATIA):
 
         return self.child_object(self.com_object.Item(index))
 
+    def fetch(self, attrs: Sequence[str] = ('Name',)) -> dict:
+        """
+        Get the properties attrs of every item in the collection with one call to SystemService.evaluate()
+        rather than one or more calls per item.
+
+        The properties must return values (str, int, float, bool) rather than objects. A property of a property
+        can be fetched using a dotted name.
+
+        :Example - Instance names and part numbers of all the products in an assembly:
+
+            >>> products = product.products
+            >>> columns = products.fetch(['Name', 'PartNumber', 'ReferenceProduct.Nomenclature'])
+            >>> for name, part_number in zip(columns['Name'], columns['PartNumber']):
+            >>>     print(name, part_number)
+
+        :param list(str) attrs: the CATIA property names eg ['Name', 'PartNumber'].
+        :return: a dict with a list of values for each name in attrs.
+        :rtype: dict
+        """
+
+        attrs = list(attrs)
+        for attr in attrs:
+            if not re.fullmatch(r'[A-Za-z]\w*(\.[A-Za-z]\w*)*', attr):
+                raise ValueError(f'"{attr}" is not a valid property name.')
+
+        columns = range(len(attrs))
+        redims = '\n'.join(f'            ReDim column_{j}(count - 1)' for j in columns)
+        assignments = '\n'.join(f'                column_{j}(i - 1) = item.{attr}' for j, attr in enumerate(attrs))
+        vba_function_name = 'collection_fetch'
+        vba_code = f"""
+        Public Function collection_fetch(collection)
+            Dim count, i, item
+            count = collection.Count
+            If count = 0 Then
+                collection_fetch = Array()
+                Exit Function
+            End If
+{redims}
+            For i = 1 To count
+                Set item = collection.Item(i)
+{assignments}
+            Next
+            collection_fetch = Array({', '.join(f'column_{j}' for j in columns)})
+        End Function
+        """
+
+        system_service = self.application.system_service
+        values = system_service.evaluate_function(vba_code, vba_function_name, [self.com_object])
+        if not values:
+            return {attr: [] for attr in attrs}
+
+        return {attr: list(column) for attr, column in zip(attrs, values)}
+
     def get_item_names(self):
-        names = []
-        for i in range(self.com_object.Count):
-            name = self.com_object.Item(i + 1).Name
-            names.append(name)
+        """
+        :return: [str]
+        """
+
+        return self.fetch(['Name'])['Name']
+
+    def build_name_index(self) -> dict:
+        """
+        Build an index of the item names with one call to :meth:`fetch`. :meth:`get_item_by_name`, `in` and
+        `collection['name']` then use the index rather than scanning the collection.
+
+        The index is rebuilt when the number of items changes or after the add / create / remove / delete / replace
+        methods of this collection are called. Items renamed since the index was built are not found until
+        :meth:`build_name_index` is called again. The index belongs to this collection object so keep a reference
+        to it rather than getting the collection again for each look up.
+
+        :Example - Look up many parameters by name:
+
+            >>> parameters = part.parameters
+            >>> parameters.build_name_index()
+            >>> for name, value in new_values.items():
+            >>>     if name in parameters:
+            >>>         parameters[name].value = value
+
+        :return: dict of item name to item index (starting from 1).
+        :rtype: dict
+        """
 
-        return names
+        names = self.fetch(['Name'])['Name']
+        index = {}
+        for i, name in enumerate(names):
+            # as get_item_by_name() returns the first match.
+            index.setdefault(name, i + 1)
+        self._name_index = index
+        self._name_index_count = len(names)
+
+        return index
+
+    def clear_name_index(self) -> None:
+        """
+        Remove the index built by :meth:`build_name_index`.
+
+        :return: None
+        """
+
+        self._name_index = None
+
+    def _get_name_index(self) -> dict:
+        if self.com_object.Count != self._name_index_count:
+            self.build_name_index()
+
+        return self._name_index
+
+    def _get_item_by_key(self, name: str):
+        item = self.get_item_by_name(name)
+        if item is None:
+            raise KeyError(name)
+
+        return item
 
     def get_item_by_name(self, name):
+        """
+        :param str name:
+        :return: child_object or None if not found.
+        """
+
+        if self._name_index is not None:
+            index = self._get_name_index()
+            if name not in index:
+                return None
+            com_object = self.com_object.Item(index[name])
+            # an item could have been renamed since the index was built.
+            if com_object.Name == name:
+                return self.child_object(com_object)
+            index = self.build_name_index()
+            if name not in index:
+                return None
+            return self.child_object(self.com_object.Item(index[name]))
+
         for i in range(self.com_object.Count):
             if self.com_object.Item(i + 1).Name == name:
                 return self.child_object(self.com_object.Item(i + 1))
@@ -225,7 +369,16 @@ class Collection(PyCATIA):
 
         return self.count
 
+    def __contains__(self, name: str) -> bool:
+        if self._name_index is not None:
+            return name in self._get_name_index()
+
+        return name in self.get_item_names()
+
     def __getitem__(self, n: int) -> AnyObject:
+        if isinstance(n, str):
+            return self._get_item_by_key(n)
+
         if (n + 1) > self.count:
             raise StopIteration
 
@@ -237,3 +390,24 @@ class Collection(PyCATIA):
 
     def __repr__(self):
         return f'Collection(name="{self.name}")'
+
+
+def _invalidates_name_index(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # forces the name index, if any, to be rebuilt on the next look up.
+        self._name_index_count = -1
+        search_cache.clear()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _gets_item_by_name(method):
+    @functools.wraps(method)
+    def wrapper(self, n):
+        if isinstance(n, str):
+            return self._get_item_by_key(n)
+        return method(self, n)
+
+    return wrapper
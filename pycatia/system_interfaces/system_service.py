@@ -9,6 +9,7 @@
         
 """
 
+from pycatia.base_interfaces.vba_registry import vba_registry
 from pycatia.system_interfaces.any_object import AnyObject
 
 
@@ -107,6 +108,21 @@ class SystemService(AnyObject):
         """
         return self.system_service.Evaluate(i_script_text, i_language, i_function_name, i_parameters)
 
+    def evaluate_function(self, vba_code, vba_function_name, i_parameters):
+        """
+        Evaluates the VBScript function vba_function_name defined in vba_code.
+
+        The script is rendered once and called through the
+        :mod:`VBA registry <pycatia.base_interfaces.vba_registry>` which records the time spent in each function
+        and can call it from a helper module rather than sending the script text on each call.
+
+        :param str vba_code:
+        :param str vba_function_name:
+        :param list i_parameters:
+        :return: The value returned by the function (if any)
+        """
+        return vba_registry.evaluate(self, vba_code, vba_function_name, i_parameters)
+
     def execute_background_processus(self, i_executable_path):
         """
         .. note::
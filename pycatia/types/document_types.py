@@ -1,13 +1,48 @@
-from pycatia.cat_mat_interfaces.material_document import MaterialDocument
-from pycatia.drafting_interfaces.drawing_document import DrawingDocument
-from pycatia.mec_mod_interfaces.part_document import PartDocument
-from pycatia.product_structure_interfaces.product_document import ProductDocument
-from pycatia.funct_system_interfaces.functional_document import FunctionalDocument
-
-document_type = {
-    "CATPart": PartDocument,
-    "CATProduct": ProductDocument,
-    "CATDrawing": DrawingDocument,
-    "CATMaterial": MaterialDocument,
-    "CATSystem": FunctionalDocument
+import importlib
+from collections.abc import Mapping
+
+_document_classes = {
+    "CATPart": ("pycatia.mec_mod_interfaces.part_document", "PartDocument"),
+    "CATProduct": ("pycatia.product_structure_interfaces.product_document", "ProductDocument"),
+    "CATDrawing": ("pycatia.drafting_interfaces.drawing_document", "DrawingDocument"),
+    "CATMaterial": ("pycatia.cat_mat_interfaces.material_document", "MaterialDocument"),
+    "CATSystem": ("pycatia.funct_system_interfaces.functional_document", "FunctionalDocument"),
 }
+
+
+class _DocumentTypes(Mapping):
+    """
+    Maps the file suffix of a document to its pycatia class. The module of each class is imported on first
+    look up.
+    """
+
+    def __init__(self, document_classes):
+        self._document_classes = document_classes
+        self._loaded = {}
+
+    def __getitem__(self, suffix):
+        document_class = self._loaded.get(suffix)
+        if document_class is None:
+            module_name, class_name = self._document_classes[suffix]
+            document_class = getattr(importlib.import_module(module_name), class_name)
+            self._loaded[suffix] = document_class
+
+        return document_class
+
+    def __iter__(self):
+        return iter(self._document_classes)
+
+    def __len__(self):
+        return len(self._document_classes)
+
+
+document_type = _DocumentTypes(_document_classes)
+
+
+def __getattr__(name):
+    # the document classes were previously imported here.
+    for module_name, class_name in _document_classes.values():
+        if class_name == name:
+            return getattr(importlib.import_module(module_name), class_name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
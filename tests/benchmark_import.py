@@ -0,0 +1,134 @@
+#! /usr/bin/python3.9
+"""
+
+    Benchmark the cold start of pycatia.
+
+    Each run imports pycatia in a new python process and measures the time taken, the number of pycatia modules
+    loaded and the resident memory of the process afterwards. CATIA is not required.
+
+    Usage:
+
+        python -m tests.benchmark_import
+        python -m tests.benchmark_import --runs 20 --statement "from pycatia import catia" --output import.json
+
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_probe = '''
+import json
+import sys
+import time
+
+
+def resident_memory():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        get_process_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_process_memory_info.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+        get_process_memory_info(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize
+    import resource
+    # ru_maxrss is in kilobytes on linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+rss_before = resident_memory()
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'elapsed': elapsed,
+    'modules': len([m for m in sys.modules if m == 'pycatia' or m.startswith('pycatia.')]),
+    'rss': resident_memory(),
+    'rss_delta': resident_memory() - rss_before,
+}))
+'''
+
+
+def run(statement: str) -> dict:
+    """
+    Run statement in a new python process.
+
+    :param str statement:
+    :return: dict
+    """
+
+    output = subprocess.run([sys.executable, '-c', _probe, statement], capture_output=True, text=True, check=True)
+
+    return json.loads(output.stdout)
+
+
+def benchmark(statement: str = 'from pycatia import catia', runs: int = 10) -> dict:
+    """
+    Run statement runs times and summarise the results. The first run is discarded as it may compile the
+    modules to byte code.
+
+    :param str statement:
+    :param int runs:
+    :return: dict
+    """
+
+    run(statement)
+    results = [run(statement) for _ in range(runs)]
+    elapsed = [r['elapsed'] for r in results]
+
+    return {
+        'statement': statement,
+        'runs': runs,
+        'python': sys.version.split()[0],
+        'elapsed_min': min(elapsed),
+        'elapsed_median': statistics.median(elapsed),
+        'modules': results[-1]['modules'],
+        'rss_median': statistics.median(r['rss'] for r in results),
+        'rss_delta_median': statistics.median(r['rss_delta'] for r in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the cold start of pycatia.')
+    parser.add_argument('--statement', default='from pycatia import catia')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--output', help='append the results to this JSON lines file.')
+    args = parser.parse_args()
+
+    result = benchmark(args.statement, args.runs)
+    print(f'{result["statement"]!r} x {result["runs"]} (python {result["python"]})')
+    print(f'    elapsed     min {result["elapsed_min"] * 1000:.1f} ms, median {result["elapsed_median"] * 1000:.1f} ms')
+    print(f'    modules     {result["modules"]}')
+    print(f'    rss         median {result["rss_median"] / 2 ** 20:.1f} MiB, '
+          f'import added {result["rss_delta_median"] / 2 ** 20:.1f} MiB')
+    if args.output:
+        with open(args.output, 'a') as file:
+            file.write(json.dumps(result) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -47,3 +47,48 @@ def create_extrusion(part, hsf, hb, co_ord_1=co_ord_1, co_ord_2=co_ord_2, co_ord
     hb.append_hybrid_shape(extrusion)
 
     return extrusion
+
+
+class FakeApplication:
+    """
+    Stands in for the CATIA.Application dispatch object in the session pool tests.
+    """
+
+    def __init__(self, log_file=None):
+        self.Caption = 'CATIA V5'
+        self.memory = 1000
+        self.log_file = log_file
+
+    def Quit(self):
+        pass
+
+
+class FakeBackend:
+
+    def __init__(self, log_file=None):
+        self.log_file = log_file
+
+    def dispatch(self, prog_id):
+        return FakeApplication(self.log_file)
+
+
+def caption_job(application, suffix):
+    application.com_object.memory += 100
+    return application.caption + suffix
+
+
+def set_caption(application, caption):
+    application.com_object.Caption = caption
+
+
+def log_finalizer(application):
+    with open(application.com_object.log_file, 'a') as file:
+        file.write('finalized\n')
+
+
+def failing_job(application):
+    raise ValueError('job failed')
+
+
+def fake_memory(application):
+    return application.com_object.memory
@@ -5,6 +5,7 @@ from pycatia.enumeration.enumeration_types import cat_drawing_standard
 from pycatia.enumeration.enumeration_types import cat_paper_orientation
 from pycatia.enumeration.enumeration_types import cat_sheet_projection_method
 from pycatia.enumeration.enumeration_types import cat_paper_size
+from pycatia.enumeration.enumeration_types import cat_table_position
 from tests.source_files import cat_drawing
 
 
@@ -90,3 +91,30 @@ def test_projection_method():
         sheet_1 = sheets.item(1)
 
         assert sheet_1.projection_method == cat_sheet_projection_method.index('catFirstAngle')
+
+
+def test_table_values():
+    with CATIADocHandler(cat_drawing) as caa:
+        root = caa.catia.active_document.drawing_root
+        view = root.active_sheet.views.active_view
+        table = view.tables.add(20, 200, 1, 2, 10, 30)
+        compute_mode = table.compute_mode
+
+        rows = [['ITEM', 'PART NUMBER', 'QTY'], ['1', 'Part1', '2'], ['2', 'Part2']]
+        centre = cat_table_position.index('CatTableMiddleCenter')
+        table.set_values(rows, alignment=centre, column_sizes={2: 60})
+
+        assert table.number_of_rows == 3
+        assert table.number_of_columns == 3
+        assert table.compute_mode == compute_mode
+        assert table.get_values() == [['ITEM', 'PART NUMBER', 'QTY'], ['1', 'Part1', '2'], ['2', 'Part2', '']]
+        assert table.get_values(2, 2, 2, 1) == [['Part1'], ['Part2']]
+        assert table.get_cell_alignment(3, 3) == centre
+        assert table.get_column_size(2) == 60
+
+        table.set_values([[None, 'Part3']], first_row=3)
+        assert table.get_values(first_row=3) == [['2', 'Part3', '']]
+
+        table.format_cells(first_row=1, number_of_rows=1, alignment=cat_table_position.index('CatTableTopLeft'))
+        assert table.get_cell_alignment(1, 1) == cat_table_position.index('CatTableTopLeft')
+        assert table.get_cell_alignment(2, 1) == centre
@@ -0,0 +1,46 @@
+#! /usr/bin/python3.9
+
+from pycatia import CATIADocHandler
+
+
+def test_add_new_spline_from_coords():
+    coordinates = [(0, 0, 0), (10, 4, 0), (20, 5, 0), (30, 3, 0), (40, 0, 0)]
+
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+        hsf = part.hybrid_shape_factory
+
+        hybrid_bodies = part.hybrid_bodies
+        gs_new = hybrid_bodies.add()
+
+        spline = hsf.add_new_spline_from_coords(coordinates, gs_new, tangents=[(1, 1, 0), None, None, None, (1, -1, 0)],
+                                                update=part)
+
+        assert spline.get_nb_control_point() == len(coordinates)
+        assert gs_new.hybrid_shapes.count == len(coordinates) + 1
+
+        spa_wb = document.spa_workbench()
+        measurable = spa_wb.get_measurable(part.create_reference_from_object(spline))
+        assert measurable.length > 40
+
+
+def test_add_new_polyline_from_coords():
+    coordinates = [(0, 0, 0), (100, 0, 0), (100, 50, 0)]
+
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+        hsf = part.hybrid_shape_factory
+
+        hybrid_bodies = part.hybrid_bodies
+        gs_new = hybrid_bodies.add()
+
+        polyline = hsf.add_new_polyline_from_coords(coordinates, gs_new, datum_part=part, update=part)
+
+        assert polyline.number_of_elements == len(coordinates)
+        assert gs_new.hybrid_shapes.count == len(coordinates) + 1
+
+        spa_wb = document.spa_workbench()
+        measurable = spa_wb.get_measurable(part.create_reference_from_object(polyline))
+        assert round(measurable.length, 6) == 150
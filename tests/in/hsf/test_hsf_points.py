@@ -1,6 +1,9 @@
 #! /usr/bin/python3.6
 
 from pycatia import CATIADocHandler
+from pycatia.scripts.csv_tools import create_points
+from pycatia.scripts.csv_tools import csv_reader
+from tests.source_files import point_csv_small
 
 
 def test_point_between():
@@ -234,3 +237,38 @@ def test_point_on_surface_reference():
 def test_point_tangent():
     # todo: write this test.
     pass
+
+
+def test_add_new_points_coord():
+    coordinates = [(x * 10.0, y * 10.0, 5.0) for x in range(5) for y in range(3)]
+    names = [f'grid.{i}' for i in range(len(coordinates))]
+
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+        hsf = part.hybrid_shape_factory
+
+        hybrid_bodies = part.hybrid_bodies
+        gs_new = hybrid_bodies.add()
+
+        points = hsf.add_new_points_coord(iter(coordinates), gs_new, names=names, chunk_size=4, update=part)
+
+        assert len(points) == len(coordinates)
+        assert gs_new.hybrid_shapes.count == len(coordinates)
+        assert points[7].name == 'grid.7'
+        assert points[7].get_coordinates() == coordinates[7]
+
+
+def test_create_points():
+    rows = list(csv_reader(str(point_csv_small), 'mm'))
+
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+
+        count = create_points(part, str(point_csv_small), geometry_set_name='csv_points', chunk_size=30)
+
+        gs_points = part.hybrid_bodies.item('csv_points')
+        assert count == len(rows)
+        assert gs_points.hybrid_shapes.count == len(rows)
+        assert gs_points.hybrid_shapes.item(len(rows)).name == rows[-1]['name']
@@ -195,3 +195,46 @@ def test_remove():
         gone = any(bool_name in x.name for x in all_params())
 
         assert gone is False
+
+
+def test_name_index():
+    with CATIADocHandler(new_document='Part') as caa:
+        part = caa.document.part
+        parameters = part.parameters
+
+        parameters.create_boolean('indexed_boolean', True)
+        name_index = parameters.build_name_index()
+        bool_name = rf'{part.name}\indexed_boolean'
+
+        assert bool_name in name_index
+        assert bool_name in parameters
+        assert parameters.get_item_by_name(bool_name).name == bool_name
+
+        # the index is refreshed after adding a parameter.
+        parameters.create_integer('indexed_integer', 1)
+        int_name = rf'{part.name}\indexed_integer'
+
+        assert int_name in parameters
+        assert parameters[int_name].name == int_name
+
+
+def test_read_all_write_many():
+    with CATIADocHandler(new_document='Part') as caa:
+        part = caa.document.part
+        parameters = part.parameters
+
+        parameters.create_real('bulk_real', 1.5)
+        parameters.create_integer('bulk_integer', 1)
+        parameters.create_string('bulk_string', 'a')
+        real_name = rf'{part.name}\bulk_real'
+        integer_name = rf'{part.name}\bulk_integer'
+        string_name = rf'{part.name}\bulk_string'
+
+        parameters.write_many({real_name: 2.5, integer_name: 3, string_name: 'b'}, update=part)
+        readings = parameters.read_all()
+
+        assert len(readings) == parameters.count
+        assert readings[real_name]['value'] == 2.5
+        assert readings[integer_name]['value'] == 3
+        assert readings[string_name]['value_as_string'] == 'b'
+        assert readings[string_name]['value'] is None
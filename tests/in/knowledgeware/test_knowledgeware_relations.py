@@ -50,6 +50,37 @@ def test_relations_create_design_table():
         assert design_table.name == 'new-design-table'
 
 
+def test_design_table_to_rows():
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+        relations = part.relations
+
+        design_table = relations.create_design_table('new-design-table', 'this is a comment', True, design_table_1)
+
+        assert design_table.column_names() == ['design', 'd(mm)', 'a(mm)', 'b(mm)']
+        assert design_table.to_rows() == [
+            [design_table.cell_as_string(row, column) for column in range(1, 5)] for row in range(2, 5)
+        ]
+        assert design_table.to_rows(numeric=True) == [
+            [110.0, 1.0, 5.0, 10.0],
+            [120.0, 2.0, 6.0, 11.0],
+            [130.0, 3.0, 7.0, 12.0],
+        ]
+        assert design_table.to_rows(configurations=[3, 1], columns=[2]) == [['3'], ['1']]
+        assert design_table.to_columns(columns=[1, 4], numeric=True) == {
+            'design': [110.0, 120.0, 130.0],
+            'b(mm)': [10.0, 11.0, 12.0],
+        }
+
+        configuration = design_table.find_configuration({'design': 120})
+        assert configuration == 2
+        assert design_table.find_configuration({'design': 999}) is None
+
+        design_table.apply_configuration(configuration, update=part)
+        assert design_table.configuration == 2
+
+
 def test_relations_create_formula():
     with CATIADocHandler(new_document='Part') as caa:
         name = "new-formula"
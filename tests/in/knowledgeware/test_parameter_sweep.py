@@ -0,0 +1,33 @@
+#! /usr/bin/python3.9
+
+from pycatia.scripts.parameter_sweep import ParameterSweep
+from pycatia.scripts.parameter_sweep import grid
+from tests.common_vars import caa
+from tests.source_files import cat_part_measurable
+
+pad_length = r'cat_part_measurable\PartBody\Pad.1\FirstLimit\Length'
+
+
+def test_grid():
+    variants = grid({'a': [1, 2], 'b': ['x', 'y', 'z']})
+
+    assert len(variants) == 6
+    assert variants[0] == {'a': 1, 'b': 'x'}
+
+
+def test_parameter_sweep(tmp_path):
+    results_file = tmp_path / 'results.jsonl'
+    variants = grid({pad_length: ['20mm', '40mm']})
+    sweep = ParameterSweep(cat_part_measurable, variants, results_file, outputs=['volume'])
+
+    assert sweep.run() == 2
+    rows = sorted(sweep.results(), key=lambda row: row['id'])
+    assert [row['error'] for row in rows] == [None, None]
+    assert rows[1]['outputs']['volume'] > rows[0]['outputs']['volume']
+
+    # the document opened by the sweep has been closed.
+    assert 'cat_part_measurable.CATPart' not in [document.name for document in caa.documents]
+
+    # all the variants are in the results file so nothing is evaluated again.
+    assert sweep.pending() == []
+    assert sweep.run() == 0
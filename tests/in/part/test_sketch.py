@@ -0,0 +1,47 @@
+#! /usr/bin/python3.9
+
+from pycatia import CATIADocHandler
+
+
+def test_factory_2d_bulk_creation():
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+        hybrid_body = part.hybrid_bodies.add()
+        sketch = hybrid_body.hybrid_sketches.add(part.origin_elements.plane_xy)
+        elements = sketch.geometric_elements.count
+
+        with sketch.edition() as factory_2d:
+            points = factory_2d.create_points([(200, 0), (200, 10)])
+            lines = factory_2d.create_lines([(200, 20, 300, 20), (200, 30, 300, 30), (200, 40, 300, 40)])
+            circles = factory_2d.create_circles([(25, 25), (75, 25)], [5, 5])
+            profile = factory_2d.create_polyline([(0, 0), (100, 0), (100, 50), (0, 50)], closed=True)
+
+        assert len(points) == 2
+        assert len(lines) == 3
+        assert len(circles) == 2
+        assert len(profile) == 4
+        assert round(circles[1].radius, 6) == 5
+        assert profile[0].end_point.name == profile[1].start_point.name
+        assert profile[3].end_point.name == profile[0].start_point.name
+        assert sketch.geometric_elements.count == elements + 2 + 3 + 2 + 4 + 4
+
+
+def test_polyline_profile_pad():
+    with CATIADocHandler(new_document='Part') as caa:
+        document = caa.document
+        part = document.part
+        hybrid_body = part.hybrid_bodies.add()
+        sketch = hybrid_body.hybrid_sketches.add(part.origin_elements.plane_xy)
+
+        with sketch.edition() as factory_2d:
+            factory_2d.create_polyline([(0, 0), (100, 0), (100, 50), (0, 50)], closed=True)
+
+        part.in_work_object = part.main_body
+        pad = part.shape_factory.add_new_pad(sketch, 10)
+        part.update()
+
+        spa_wb = document.spa_workbench()
+        measurable = spa_wb.get_measurable(part.create_reference_from_object(part.main_body))
+        assert round(measurable.volume, 9) == round(100 * 50 * 10 / 1e9, 9)
+        assert pad is not None
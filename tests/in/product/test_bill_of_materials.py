@@ -0,0 +1,35 @@
+#! /usr/bin/python3.9
+
+import csv
+import io
+from collections import Counter
+
+from pycatia import CATIADocHandler
+from pycatia.product_structure_interfaces.bill_of_materials import BillOfMaterials
+from tests.source_files import cat_product
+
+
+def test_flattened():
+    with CATIADocHandler(cat_product) as caa:
+        product = caa.document.product
+        bom = BillOfMaterials.from_product(product)
+        quantities = {row['part_number']: row['quantity'] for row in bom.flattened()}
+
+        assert sum(quantities.values()) == len(bom.snapshot) - 1
+        level_1 = Counter(child.part_number for child in product.products)
+        for part_number, quantity in level_1.items():
+            assert quantities[part_number] >= quantity
+
+
+def test_indented_csv():
+    with CATIADocHandler(cat_product) as caa:
+        product = caa.document.product
+        bom = BillOfMaterials.from_product(product)
+        file = io.StringIO(newline='')
+        count = bom.write_csv(file, indented=True)
+        file.seek(0)
+        rows = list(csv.DictReader(file))
+
+        assert count == len(rows)
+        level_1 = Counter(child.part_number for child in product.products)
+        assert {row['part_number']: int(row['quantity']) for row in rows if row['level'] == '1'} == level_1
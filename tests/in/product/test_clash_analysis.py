@@ -0,0 +1,67 @@
+#! /usr/bin/python3.9
+
+import io
+
+import pytest
+
+from pycatia import CATIADocHandler
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.scripts.clash_analysis import ClashAnalysis
+from pycatia.scripts.clash_analysis import parse_clash_xml
+from tests.source_files import cat_product
+
+clash_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ClashResults>
+    <Products>
+        <Product Id="1" Name="Part1.1"/>
+        <Product Id="2" Name="Part2.1"/>
+    </Products>
+    <ClashResult Name="Interference.1">
+        <Conflict Type="Clash" Value="-2.5" Status="Not inspected">
+            <ProductRef Ref="2"/>
+            <ProductRef Ref="1"/>
+        </Conflict>
+        <Conflict Type="Contact" Value="0">
+            <Product Name="Part3.1"/>
+            <Product Name="Part1.1"/>
+        </Conflict>
+    </ClashResult>
+</ClashResults>
+"""
+
+
+def test_parse_clash_xml():
+    conflicts = parse_clash_xml(io.BytesIO(clash_xml))
+
+    assert len(conflicts) == 2
+    assert conflicts[0] == ('Part1.1', 'Part2.1', 'Clash', -2.5)
+    assert list(conflicts.filter(conflict_type='Contact')) == [('Part1.1', 'Part3.1', 'Contact', 0.0)]
+    assert conflicts.pairs() == {('Part1.1', 'Part2.1'), ('Part1.1', 'Part3.1')}
+
+
+def test_clash_analysis_needs_product(tmp_path):
+    part = tmp_path / 'part.CATPart'
+    part.write_bytes(b'')
+
+    with pytest.raises(CATIAApplicationException):
+        ClashAnalysis(str(part), [['Part1.1']], str(tmp_path))
+
+
+def test_clash_analysis(tmp_path):
+    with CATIADocHandler(cat_product) as caa:
+        product = caa.document.product
+        analysis = ClashAnalysis.from_product(product, str(tmp_path), subset_size=2)
+        jobs = analysis.jobs()
+
+        computed = []
+        conflicts = analysis.run(on_result=computed.append)
+
+        assert len(computed) == len(jobs)
+        assert all(row['error'] is None for row in computed)
+        assert len(conflicts) == sum(row['conflicts'] for row in computed)
+
+        # nothing changed so every job is skipped.
+        assert analysis.pending() == []
+        computed = []
+        assert len(analysis.run(on_result=computed.append)) == len(conflicts)
+        assert computed == []
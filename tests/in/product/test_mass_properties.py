@@ -0,0 +1,43 @@
+#! /usr/bin/python3.9
+
+from pycatia import CATIADocHandler
+from pycatia.enumeration.enumeration_types import cat_work_mode_type
+from pycatia.product_structure_interfaces.mass_properties import MassProperties
+from pycatia.product_structure_interfaces.mass_properties import MassRollup
+from tests.source_files import cat_product
+
+
+def test_mass_properties_transformed():
+    properties = MassProperties(2.0, (10, 0, 0), (1, 0, 0, 0, 2, 0, 0, 0, 3))
+    # rotated 90 degrees about z and moved 100 along x.
+    moved = properties.transformed((0, 1, 0, -1, 0, 0, 0, 0, 1, 100, 0, 0))
+
+    assert moved.gravity_center == (100.0, 10.0, 0.0)
+    assert moved.inertia == (2.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 3.0)
+
+    total = MassProperties.combine([properties, moved])
+    assert total.mass == 4.0
+    assert total.gravity_center == (55.0, 5.0, 0.0)
+
+
+def test_mass_rollup():
+    with CATIADocHandler(cat_product) as caa:
+        product = caa.document.product
+        product.apply_work_mode(cat_work_mode_type.index("DESIGN_MODE"))
+        rollup = MassRollup.from_product(product)
+
+        analyze = product.analyze
+        assert round(rollup.mass, 6) == round(analyze.mass, 6)
+        for rolled_up, analyzed in zip(rollup.gravity_center, analyze.get_gravity_center()):
+            assert round(rolled_up, 3) == round(analyzed, 3)
+        for rolled_up, analyzed in zip(rollup.inertia, analyze.get_inertia()):
+            assert round(rolled_up, 6) == round(analyzed, 6)
+
+        totals = rollup.totals()
+        rollup.refresh(part_numbers=[rollup.snapshot.part_numbers[rollup.leaves[0]]])
+        assert round(rollup.mass, 9) == round(totals.mass, 9)
+
+        leaf = rollup.leaves[0]
+        leaf_mass = rollup.totals(leaf).mass
+        rollup.update({leaf: MassProperties(0, (0, 0, 0), (0,) * 9)})
+        assert round(rollup.mass, 9) == round(totals.mass - leaf_mass, 9)
@@ -6,6 +6,7 @@ from pathlib import Path
 from pycatia import CATIADocHandler
 from pycatia.enumeration.enumeration_types import cat_work_mode_type
 from pycatia.product_structure_interfaces.product import Product
+from pycatia.product_structure_interfaces.product_identity import product_identity_cache
 from tests.source_files import cat_product
 from tests.source_files import cat_part_measurable
 
@@ -119,6 +120,52 @@ def test_get_child():
         assert child.part_number == 'cat_product_sub_1'
 
 
+def test_products_fetch():
+    with CATIADocHandler(cat_product) as caa:
+        products = caa.document.product.products
+        columns = products.fetch(['Name', 'PartNumber'])
+
+        assert columns['Name'] == [child.name for child in products]
+        assert columns['PartNumber'] == [child.part_number for child in products]
+        assert columns['Name'] == products.get_item_names()
+
+
+def test_snapshot():
+    with CATIADocHandler(cat_product) as caa:
+        product = caa.document.product
+        snapshot = product.snapshot()
+
+        assert snapshot.root.part_number == product.part_number
+        assert snapshot.root.document_type == 'CATProduct'
+        assert [node.name for node in snapshot.root.children] == product.products.get_item_names()
+        assert len(snapshot.positions) == 12 * len(snapshot)
+        for node in snapshot.root.children:
+            assert node.depth == 1
+            assert node.parent == snapshot.root
+
+
+def test_identity_cache():
+    with CATIADocHandler(cat_product) as caa:
+        product = caa.document.product
+        children = list(product.products)
+        expected = [(child.type, child.file_name, child.full_name) for child in children]
+
+        with product_identity_cache:
+            assert [(child.type, child.file_name, child.full_name) for child in children] == expected
+
+            # a product fetched again has a new dispatch object but the same identity.
+            products = product.products
+            first = products.item(1)
+            second = products.item(1)
+            assert first.com_object is not second.com_object
+            first_file_name = first.file_name
+            hits = product_identity_cache.hits
+            assert second.file_name == first_file_name
+            assert product_identity_cache.hits == hits + 1
+
+        assert product_identity_cache.enabled is False
+
+
 def test_get_products():
     with CATIADocHandler(cat_product) as caa:
         product = caa.document.product
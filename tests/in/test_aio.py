@@ -0,0 +1,67 @@
+#! /usr/bin/python3.9
+
+import asyncio
+import contextlib
+import threading
+import time
+
+import pytest
+
+from pycatia.base_interfaces.aio import AsyncProxy
+from pycatia.base_interfaces.aio import AsyncSession
+from tests.helper_functions import FakeBackend
+
+
+def test_async_session():
+    async def main():
+        async with AsyncSession(FakeBackend(), apartment=contextlib.nullcontext) as session:
+            application = session.application
+            caption = await application.caption
+            await application.set_property('caption', 'batch')
+            thread_id = await session.run(threading.get_ident)
+            return application, caption, await application.caption, thread_id
+
+    application, caption, new_caption, thread_id = asyncio.run(main())
+
+    assert isinstance(application, AsyncProxy)
+    assert caption == 'CATIA V5'
+    assert new_caption == 'batch'
+    assert thread_id != threading.get_ident()
+
+
+def test_async_session_cancel():
+    calls = []
+
+    async def main():
+        async with AsyncSession(FakeBackend(), apartment=contextlib.nullcontext) as session:
+            running = asyncio.ensure_future(session.run(time.sleep, 0.2))
+            queued = asyncio.ensure_future(session.run(calls.append, 1))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            await running
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await session.run(calls.append, 2)
+
+    asyncio.run(main())
+
+    # the cancelled call never ran.
+    assert calls == [2]
+
+
+def test_async_session_apartment_fails():
+    def apartment():
+        raise ImportError('No module named pythoncom')
+
+    async def main():
+        session = AsyncSession(FakeBackend(), apartment=apartment)
+        with pytest.raises(ImportError):
+            await asyncio.wait_for(session.start(), 5)
+        assert session.application is None
+
+        # the session can be started again.
+        session.apartment = contextlib.nullcontext
+        async with session:
+            return await session.application.caption
+
+    assert asyncio.run(main()) == 'CATIA V5'
@@ -1,5 +1,12 @@
 #! /usr/bin/python3.6
 
+import subprocess
+import sys
+
+from pycatia import catia
+from pycatia.base_interfaces.context import BatchSession
+from pycatia.base_interfaces.com_backend import RecordingBackend
+from pycatia.base_interfaces.com_backend import ReplayBackend
 from tests.source_files import cat_part_measurable
 from tests.common_vars import caa
 
@@ -34,3 +41,43 @@ def test_visible():
     assert caa.visible is True
 
     document.close()
+
+
+def test_batch_session():
+    refresh_display = caa.refresh_display
+
+    with BatchSession(caa) as session:
+        assert caa.refresh_display is False
+        for document in session.documents([cat_part_measurable, 'missing.CATPart']):
+            assert document.name == 'part_measurable.CATPart'
+
+    assert caa.refresh_display == refresh_display
+    assert [timing.error is None for timing in session.timings] == [True, False]
+    assert session.timings[0].open > 0
+
+
+def test_record_replay(tmp_path):
+    recording = tmp_path / 'session.json'
+
+    with RecordingBackend(recording) as backend:
+        recorded_caa = catia(backend)
+        recorded_caa.documents.open(cat_part_measurable)
+        document = recorded_caa.active_document
+        recorded_names = document.part.bodies.get_item_names()
+        document.close()
+
+    replayed_caa = catia(ReplayBackend(recording))
+    replayed_caa.documents.open(cat_part_measurable)
+    document = replayed_caa.active_document
+    replayed_names = document.part.bodies.get_item_names()
+    document.close()
+
+    assert replayed_names == recorded_names
+
+
+def test_import_is_lazy():
+    # the interface modules are only imported when first used.
+    code = 'import sys; from pycatia import catia; print("pycatia.in_interfaces.document" in sys.modules)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+    assert output.stdout.strip() == 'False'
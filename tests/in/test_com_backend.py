@@ -0,0 +1,79 @@
+#! /usr/bin/python3.9
+
+import json
+
+import pytest
+
+from pycatia import catia
+from pycatia.base_interfaces.com_backend import ReplayBackend
+from pycatia.base_interfaces.com_backend import ReplayDispatch
+from pycatia.base_interfaces.com_backend import com_error
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.exception_handling.exceptions import COMReplayException
+
+recording = {
+    'version': 1,
+    'events': [
+        {'op': 'dispatch', 'name': 'CATIA.Application', 'result': {'$ref': 0}},
+        {'op': 'get', 'obj': 0, 'name': 'Caption', 'result': 'CATIA V5'},
+        {'op': 'get', 'obj': 0, 'name': 'Documents', 'result': {'$ref': 1}},
+        {'op': 'call', 'obj': 1, 'name': 'Open', 'args': {'$list': ['missing.CATPart']},
+         'error': [-2147352567, 'Exception occurred.', None, None]},
+        {'op': 'get', 'obj': 1, 'name': 'Count', 'result': 0},
+    ]
+}
+
+
+@pytest.fixture
+def replay(tmp_path):
+    file_name = tmp_path / 'session.json'
+    with open(file_name, 'w') as file:
+        json.dump(recording, file)
+
+    return ReplayBackend(file_name)
+
+
+def test_replay(replay):
+    application = replay.dispatch('CATIA.Application')
+    assert isinstance(application, ReplayDispatch)
+    assert application.Caption == 'CATIA V5'
+
+    documents = application.Documents
+    with pytest.raises(com_error) as e:
+        documents.Open('missing.CATPart')
+    assert e.value.args[0] == -2147352567
+
+    assert documents.Count == 0
+    assert replay.finished
+
+
+def test_replay_diverged(replay):
+    application = replay.dispatch('CATIA.Application')
+
+    with pytest.raises(COMReplayException):
+        application.Name
+
+
+def test_replay_application(tmp_path):
+    file_name = tmp_path / 'part.CATPart'
+    file_name.write_text('')
+    file_name = str(file_name.resolve())
+    events = [
+        {'op': 'dispatch', 'name': 'CATIA.Application', 'result': {'$ref': 0}},
+        {'op': 'get', 'obj': 0, 'name': 'Documents', 'result': {'$ref': 1}},
+        {'op': 'get', 'obj': 1, 'name': 'Count', 'result': 2},
+        {'op': 'call', 'obj': 1, 'name': 'Open', 'args': {'$list': [file_name]},
+         'error': [-2147352567, 'Exception occurred.', None, None]},
+    ]
+    recording = tmp_path / 'session.json'
+    with open(recording, 'w') as file:
+        json.dump({'version': 1, 'events': events}, file)
+
+    backend = ReplayBackend(recording)
+    caa = catia(backend)
+    documents = caa.documents
+    assert documents.count == 2
+    # the replayed com_error is handled by the pycatia wrapper.
+    with pytest.raises(CATIAApplicationException):
+        documents.open(file_name)
+    assert backend.finished
@@ -0,0 +1,112 @@
+#! /usr/bin/python3.9
+
+import json
+
+import pytest
+
+from pycatia.base_interfaces import com_profiler
+from pycatia.base_interfaces.com_profiler import COMProfiler
+from pycatia.system_interfaces.collection import Collection
+
+
+class FakeClock:
+    """
+    Replaces the time module of the profiler. Each round trip to a FakeDispatch takes step seconds.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.step = 0.001
+
+    def perf_counter(self):
+        return self.now
+
+    def tick(self):
+        self.now += self.step
+
+
+class FakeDispatch:
+    # marks this as a dispatch object so it is proxied by the COMProfiler.
+    _oleobj_ = None
+
+    def __init__(self, clock, name='', items=()):
+        self._clock = clock
+        self._name = name
+        self._items = [FakeDispatch(clock, item) for item in items]
+
+    @property
+    def Name(self):
+        self._clock.tick()
+        return self._name
+
+    @property
+    def Count(self):
+        self._clock.tick()
+        return len(self._items)
+
+    def Item(self, index):
+        self._clock.tick()
+        return self._items[index - 1]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(com_profiler, 'time', clock)
+
+    return clock
+
+
+def test_profiler_attribution(clock):
+    dispatch = FakeDispatch(clock, items=['a', 'b', 'c'])
+    collection = Collection(dispatch)
+
+    with COMProfiler(collection) as profiler:
+        assert collection.get_item_by_name('b').com_object._com_object is dispatch._items[1]
+        assert collection.get_item_by_name('c') is not None
+        # not made by pycatia.
+        assert collection.com_object.Count == 3
+
+    assert collection.com_object is dispatch
+
+    results = profiler.results()
+    assert list(results) == ['Collection.get_item_by_name', '<user>']
+
+    by_name = results['Collection.get_item_by_name']
+    assert by_name['calls'] == 2
+    assert by_name['com_calls'] == 14
+    assert by_name['com_calls_per_call'] == 7
+    assert by_name['members'] == {'Item()': 7, 'Name': 5, 'Count': 2}
+
+    assert results['<user>']['calls'] == 1
+    assert results['<user>']['members'] == {'Count': 1}
+    assert profiler.com_calls == 15
+
+    # round trips after exit aren't recorded.
+    collection.com_object.Count
+    assert profiler.com_calls == 15
+
+
+def test_profiler_percentiles(clock, tmp_path):
+    collection = Collection(FakeDispatch(clock))
+
+    with COMProfiler(collection) as profiler:
+        for i in range(100, 0, -1):
+            clock.step = i / 1000
+            collection.count
+
+    result = profiler.results()['Collection.count']
+    assert result['calls'] == 100
+    assert result['p50'] == pytest.approx(0.050)
+    assert result['p99'] == pytest.approx(0.099)
+    assert result['cumulative'] == pytest.approx(5.050)
+
+    profile = tmp_path / 'profile.json'
+    profiler.dump(profile)
+    with open(profile) as file:
+        dumped = json.load(file)
+
+    assert dumped['com_calls'] == 100
+    assert dumped['elapsed'] == pytest.approx(5.050)
+    assert dumped['methods']['Collection.count']['members'] == {'Count': 100}
+    assert dumped['methods']['Collection.count']['p99'] == pytest.approx(0.099)
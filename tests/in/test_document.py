@@ -6,6 +6,7 @@ import os
 import pytest
 
 from pycatia.base_interfaces.context import CATIADocHandler
+from pycatia.exception_handling.exceptions import CATIAApplicationException
 from tests.common_vars import caa
 from tests.source_files import cat_part_measurable
 from tests.source_files import cat_product
@@ -201,3 +202,23 @@ def test_saving():
             document.save_as(new_filename)
 
     os.remove(new_filename)
+
+
+def test_search_fetch():
+    with CATIADocHandler(cat_part_measurable) as handler:
+        selection = handler.document.selection
+        found = selection.search_fetch("'Generative Shape Design'.Point,all")
+
+        # the same search read one element at a time.
+        selection.search("'Generative Shape Design'.Point,all")
+        elements = [selection.item2(i + 1) for i in range(selection.count2)]
+        assert len(elements) >= 4
+        assert found['type'] == [element.type for element in elements]
+        assert found['name'] == [element.value.name for element in elements]
+        assert found['display_name'] == [element.reference.display_name for element in elements]
+
+        found = selection.search_fetch("'Generative Shape Design'.Point,all", attrs=['type'])
+        assert list(found) == ['type']
+
+        with pytest.raises(CATIAApplicationException):
+            selection.search_fetch("'Generative Shape Design'.Point,all", attrs=['colour'])
@@ -0,0 +1,27 @@
+#! /usr/bin/python3.9
+
+import pickle
+
+import pytest
+
+from pycatia.enumeration.enumeration_types import cat_work_mode_type
+from pycatia.enumeration.enums import CatWorkModeType
+
+
+def test_enumeration_tuple_api():
+    assert isinstance(cat_work_mode_type, tuple)
+    assert cat_work_mode_type.index('DESIGN_MODE') == 2
+    assert cat_work_mode_type[2] == 'DESIGN_MODE'
+    assert 'DESIGN_MODE' in cat_work_mode_type
+    assert cat_work_mode_type == ('DEFAULT_MODE', 'VISUALIZATION_MODE', 'DESIGN_MODE')
+    assert pickle.loads(pickle.dumps(cat_work_mode_type)).index('DESIGN_MODE') == 2
+
+    with pytest.raises(ValueError):
+        cat_work_mode_type.index('UNKNOWN_MODE')
+
+
+def test_enumeration_int_enum():
+    assert CatWorkModeType is cat_work_mode_type.enum
+    assert CatWorkModeType.DESIGN_MODE == 2
+    assert CatWorkModeType(2).name == 'DESIGN_MODE'
+    assert pickle.loads(pickle.dumps(CatWorkModeType.DESIGN_MODE)) is CatWorkModeType.DESIGN_MODE
@@ -7,6 +7,7 @@
 
 from pycatia import CATIADocHandler
 from pycatia.enumeration.enumeration_types import cat_measurable_name
+from pycatia.space_analyses_interfaces.measurable import Measurable
 from tests.source_files import cat_part_measurable
 from tests.create_source_parts import geom_set_lines
 from tests.create_source_parts import geom_set_surfaces
@@ -331,6 +332,26 @@ def test_get_point():
         assert point == catia_point
 
 
+def test_get_point_many():
+    with CATIADocHandler(cat_part_measurable) as caa:
+        document = caa.document
+        spa_workbench = document.spa_workbench()
+
+        part = document.part
+        hybrid_bodies = part.hybrid_bodies
+        hybrid_body = hybrid_bodies.get_item_by_name(geom_set_points)
+        measurables = []
+        for point in hybrid_body.hybrid_shapes:
+            reference = part.create_reference_from_object(point)
+            measurables.append(spa_workbench.get_measurable(reference))
+
+        catia_points = Measurable.get_point_many(measurables)
+
+        assert len(catia_points) == len(measurables)
+        for measurable, catia_point in zip(measurables, catia_points):
+            assert round_tuple(measurable.get_point(), 6) == round_tuple(catia_point, 6)
+
+
 def test_get_points_on_axis():
     with CATIADocHandler(cat_part_measurable) as caa:
         document = caa.document
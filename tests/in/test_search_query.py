@@ -0,0 +1,59 @@
+#! /usr/bin/python3.9
+
+import pytest
+
+from pycatia.base_interfaces.context import CATIADocHandler
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.in_interfaces.search_query import SearchQuery
+from pycatia.in_interfaces.search_query import search
+from pycatia.in_interfaces.search_query import search_cache
+from tests.source_files import cat_part_measurable
+
+points = SearchQuery('Generative Shape Design', 'Point')
+lines = SearchQuery('Generative Shape Design', 'Line')
+
+
+def test_compile():
+    assert points.compile() == "'Generative Shape Design'.Point,all"
+    assert SearchQuery(name='Pad*').compile('in') == 'Name=Pad*,in'
+    assert points.where(color='Light Red').compile('sel') == \
+        "'Generative Shape Design'.Point & Color='Light Red',sel"
+    assert (points | lines).compile() == "'Generative Shape Design'.Point + 'Generative Shape Design'.Line,all"
+    assert ((points | lines) - SearchQuery(name='Point.1')).compile() == \
+        "('Generative Shape Design'.Point + 'Generative Shape Design'.Line) - Name=Point.1,all"
+
+    with pytest.raises(CATIAApplicationException):
+        points.compile('everything')
+    with pytest.raises(CATIAApplicationException):
+        SearchQuery(object_type='Point')
+
+
+def test_search_cache():
+    with CATIADocHandler(cat_part_measurable) as handler:
+        document = handler.document
+        with search_cache:
+            found = search(document, points, attrs=['name'])
+            hits = search_cache.hits
+            assert search(document, points, attrs=['name']) == found
+            assert search_cache.hits == hits + 1
+
+            document.part.update()
+            assert len(search_cache) == 0
+
+        assert found['name'] == [point.name for point in document.search_for_items(['Point'])]
+
+
+def test_search_cache_cleared_by_factory():
+    with CATIADocHandler(new_document='Part') as handler:
+        document = handler.document
+        part = document.part
+        hsf = part.hybrid_shape_factory
+        hybrid_body = part.hybrid_bodies.add()
+        with search_cache:
+            assert search(document, points, attrs=['name']) == {'name': []}
+
+            point = hsf.add_new_point_coord(0, 0, 0)
+            hybrid_body.append_hybrid_shape(point)
+            assert len(search_cache) == 0
+
+            assert search(document, points, attrs=['name']) == {'name': [point.name]}
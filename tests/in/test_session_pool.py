@@ -0,0 +1,59 @@
+#! /usr/bin/python3.9
+
+from pycatia.base_interfaces.session_pool import SessionPool
+from tests.helper_functions import FakeBackend
+from tests.helper_functions import caption_job
+from tests.helper_functions import failing_job
+from tests.helper_functions import fake_memory
+from tests.helper_functions import log_finalizer
+from tests.helper_functions import set_caption
+
+
+def test_session_pool_map():
+    with SessionPool(workers=2, backend=FakeBackend()) as pool:
+        results = sorted(pool.map(caption_job, ['a', 'b', 'c', 'd']), key=lambda result: result.job_id)
+
+    assert [result.result() for result in results] == ['CATIA V5a', 'CATIA V5b', 'CATIA V5c', 'CATIA V5d']
+    assert len({result.pid for result in results}) <= 2
+
+
+def test_session_pool_errors():
+    with SessionPool(workers=2, backend=FakeBackend()) as pool:
+        failed = pool.submit(failing_job)
+        succeeded = pool.submit(caption_job, '!')
+        results = {result.job_id: result for result in pool.results()}
+
+    assert results[failed].error == 'ValueError: job failed'
+    assert isinstance(results[failed].exception, ValueError)
+    assert results[succeeded].error is None
+
+
+def test_session_pool_recycle():
+    with SessionPool(workers=1, backend=FakeBackend(), jobs_per_session=2) as pool:
+        results = list(pool.map(caption_job, 'abcde'))
+
+    assert [result.session for result in results] == [1, 1, 2, 2, 3]
+    assert pool.sessions_started == 3
+
+    # each job grows the memory of the fake session by 100.
+    with SessionPool(workers=1, backend=FakeBackend(), max_memory_growth=250, memory=fake_memory) as pool:
+        results = list(pool.map(caption_job, 'abcde'))
+
+    assert [result.session for result in results] == [1, 1, 1, 2, 2]
+
+
+def test_session_pool_initializer():
+    with SessionPool(workers=2, backend=FakeBackend(), initializer=set_caption, initargs=('CATIA V6',)) as pool:
+        results = list(pool.map(caption_job, 'ab'))
+
+    assert sorted(result.result() for result in results) == ['CATIA V6a', 'CATIA V6b']
+
+
+def test_session_pool_finalizer(tmp_path):
+    log_file = tmp_path / 'log.txt'
+    with SessionPool(workers=1, backend=FakeBackend(log_file), jobs_per_session=2, finalizer=log_finalizer) as pool:
+        results = list(pool.map(caption_job, 'abc'))
+
+    assert [result.error for result in results] == [None, None, None]
+    # one session was recycled and the other ended with the pool.
+    assert log_file.read_text().splitlines() == ['finalized', 'finalized']
@@ -0,0 +1,127 @@
+#! /usr/bin/python3.9
+
+import re
+
+from pycatia.base_interfaces.vba_registry import VBARegistry
+from pycatia.enumeration.enumeration_types import cat_script_language
+from pycatia.enumeration.enumeration_types import cat_script_library_type
+
+get_name = '''
+Function get_name(obj)
+    get_name = obj.Name
+End Function
+'''
+
+get_name_helper = '''
+Function helper(obj)
+    helper = obj.Name
+End Function
+
+Function get_name(obj)
+    get_name = helper(obj) & "!"
+End Function
+'''
+
+
+class FakeSystemService:
+
+    def __init__(self):
+        self.calls = []
+
+    def evaluate(self, code, language, name, parameters):
+        self.calls.append(('evaluate', code, language, name, parameters))
+        return name
+
+    def execute_script(self, directory, library_type, module_name, name, parameters):
+        self.calls.append(('execute_script', directory, library_type, module_name, name, parameters))
+        return name
+
+
+def procedure_names(code):
+    return re.findall(r'^\s*(?:Function|Sub)\s+(\w+)', code, re.IGNORECASE | re.MULTILINE)
+
+
+def test_register_deduplicates():
+    registry = VBARegistry()
+    script = registry.register('get_name', get_name)
+
+    # the same source.
+    assert registry.register('get_name', get_name) is script
+    # the same code, indented differently.
+    indented = '\n'.join(f'        {line}' for line in get_name.splitlines())
+    assert registry.register('get_name', indented) is script
+
+    assert list(registry.scripts) == ['get_name']
+    assert script.code == get_name.strip('\n') + '\n'
+
+
+def test_register_renames():
+    registry = VBARegistry()
+    first = registry.register('get_name', get_name)
+    second = registry.register('get_name', get_name.replace('obj.Name', 'obj.Parent.Name'))
+
+    assert first.name == 'get_name'
+    assert second.name == 'get_name_2'
+    assert procedure_names(second.code) == ['get_name_2']
+    assert 'get_name_2 = obj.Parent.Name' in second.code
+
+    # a helper procedure defined by two scripts is renamed too.
+    third = registry.register('get_name', get_name_helper)
+    fourth = registry.register('get_name', get_name_helper.replace('"!"', '"?"'))
+
+    assert procedure_names(third.code) == ['helper', 'get_name_3']
+    assert procedure_names(fourth.code) == ['helper_2', 'get_name_4']
+    assert 'get_name_4 = helper_2(obj)' in fourth.code
+
+
+def test_write_helper_module(tmp_path):
+    registry = VBARegistry()
+    registry.register('get_name', get_name)
+    registry.register('get_name', get_name_helper)
+    registry.register('get_name', get_name_helper.replace('"!"', '"?"'))
+
+    helper_module = registry.write_helper_module(tmp_path)
+
+    assert helper_module == tmp_path / VBARegistry.helper_module_name
+    names = [name.lower() for name in procedure_names(helper_module.read_text())]
+    assert len(names) == 5
+    assert len(set(names)) == len(names)
+
+
+def test_evaluate(tmp_path):
+    registry = VBARegistry()
+    system_service = FakeSystemService()
+
+    assert registry.evaluate(system_service, get_name, 'get_name', ['a']) == 'get_name'
+    assert system_service.calls[-1] == ('evaluate', registry.scripts['get_name'].code,
+                                        cat_script_language.index('CATVBScriptLanguage'), 'get_name', ['a'])
+
+    registry.use_helper_module(tmp_path)
+    assert registry.evaluate(system_service, get_name_helper, 'get_name', ['b']) == 'get_name_2'
+    assert system_service.calls[-1] == ('execute_script', str(tmp_path),
+                                        cat_script_library_type.index('catScriptLibraryTypeDirectory'),
+                                        VBARegistry.helper_module_name, 'get_name_2', ['b'])
+    # the module was rewritten for the new function.
+    assert 'get_name_2' in (tmp_path / VBARegistry.helper_module_name).read_text()
+
+
+def test_statistics():
+    registry = VBARegistry()
+    system_service = FakeSystemService()
+    registry.register('unused', get_name.replace('get_name', 'unused'))
+    for _ in range(3):
+        registry.evaluate(system_service, get_name, 'get_name', [])
+
+    statistics = registry.statistics()
+    assert list(statistics) == ['get_name']
+    assert statistics['get_name']['calls'] == 3
+    assert statistics['get_name']['mean'] == statistics['get_name']['elapsed'] / 3
+    assert statistics['get_name']['max'] <= statistics['get_name']['elapsed']
+
+    lines = registry.report().splitlines()
+    assert lines[0].split() == ['function', 'calls', 'total', '(s)', 'mean', '(ms)', 'max', '(ms)']
+    assert lines[2].split()[:2] == ['get_name', '3']
+
+    registry.reset_statistics()
+    assert registry.statistics() == {}
+    assert len(registry.report().splitlines()) == 2
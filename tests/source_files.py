@@ -10,6 +10,7 @@ from tests.create_source_material import get_cat_material
 from tests.create_source_functional_system import get_cat_functional_system
 
 design_table_1 = Path(os.getcwd(), r"tests/cat_files/design_table_1.txt")
+point_csv_small = Path(os.getcwd(), r"tests/Sample_Point_CSV_File1_small.csv")
 
 cat_drawing = get_cat_drawing()
 cat_part_measurable = get_cat_part_measurable()